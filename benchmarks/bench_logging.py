@@ -0,0 +1,67 @@
+"""Benchmark of the per-request logging overhead.
+
+Sends requests through ``HttpClient`` against an in-memory transport with SDK logging
+disabled and with debug logging enabled, and reports the time spent per request.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_logging.py
+"""
+
+import io
+import logging
+import timeit
+
+from httpx import MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.digital_card.shared import FaceValue
+from jpy_tillo_sdk.http_client import ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+
+NUMBER = 5_000
+
+BODY = IssueDigitalCodeRequestBody(
+    client_request_id="6a3c9c5e-8f1d-4b0e-9d55-c1f1f2f9b0a1",
+    brand="costa",
+    face_value=FaceValue(amount="10.00", currency="GBP"),
+    delivery_method="code",
+)
+
+
+def handler(request: Request) -> Response:
+    return Response(200, json={"code": "000"})
+
+
+client = HttpClient(
+    {"base_url": "https://api.test.com"},
+    extractor=RequestDataExtractor(create_signer("benchmark-api-key", "benchmark-secret-key")),
+    error_handler=ErrorHandler(),
+    transport=MockTransport(handler),
+)
+
+
+def send() -> None:
+    client.request(IssueDigitalCodeEndpoint(body=BODY))
+
+
+def measure() -> float:
+    return min(timeit.repeat(send, number=NUMBER, repeat=5)) / NUMBER * 1_000_000
+
+
+def main() -> None:
+    tillo_logger = logging.getLogger("tillo")
+    tillo_logger.propagate = False
+
+    tillo_logger.setLevel(logging.WARNING)
+    off = measure()
+
+    tillo_logger.addHandler(logging.StreamHandler(io.StringIO()))
+    tillo_logger.setLevel(logging.DEBUG)
+    on = measure()
+
+    print(f"logging off: {off:8.1f} us/request")
+    print(f"logging on:  {on:8.1f} us/request ({on - off:+.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Micro-benchmark of request body serialization.
+
+Compares ``dataclasses.asdict`` with the cached per-class encoders of
+``SerializerRegistry`` on a fully populated digital issue request body.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_serialization.py
+"""
+
+import timeit
+from dataclasses import asdict
+
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.digital_card.shared import FaceValue
+from jpy_tillo_sdk.serialization import SerializerRegistry
+
+NUMBER = 100_000
+
+BODY = IssueDigitalCodeRequestBody(
+    client_request_id="6a3c9c5e-8f1d-4b0e-9d55-c1f1f2f9b0a1",
+    brand="costa",
+    face_value=FaceValue(amount="10.00", currency="GBP"),
+    delivery_method="code",
+    fulfilment_by="partner",
+    personalisation=IssueDigitalCodeRequestBody.Personalisation(to_name="Jo", message="Happy birthday"),
+)
+
+registry = SerializerRegistry()
+
+
+def serialize_asdict() -> dict[str, object]:
+    return asdict(BODY)
+
+
+def serialize_registry() -> dict[str, object]:
+    return registry.serialize(BODY)
+
+
+def main() -> None:
+    for name, func in (("asdict", serialize_asdict), ("registry", serialize_registry)):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>8}: {NUMBER / seconds:>12,.0f} bodies/sec")
+
+
+if __name__ == "__main__":
+    main()
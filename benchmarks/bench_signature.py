@@ -0,0 +1,54 @@
+"""Micro-benchmark of request signing.
+
+Compares the previous signing path (re-keying the HMAC and concatenating the
+signature string per request) with the pre-keyed ``SignatureGenerator``.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_signature.py
+"""
+
+import hashlib
+import hmac
+import timeit
+
+from jpy_tillo_sdk.signature import SignatureGenerator
+
+API_KEY = "benchmark-api-key"
+SECRET_KEY = "benchmark-secret-key-0123456789"
+ENDPOINT = "digital-issue"
+METHOD = "POST"
+TIMESTAMP = "1700000000000"
+PARAMS = ("6a3c9c5e-8f1d-4b0e-9d55-c1f1f2f9b0a1", "costa", "GBP", "10.00")
+NUMBER = 100_000
+
+
+def sign_legacy() -> str:
+    query = ""
+
+    for v in PARAMS:
+        if v is not None:
+            query += f"-{v}"
+
+    seed = f"{API_KEY}-{METHOD}-{ENDPOINT}{query}-{TIMESTAMP}"
+    signature_hmac = hmac.new(bytearray(SECRET_KEY, "utf-8"), bytearray(seed, "utf-8"), hashlib.sha256)
+    return str(signature_hmac.hexdigest())
+
+
+generator = SignatureGenerator(API_KEY, SECRET_KEY)
+
+
+def sign_current() -> str:
+    seed = generator.generate_signature_string(ENDPOINT, METHOD, TIMESTAMP, PARAMS)
+    return generator.generate_signature(seed)
+
+
+def main() -> None:
+    assert sign_legacy() == sign_current()
+
+    for name, func in (("before", sign_legacy), ("after", sign_current)):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>6}: {NUMBER / seconds:>12,.0f} signatures/sec")
+
+
+if __name__ == "__main__":
+    main()
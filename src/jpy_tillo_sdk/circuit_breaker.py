@@ -0,0 +1,320 @@
+"""Tillo SDK Circuit Breaker Module.
+
+This module stops sending requests to an endpoint family while it is failing, so a
+degraded backend (e.g. digital issuance) fails fast instead of tying up connections
+and rate limit permits that other endpoints (e.g. float checks) need. Circuits are
+keyed by the endpoint name used for signing (``Endpoint._endpoint``).
+
+A circuit opens after ``failure_threshold`` consecutive failures. Once
+``recovery_timeout`` has passed it is half-open and lets a limited number of probe
+requests through: a successful probe closes it, a failed one opens it again. Only
+transport errors, server errors and call deadlines passing while a request is in
+flight count as failures, the latter only when the deadline left the request at
+least the read timeout of its endpoint; business errors such as
+``DenominationNotInStock`` mean the backend is healthy. Errors raised before a
+request is sent, e.g. a deadline that passed while queueing, record nothing.
+
+The module consists of three main classes:
+- CircuitBreaker: The circuits of every endpoint
+- CircuitState: The state of a circuit
+- CircuitSnapshot: The state and counters of a circuit, e.g. for dashboards
+
+Example:
+    ```python
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+    client = Tillo(api_key, secret, circuit_breaker=breaker)
+
+    try:
+        client.digital_card.issue_digital_code(body=body)
+    except CircuitOpenError as e:
+        print(f"{e.endpoint} unavailable, retry in {e.retry_after:.0f}s")
+
+    print(breaker.snapshot())
+    ```
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from httpx import Response, TransportError
+
+from .errors import (
+    CircuitOpenError,
+    DeadlineExceededInFlight,
+    InternalServerError,
+    TilloException,
+    UrlHostingServiceUnavailable,
+)
+
+logger = logging.getLogger("tillo.circuit_breaker")
+
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+FAILURE_EXCEPTIONS: tuple[type[Exception], ...] = (
+    TransportError,
+    InternalServerError,
+    UrlHostingServiceUnavailable,
+    DeadlineExceededInFlight,
+)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitSnapshot:
+    """The state and counters of the circuit of an endpoint.
+
+    Attributes:
+        state (CircuitState): The current state
+        consecutive_failures (int): Failures since the last success
+        failures (int): Failures since the circuit was created
+        successes (int): Successes since the circuit was created
+        rejected (int): Requests rejected while the circuit was open
+        opened (int): Number of times the circuit opened
+        retry_after (float): Seconds until an open circuit becomes half-open
+    """
+
+    state: CircuitState
+    consecutive_failures: int
+    failures: int
+    successes: int
+    rejected: int
+    opened: int
+    retry_after: float
+
+
+class _Circuit:
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "failures",
+        "successes",
+        "rejected",
+        "opened",
+        "opened_at",
+        "probes",
+        "probe_successes",
+    )
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.rejected = 0
+        self.opened = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+
+
+class CircuitBreaker:
+    """Circuit breakers per endpoint.
+
+    A breaker can be shared by the sync and async clients.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open a circuit
+        recovery_timeout (float): Seconds a circuit stays open before probing
+        half_open_max_calls (int): Concurrent probe requests of a half-open circuit
+        success_threshold (int): Successful probes that close a half-open circuit
+        failure_status_codes (frozenset[int]): Response status codes counted as failures
+        failure_exceptions (tuple[type[Exception], ...]): Exceptions counted as failures
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_status_codes: frozenset[int] = FAILURE_STATUS_CODES,
+        failure_exceptions: tuple[type[Exception], ...] = FAILURE_EXCEPTIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("Circuit breaker thresholds must be at least 1.")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_status_codes = failure_status_codes
+        self.failure_exceptions = failure_exceptions
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, endpoint: str) -> None:
+        """Let a request through or reject it.
+
+        Every request let through must be followed by ``record_response``,
+        ``record_exception`` or ``release``.
+
+        Args:
+            endpoint (str): The endpoint name
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            self._advance(endpoint, circuit)
+
+            if circuit.state is CircuitState.CLOSED:
+                return
+
+            if circuit.state is CircuitState.HALF_OPEN and circuit.probes < self.half_open_max_calls:
+                circuit.probes += 1
+                return
+
+            circuit.rejected += 1
+            retry_after = self._retry_after(circuit)
+
+        raise CircuitOpenError(endpoint, retry_after)
+
+    def record_response(self, endpoint: str, response: Response) -> None:
+        """Record the outcome of a request that returned a response.
+
+        Args:
+            endpoint (str): The endpoint name
+            response (Response): The response
+        """
+        self._record(endpoint, failed=response.status_code in self.failure_status_codes)
+
+    def record_exception(self, endpoint: str, exception: BaseException) -> None:
+        """Record the outcome of a request that raised.
+
+        Tillo errors raised for a response that is not a failure, such as business
+        errors, count as a success. Any other exception, e.g. a deadline passing or a
+        serialization error before the request was sent, or a cancellation, only frees
+        the probe slot, so the backend is judged on requests it actually received.
+
+        Args:
+            endpoint (str): The endpoint name
+            exception (BaseException): The exception raised by the request
+        """
+        if isinstance(exception, self.failure_exceptions):
+            self._record(endpoint, failed=True)
+        elif isinstance(exception, TilloException) and exception.response is not None:
+            self._record(endpoint, failed=False)
+        else:
+            self.release(endpoint)
+
+    def release(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuit(endpoint)
+
+            if circuit.state is CircuitState.HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def state(self, endpoint: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+
+            if circuit is None:
+                return CircuitState.CLOSED
+
+            self._advance(endpoint, circuit)
+            return circuit.state
+
+    def snapshot(self) -> dict[str, CircuitSnapshot]:
+        """Get the state and counters of every circuit.
+
+        Returns:
+            dict[str, CircuitSnapshot]: Snapshots keyed by endpoint name
+        """
+        with self._lock:
+            snapshots: dict[str, CircuitSnapshot] = {}
+
+            for endpoint, circuit in self._circuits.items():
+                self._advance(endpoint, circuit)
+                snapshots[endpoint] = CircuitSnapshot(
+                    state=circuit.state,
+                    consecutive_failures=circuit.consecutive_failures,
+                    failures=circuit.failures,
+                    successes=circuit.successes,
+                    rejected=circuit.rejected,
+                    opened=circuit.opened,
+                    retry_after=self._retry_after(circuit),
+                )
+
+            return snapshots
+
+    def reset(self, endpoint: str | None = None) -> None:
+        """Close the circuit of an endpoint, or of every endpoint when None.
+
+        Args:
+            endpoint (str | None): The endpoint name
+        """
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit()
+
+        return circuit
+
+    def _record(self, endpoint: str, failed: bool) -> None:
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            half_open = circuit.state is CircuitState.HALF_OPEN
+
+            if half_open and circuit.probes > 0:
+                circuit.probes -= 1
+
+            if failed:
+                circuit.failures += 1
+                circuit.consecutive_failures += 1
+
+                if half_open or circuit.consecutive_failures >= self.failure_threshold:
+                    self._transition(endpoint, circuit, CircuitState.OPEN)
+
+                return
+
+            circuit.successes += 1
+            circuit.consecutive_failures = 0
+
+            if half_open:
+                circuit.probe_successes += 1
+
+                if circuit.probe_successes >= self.success_threshold:
+                    self._transition(endpoint, circuit, CircuitState.CLOSED)
+
+    def _advance(self, endpoint: str, circuit: _Circuit) -> None:
+        if circuit.state is CircuitState.OPEN and self._retry_after(circuit) <= 0:
+            self._transition(endpoint, circuit, CircuitState.HALF_OPEN)
+
+    def _retry_after(self, circuit: _Circuit) -> float:
+        if circuit.state is not CircuitState.OPEN:
+            return 0.0
+
+        return max(0.0, circuit.opened_at + self.recovery_timeout - self._clock())
+
+    def _transition(self, endpoint: str, circuit: _Circuit, state: CircuitState) -> None:
+        if circuit.state is state:
+            return
+
+        logger.warning("Circuit of %s changed from %s to %s", endpoint, circuit.state.value, state.value)
+
+        circuit.state = state
+        circuit.probes = 0
+        circuit.probe_successes = 0
+
+        if state is CircuitState.OPEN:
+            circuit.opened += 1
+            circuit.opened_at = self._clock()
@@ -0,0 +1,260 @@
+"""Tillo SDK Adaptive Concurrency Module.
+
+This module limits the number of requests in flight per endpoint family with a limit
+that tunes itself (AIMD). While responses arrive with healthy latency the limit grows
+by about one permit per round trip; a ``429`` response, a request timeout or a call
+deadline passing while the request is in flight cuts it by a factor. Deadlines of
+callers tighter than the read timeout of the endpoint do not count as overload. Bulk jobs can
+therefore submit work freely: throughput rises in quiet periods and backs off during
+incidents without a static cap.
+
+Latency is healthy while it stays within ``latency_tolerance`` times the baseline
+latency of the endpoint, a slowly rising minimum of the observed latencies.
+
+The module consists of two main classes:
+- AdaptiveConcurrencyLimiter: The limits of every endpoint family
+- ConcurrencySnapshot: The limit and counters of an endpoint, e.g. for dashboards
+
+Example:
+    ```python
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=200)
+    client = create_client_async(
+        api_key="your_api_key",
+        secret_key="your_secret_key",
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        concurrency_limiter=limiter,
+    )
+
+    print(limiter.limit("digital-issue"))
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from httpx import TimeoutException
+
+from .errors import DeadlineExceededInFlight
+
+logger = logging.getLogger("tillo.concurrency")
+
+OVERLOAD_STATUS_CODES = frozenset({429})
+OVERLOAD_EXCEPTIONS: tuple[type[BaseException], ...] = (TimeoutException, DeadlineExceededInFlight)
+
+# Share of the distance to a higher latency the baseline moves per sample
+BASELINE_DRIFT = 0.01
+
+
+@dataclass(frozen=True)
+class ConcurrencySnapshot:
+    """The limit and counters of an endpoint family.
+
+    Attributes:
+        limit (float): Current number of permits
+        in_flight (int): Requests holding a permit
+        waiting (int): Requests waiting for a permit
+        baseline_latency (float | None): Baseline latency in seconds
+        increases (int): Number of additive increases
+        decreases (int): Number of multiplicative decreases
+    """
+
+    limit: float
+    in_flight: int
+    waiting: int
+    baseline_latency: float | None
+    increases: int
+    decreases: int
+
+
+class _Limit:
+    __slots__ = ("limit", "in_flight", "waiters", "baseline", "last_decrease", "increases", "decreases")
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.baseline: float | None = None
+        self.last_decrease = float("-inf")
+        self.increases = 0
+        self.decreases = 0
+
+
+class Permit:
+    """A permit to send one request, returned by ``AdaptiveConcurrencyLimiter.acquire``."""
+
+    __slots__ = ("_limiter", "_endpoint", "_released")
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter", endpoint: str):
+        self._limiter = limiter
+        self._endpoint = endpoint
+        self._released = False
+
+    def release(
+        self,
+        status_code: int | None = None,
+        error: BaseException | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """Return the permit and adjust the limit to the outcome of the request.
+
+        Args:
+            status_code (int | None): Status code of the response, if any
+            error (BaseException | None): Exception raised by the request, if any
+            latency (float | None): Duration of the request in seconds
+        """
+        if self._released:
+            return
+
+        self._released = True
+        self._limiter._release(self._endpoint, status_code, error, latency)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limits per endpoint family for the asynchronous client.
+
+    Args:
+        initial_limit (float): Permits of an endpoint before any adjustment
+        min_limit (float): Lower bound of the limit
+        max_limit (float): Upper bound of the limit
+        backoff (float): Factor applied to the limit on overload
+        latency_tolerance (float): Latency above the baseline still considered healthy
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 10.0,
+        min_limit: float = 1.0,
+        max_limit: float = 200.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+
+        if not 0 < backoff < 1:
+            raise ValueError("Concurrency backoff must be between 0 and 1.")
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._limits: dict[str, _Limit] = {}
+
+    async def acquire(self, endpoint: str) -> Permit:
+        """Wait for a permit to send a request to an endpoint.
+
+        Args:
+            endpoint (str): The endpoint name
+
+        Returns:
+            Permit: The permit, to be released once the request completes
+        """
+        state = self._state(endpoint)
+
+        if not state.waiters and state.in_flight < int(state.limit):
+            state.in_flight += 1
+            return Permit(self, endpoint)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The permit was handed over before the cancellation arrived.
+                state.in_flight -= 1
+                self._wake(state)
+            else:
+                state.waiters.remove(waiter)
+            raise
+
+        return Permit(self, endpoint)
+
+    def limit(self, endpoint: str) -> float:
+        state = self._limits.get(endpoint)
+        return state.limit if state is not None else self.initial_limit
+
+    def snapshot(self) -> dict[str, ConcurrencySnapshot]:
+        """Get the limit and counters of every endpoint family.
+
+        Returns:
+            dict[str, ConcurrencySnapshot]: Snapshots keyed by endpoint name
+        """
+        return {
+            endpoint: ConcurrencySnapshot(
+                limit=state.limit,
+                in_flight=state.in_flight,
+                waiting=len(state.waiters),
+                baseline_latency=state.baseline,
+                increases=state.increases,
+                decreases=state.decreases,
+            )
+            for endpoint, state in self._limits.items()
+        }
+
+    def _state(self, endpoint: str) -> _Limit:
+        state = self._limits.get(endpoint)
+
+        if state is None:
+            state = self._limits[endpoint] = _Limit(self.initial_limit)
+
+        return state
+
+    def _release(
+        self,
+        endpoint: str,
+        status_code: int | None,
+        error: BaseException | None,
+        latency: float | None,
+    ) -> None:
+        state = self._state(endpoint)
+        state.in_flight -= 1
+
+        if status_code in OVERLOAD_STATUS_CODES or isinstance(error, OVERLOAD_EXCEPTIONS):
+            self._decrease(endpoint, state)
+        elif status_code is not None and latency is not None:
+            self._observe(state, latency)
+
+        self._wake(state)
+
+    def _observe(self, state: _Limit, latency: float) -> None:
+        if state.baseline is None or latency < state.baseline:
+            state.baseline = latency
+        else:
+            state.baseline += (latency - state.baseline) * BASELINE_DRIFT
+
+        if latency <= state.baseline * self.latency_tolerance and state.in_flight + 1 >= int(state.limit):
+            # Grow by one permit per round trip of a saturated limit.
+            state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+            state.increases += 1
+
+    def _decrease(self, endpoint: str, state: _Limit) -> None:
+        now = self._clock()
+
+        # Requests sent before the last cut complete within a round trip, their
+        # overload signals are the same incident.
+        if now - state.last_decrease < (state.baseline or 0.0) * self.latency_tolerance:
+            return
+
+        state.last_decrease = now
+        state.limit = max(self.min_limit, state.limit * self.backoff)
+        state.decreases += 1
+
+        logger.debug("Concurrency limit of %s decreased to %.1f", endpoint, state.limit)
+
+    def _wake(self, state: _Limit) -> None:
+        while state.waiters and state.in_flight < int(state.limit):
+            waiter = state.waiters.popleft()
+
+            if not waiter.done():
+                state.in_flight += 1
+                waiter.set_result(None)
@@ -7,7 +7,9 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from httpx import Response
 
 if TYPE_CHECKING:
+    from jpy_tillo_sdk.domain.webhook.services import WebhookService
     from jpy_tillo_sdk.http_client import AsyncHttpClient, HttpClient
+    from jpy_tillo_sdk.timeouts import Deadline, TimeoutProfile
 
 logger = logging.getLogger("tillo.contracts")
 
@@ -37,6 +39,10 @@ class EndpointInterface(ABC):
     @abstractmethod
     def sign_attrs(self) -> tuple[str, ...]: ...
 
+    @property
+    def timeout(self) -> "TimeoutProfile | None":
+        return None
+
 
 @dataclass(frozen=True)
 class SignatureAttributesInterface(ABC):
@@ -50,6 +56,7 @@ class ClientInterface(ABC):
     def request(
         self,
         endpoint: EndpointInterface,
+        deadline: "Deadline | None" = None,
     ) -> Response: ...
 
 
@@ -690,16 +697,15 @@ class TilloInterface(ABC):
 
     @property
     @abstractmethod
-    def webhook(self) -> None:
+    def webhook(self) -> "WebhookService":
         """Get the webhook service instance.
 
         Returns:
-            WebhookService: Service for managing webhook-related operations.
+            WebhookService: Service for verifying, decoding and handling webhooks.
 
         Example:
             ```python
-            webhook_service = tillo.webhook()
-            webhooks = webhook_service.list_webhooks()
+            webhook = tillo.webhook.parse(request.body)
             ```
         """
         ...
@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+
+from httpx import Response
+
+from ...errors import DeadlineExceeded
+from ...timeouts import Deadline
+from .endpoints import BrandEndpoint, BrandEndpointRequestQuery
+
+logger = logging.getLogger("tillo.brand_cache")
+
+CacheKey = BrandEndpointRequestQuery | None
+Fetch = Callable[[], Response]
+AsyncFetch = Callable[[], Awaitable[Response]]
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss metrics of a ``BrandCache``.
+
+    Attributes:
+        hits (int): Lookups answered with a fresh entry
+        stale_hits (int): Lookups answered with a stale entry while it was refreshed
+        misses (int): Lookups that waited for a request to the API
+        refreshes (int): Background refreshes started
+        refresh_errors (int): Requests to the API made by the cache that failed
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Get the share of lookups answered from memory.
+
+        Returns:
+            float: Ratio between 0 and 1
+        """
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _Entry:
+    response: Response
+    stored_at: float
+
+
+class BrandCache:
+    """TTL cache of brand list responses keyed by the query fields.
+
+    Entries are fresh for ``ttl`` seconds. On the async service a stale entry is
+    still served for ``stale_ttl`` more seconds while a single background request
+    refreshes it; the sync service treats it as a miss. Concurrent async misses on
+    the same query share one request.
+
+    Requests made by the async cache are shared, so ``fetch`` must not carry the
+    deadline of a caller; each caller's deadline only bounds its own wait.
+
+    Args:
+        ttl (float): Seconds an entry is served without refreshing it
+        stale_ttl (float): Seconds a stale entry is served while it is refreshed
+        max_entries (int): Number of queries kept, least recently used are evicted
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+
+    Example:
+        ```python
+        tillo = Tillo(api_key, secret, brand_cache=BrandCache(ttl=600))
+        response = await tillo.brands_async.get_available_brands(BrandEndpointRequestQuery(detail=True))
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        stale_ttl: float = 60.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl <= 0:
+            raise ValueError("Brand cache TTL must be positive.")
+
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._refreshing: dict[CacheKey, asyncio.Task[Response]] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: CacheKey, fetch: Fetch) -> Response:
+        """Get the cached response of a query, fetching it when missing or expired.
+
+        Args:
+            query (BrandEndpointRequestQuery | None): The brand list query
+            fetch (Callable[[], Response]): Sends the request to the API
+
+        Returns:
+            Response: The cached or fetched response
+        """
+        with self._lock:
+            entry = self._lookup(query)
+
+            if entry is not None and self._age(entry) < self.ttl:
+                self._stats.hits += 1
+                return entry.response
+
+            self._stats.misses += 1
+
+        response = fetch()
+        self._store(query, response)
+
+        return response
+
+    async def get_async(self, query: CacheKey, fetch: AsyncFetch, deadline: Deadline | None = None) -> Response:
+        """Get the cached response of a query, refreshing stale entries in the background.
+
+        Args:
+            query (BrandEndpointRequestQuery | None): The brand list query
+            fetch (Callable[[], Awaitable[Response]]): Sends the request to the API,
+                shared by every caller and the background refresh
+            deadline (Deadline | None): Deadline of the caller, bounding its wait on a miss
+
+        Returns:
+            Response: The cached or fetched response
+
+        Raises:
+            DeadlineExceeded: If the deadline passes while waiting for the request,
+                which keeps running for the other callers
+        """
+        with self._lock:
+            entry = self._lookup(query)
+            age = self._age(entry) if entry is not None else math.inf
+
+            if entry is not None and age < self.ttl:
+                self._stats.hits += 1
+                return entry.response
+
+            if entry is None or age >= self.ttl + self.stale_ttl:
+                self._stats.misses += 1
+                entry = None
+            else:
+                self._stats.stale_hits += 1
+
+                if query not in self._refreshing:
+                    self._stats.refreshes += 1
+
+        if entry is None:
+            task = self._refresh(query, fetch)
+
+            if deadline is None:
+                return await asyncio.shield(task)
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), deadline.check(BrandEndpoint._endpoint))
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(BrandEndpoint._endpoint) from None
+
+        self._refresh(query, fetch)
+        return entry.response
+
+    def invalidate(self, query: CacheKey) -> None:
+        with self._lock:
+            self._entries.pop(query, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, query: CacheKey) -> _Entry | None:
+        entry = self._entries.get(query)
+
+        if entry is not None:
+            self._entries.move_to_end(query)
+
+        return entry
+
+    def _age(self, entry: _Entry) -> float:
+        return self._clock() - entry.stored_at
+
+    def _store(self, query: CacheKey, response: Response) -> None:
+        if response.status_code >= 400:
+            return
+
+        with self._lock:
+            self._entries[query] = _Entry(response=response, stored_at=self._clock())
+            self._entries.move_to_end(query)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh(self, query: CacheKey, fetch: AsyncFetch) -> "asyncio.Task[Response]":
+        task = self._refreshing.get(query)
+
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(query, fetch))
+            self._refreshing[query] = task
+            task.add_done_callback(lambda done: self._refreshed(query, done))
+
+        return task
+
+    async def _fetch_and_store(self, query: CacheKey, fetch: AsyncFetch) -> Response:
+        response = await fetch()
+        self._store(query, response)
+
+        return response
+
+    def _refreshed(self, query: CacheKey, task: "asyncio.Task[Response]") -> None:
+        self._refreshing.pop(query, None)
+
+        if task.cancelled():
+            return
+
+        exception = task.exception()
+
+        if exception is not None:
+            with self._lock:
+                self._stats.refresh_errors += 1
+
+            logger.warning("Refreshing brands for %s failed: %s", query, exception)
@@ -0,0 +1,368 @@
+import bisect
+import logging
+import threading
+from collections.abc import Mapping
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from httpx import Response
+
+from ..webhook.enums import Types
+from ..webhook.handlers import decode_brand_list
+from ..webhook.models import Webhook
+from .models import BrandsResponse
+
+logger = logging.getLogger("tillo.brand_catalogue")
+
+AVAILABLE_STATUS = "ENABLED"
+CENTS = Decimal("0.01")
+
+
+def normalize_amount(amount: str | int | float | Decimal) -> str | None:
+    """Format a face value the way denominations are indexed (e.g. "25.00").
+
+    Args:
+        amount (str | int | float | Decimal): The face value
+
+    Returns:
+        str | None: The normalized amount or None when it is not a number
+    """
+    try:
+        return str(Decimal(str(amount)).quantize(CENTS))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _values(detail: Mapping[str, Any], *keys: str) -> list[str]:
+    for key in keys:
+        value = detail.get(key)
+
+        if isinstance(value, str):
+            return [value]
+
+        if isinstance(value, (list, tuple)):
+            return [str(item) for item in value if item is not None]
+
+    return []
+
+
+def _status_code(detail: Mapping[str, Any]) -> str | None:
+    status = detail.get("status")
+
+    if isinstance(status, Mapping):
+        status = status.get("code")
+
+    return str(status).upper() if status is not None else None
+
+
+class BrandCatalogue:
+    """In-memory brand catalogue with precomputed lookup indexes.
+
+    Brands are indexed by slug, country, currency, category and fixed denomination,
+    so queries are set intersections instead of scans over the brand list. Face
+    value ranges are indexed by their sorted bounds: the brands accepting an amount
+    are found with a binary search. The range index is rebuilt on the first query
+    after a range changes, in time proportional to the ranges times their distinct
+    bounds. The other indexes are updated per brand, so ``brands.status.updated``
+    webhooks are applied without rebuilding the catalogue.
+
+    Args:
+        brands (Mapping[str, Mapping[str, Any]]): Brand details keyed by slug, as
+            returned by ``get_available_brands`` with ``detail=True``
+
+    Example:
+        ```python
+        response = tillo.brands.get_available_brands(BrandEndpointRequestQuery(detail=True))
+        catalogue = BrandCatalogue.from_response(response)
+
+        slugs = catalogue.find(currency="GBP", category="food", denomination="25.00")
+
+        catalogue.apply_webhook(handle_webhook_event(payload))
+        ```
+    """
+
+    def __init__(self, brands: Mapping[str, Mapping[str, Any]] | None = None):
+        self._brands: dict[str, Mapping[str, Any]] = {}
+        self._statuses: dict[str, str | None] = {}
+        self._available: set[str] = set()
+        self._by_country: dict[str, set[str]] = {}
+        self._by_currency: dict[str, set[str]] = {}
+        self._by_category: dict[str, set[str]] = {}
+        self._by_denomination: dict[str, set[str]] = {}
+        self._denominations: dict[str, set[str]] = {}
+        self._ranges: dict[str, tuple[Decimal, Decimal]] = {}
+        # Sorted distinct range bounds and the brands accepting each bound and each gap
+        # between two bounds, None once a range changed.
+        self._range_bounds: list[Decimal] | None = []
+        self._range_slots: list[frozenset[str]] = [frozenset()]
+        self._unrestricted: set[str] = set()
+        self._lock = threading.RLock()
+
+        for slug, detail in (brands or {}).items():
+            self.upsert(slug, detail)
+
+    @classmethod
+    def from_response(cls, response: Response | BrandsResponse) -> "BrandCatalogue":
+        """Build a catalogue from a brand list response.
+
+        Args:
+            response (Response | BrandsResponse): Response of ``get_available_brands``
+
+        Returns:
+            BrandCatalogue: The indexed catalogue
+        """
+        if isinstance(response, Response):
+            response = BrandsResponse.from_response(response)
+
+        return cls(response.brands)
+
+    def __len__(self) -> int:
+        return len(self._brands)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._brands
+
+    def get(self, slug: str) -> Mapping[str, Any] | None:
+        return self._brands.get(slug)
+
+    def is_available(self, slug: str) -> bool:
+        return slug in self._available
+
+    def currencies(self, slug: str) -> list[str]:
+        detail = self._brands.get(slug)
+        return [currency.upper() for currency in _values(detail, "currency", "currencies")] if detail else []
+
+    def accepts(self, slug: str, amount: str | int | float | Decimal) -> bool:
+        """Check whether a brand accepts a face value.
+
+        Brands with neither fixed denominations nor face value limits accept any amount.
+
+        Args:
+            slug (str): The brand slug
+            amount (str | int | float | Decimal): The face value
+
+        Returns:
+            bool: True when the amount is one of the denominations or within the limits
+        """
+        key = normalize_amount(amount)
+
+        if key is None or slug not in self._brands:
+            return False
+
+        if slug in self._unrestricted:
+            return True
+
+        limits = self._ranges.get(slug)
+
+        return key in self._denominations.get(slug, ()) or (
+            limits is not None and limits[0] <= Decimal(key) <= limits[1]
+        )
+
+    def find(
+        self,
+        *,
+        country: str | None = None,
+        currency: str | None = None,
+        category: str | None = None,
+        denomination: str | int | float | Decimal | None = None,
+        include_unavailable: bool = False,
+    ) -> set[str]:
+        """Find the slugs of the brands matching all given criteria.
+
+        Args:
+            country (str | None): ISO country code served by the brand
+            currency (str | None): ISO currency code of the brand
+            category (str | None): Category of the brand
+            denomination (str | int | float | Decimal | None): Face value the brand accepts
+            include_unavailable (bool): Include brands whose status is not enabled
+
+        Returns:
+            set[str]: Slugs of the matching brands
+        """
+        with self._lock:
+            candidates: list[set[str]] = []
+
+            if not include_unavailable:
+                candidates.append(self._available)
+            if country is not None:
+                candidates.append(self._by_country.get(country.upper(), set()))
+            if currency is not None:
+                candidates.append(self._by_currency.get(currency.upper(), set()))
+            if category is not None:
+                candidates.append(self._by_category.get(category.lower(), set()))
+            if denomination is not None:
+                candidates.append(self._accepting(denomination))
+
+            candidates.sort(key=len)
+            result = set(candidates[0]) if candidates else set(self._brands)
+
+            for other in candidates[1:]:
+                result &= other
+
+            return result
+
+    def _accepting(self, amount: str | int | float | Decimal) -> set[str]:
+        key = normalize_amount(amount)
+
+        if key is None:
+            return set()
+
+        return self._by_denomination.get(key, set()) | self._ranged(Decimal(key)) | self._unrestricted
+
+    def _ranged(self, value: Decimal) -> frozenset[str]:
+        bounds = self._range_bounds
+
+        if bounds is None:
+            bounds = self._index_ranges()
+
+        # Slot 2i is the gap below bounds[i] and slot 2i + 1 is bounds[i] itself.
+        index = bisect.bisect_left(bounds, value)
+        exact = index < len(bounds) and bounds[index] == value
+
+        return self._range_slots[2 * index + 1 if exact else 2 * index]
+
+    def _index_ranges(self) -> list[Decimal]:
+        bounds = sorted({bound for limits in self._ranges.values() for bound in limits})
+        slots: list[set[str]] = [set() for _ in range(2 * len(bounds) + 1)]
+
+        for slug, (lower, upper) in self._ranges.items():
+            for slot in range(2 * bisect.bisect_left(bounds, lower) + 1, 2 * bisect.bisect_left(bounds, upper) + 2):
+                slots[slot].add(slug)
+
+        self._range_slots = [frozenset(slot) for slot in slots]
+        self._range_bounds = bounds
+        return bounds
+
+    def upsert(self, slug: str, detail: Mapping[str, Any]) -> None:
+        """Add a brand or replace its details, updating only its index entries.
+
+        Args:
+            slug (str): The brand slug
+            detail (Mapping[str, Any]): The brand details
+        """
+        with self._lock:
+            # A status received before the brand was loaded applies until its details carry one.
+            pending = self._statuses.get(slug) if slug not in self._brands else None
+            self._unindex(slug)
+            self._brands[slug] = detail
+
+            for country in _values(detail, "countries_served", "country"):
+                self._by_country.setdefault(country.upper(), set()).add(slug)
+
+            for currency in _values(detail, "currency", "currencies"):
+                self._by_currency.setdefault(currency.upper(), set()).add(slug)
+
+            for category in _values(detail, "categories", "category"):
+                self._by_category.setdefault(category.lower(), set()).add(slug)
+
+            for denomination in _values(detail, "denominations"):
+                key = normalize_amount(denomination)
+
+                if key is not None:
+                    self._by_denomination.setdefault(key, set()).add(slug)
+                    self._denominations.setdefault(slug, set()).add(key)
+
+            limits = detail.get("digital_face_value_limits")
+
+            if isinstance(limits, Mapping) and limits.get("lower") is not None and limits.get("upper") is not None:
+                lower, upper = normalize_amount(limits["lower"]), normalize_amount(limits["upper"])
+
+                if lower is not None and upper is not None:
+                    self._ranges[slug] = (Decimal(lower), Decimal(upper))
+                    self._range_bounds = None
+
+            if slug not in self._denominations and slug not in self._ranges:
+                self._unrestricted.add(slug)
+
+            code = _status_code(detail)
+            self._set_status(slug, code if code is not None else pending)
+
+    def remove(self, slug: str) -> None:
+        with self._lock:
+            self._unindex(slug)
+            self._brands.pop(slug, None)
+            self._statuses.pop(slug, None)
+
+    def update_status(self, slug: str, code: str | None) -> None:
+        """Update the status of a brand, e.g. from a webhook.
+
+        The status of a brand missing from the catalogue is kept without adding the
+        brand, so it matches no lookup and accepts no amount until its details are
+        loaded, and the status applies if they carry none.
+
+        Args:
+            slug (str): The brand slug
+            code (str | None): The new status code (e.g. "ENABLED")
+        """
+        with self._lock:
+            code = code.upper() if code is not None else None
+
+            if slug not in self._brands:
+                self._statuses[slug] = code
+                return
+
+            self._set_status(slug, code)
+
+    def apply_webhook(self, webhook: Webhook) -> int:
+        """Apply a ``brands.status.updated`` webhook to the catalogue.
+
+        Args:
+            webhook (Webhook): The parsed webhook
+
+        Returns:
+            int: Number of brands updated, 0 for other webhook types
+        """
+        webhook_type = webhook.type.value if isinstance(webhook.type, Types) else webhook.type
+
+        if webhook_type != Types.TYPE_BRAND_STATUS_UPDATED.value:
+            return 0
+
+        brands = decode_brand_list(webhook.data).brands
+
+        for brand in brands:
+            if brand.slug is not None:
+                self.update_status(brand.slug, brand.status.code)
+
+        logger.debug("Applied status updates of %d brands", len(brands))
+        return len(brands)
+
+    def _set_status(self, slug: str, code: str | None) -> None:
+        self._statuses[slug] = code
+
+        if code is None or code == AVAILABLE_STATUS:
+            self._available.add(slug)
+        else:
+            self._available.discard(slug)
+
+    def _unindex(self, slug: str) -> None:
+        detail = self._brands.get(slug)
+
+        if detail is None:
+            return
+
+        for index, keys, normalize in (
+            (self._by_country, _values(detail, "countries_served", "country"), str.upper),
+            (self._by_currency, _values(detail, "currency", "currencies"), str.upper),
+            (self._by_category, _values(detail, "categories", "category"), str.lower),
+        ):
+            for key in keys:
+                _discard(index, normalize(key), slug)
+
+        for key in self._denominations.pop(slug, ()):
+            _discard(self._by_denomination, key, slug)
+
+        if self._ranges.pop(slug, None) is not None:
+            self._range_bounds = None
+
+        self._unrestricted.discard(slug)
+        self._available.discard(slug)
+
+
+def _discard(index: dict[str, set[str]], key: str, slug: str) -> None:
+    slugs = index.get(key)
+
+    if slugs is not None:
+        slugs.discard(slug)
+
+        if not slugs:
+            del index[key]
@@ -3,6 +3,7 @@ from typing import final
 
 from ...contracts import SignatureAttributesInterface
 from ...endpoint import Endpoint
+from ...timeouts import STANDARD
 
 
 @final
@@ -23,6 +24,7 @@ class BrandEndpoint(Endpoint):
     _method = "GET"
     _endpoint = "brands"
     _route = "/api/v2/brands"
+    _timeout = STANDARD
 
 
 @final
@@ -40,6 +42,7 @@ class TemplatesListEndpoint(Endpoint):
     _method = "GET"
     _endpoint = "templates"
     _route = "/api/v2/templates"
+    _timeout = STANDARD
 
 
 @final
@@ -63,3 +66,4 @@ class DownloadBrandTemplateEndpoint(Endpoint):
     _method = "GET"
     _endpoint = "template"
     _route = "/api/v2/template"
+    _timeout = STANDARD
@@ -0,0 +1,35 @@
+from typing import Any
+
+from ...responses import ResponseModel
+
+
+class BrandsResponse(ResponseModel):
+    """Typed response of ``get_available_brands``.
+
+    Without ``detail`` Tillo lists brand slugs, with ``detail`` the brands are keyed
+    by slug; both shapes are supported.
+    """
+
+    __slots__ = ()
+
+    @property
+    def _brands(self) -> Any:
+        data = self.data
+        return data.get("brands") if isinstance(data, dict) else None
+
+    @property
+    def slugs(self) -> list[str]:
+        brands = self._brands
+
+        if isinstance(brands, dict):
+            return list(brands)
+
+        return list(brands) if isinstance(brands, list) else []
+
+    @property
+    def brands(self) -> dict[str, dict[str, Any]]:
+        brands = self._brands
+        return brands if isinstance(brands, dict) else {}
+
+    def brand(self, slug: str) -> dict[str, Any] | None:
+        return self.brands.get(slug)
@@ -1,5 +1,5 @@
 import logging
-from typing import final
+from typing import TYPE_CHECKING, final
 
 from httpx import Response
 
@@ -9,6 +9,8 @@ from ...contracts import (
     TemplateServiceAsyncInterface,
     TemplateServiceInterface,
 )
+from ...timeouts import Deadline
+from .cache import BrandCache
 from .endpoints import (
     BrandEndpoint,
     BrandEndpointRequestQuery,
@@ -17,28 +19,65 @@ from .endpoints import (
     TemplatesListEndpoint,
     TemplatesListEndpointRequestQuery,
 )
+from .models import BrandsResponse
+
+if TYPE_CHECKING:
+    from ...http_client import AsyncHttpClient, HttpClient
 
 logger = logging.getLogger("tillo.brand_services")
 
 
 @final
 class BrandService(BrandServiceInterface):
+    def __init__(self, *, client: "HttpClient", cache: BrandCache | None = None):
+        super().__init__(client=client)
+        self.cache = cache
+
     def get_available_brands(
         self,
         query: BrandEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint: BrandEndpoint = BrandEndpoint(query=query)
-        return self.client.request(endpoint=endpoint)
+
+        if self.cache is not None:
+            return self.cache.get(query, lambda: self.client.request(endpoint=endpoint, deadline=deadline))
+
+        return self.client.request(endpoint=endpoint, deadline=deadline)
+
+    def get_available_brands_typed(
+        self,
+        query: BrandEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
+    ) -> BrandsResponse:
+        return BrandsResponse.from_response(self.get_available_brands(query=query, deadline=deadline))
 
 
 @final
 class BrandServiceAsync(BrandServiceAsyncInterface):
+    def __init__(self, *, client: "AsyncHttpClient", cache: BrandCache | None = None):
+        super().__init__(client=client)
+        self.cache = cache
+
     async def get_available_brands(
         self,
         query: BrandEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = BrandEndpoint(query=query)
-        return await self.client.request(endpoint=endpoint)
+
+        if self.cache is not None:
+            # The cached request is shared, only the wait of this caller is bounded by its deadline.
+            return await self.cache.get_async(query, lambda: self.client.request(endpoint=endpoint), deadline)
+
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
+
+    async def get_available_brands_typed(
+        self,
+        query: BrandEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
+    ) -> BrandsResponse:
+        return BrandsResponse.from_response(await self.get_available_brands(query=query, deadline=deadline))
 
 
 @final
@@ -46,16 +85,18 @@ class TemplateService(TemplateServiceInterface):
     def get_templates_list(
         self,
         query: TemplatesListEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = TemplatesListEndpoint(query=query)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
 
     def download_brand_template(
         self,
         query: DownloadBrandTemplateEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = DownloadBrandTemplateEndpoint(query=query)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
 
 
 @final
@@ -63,13 +104,15 @@ class TemplateServiceAsync(TemplateServiceAsyncInterface):
     async def download_brand_template(
         self,
         query: DownloadBrandTemplateEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = DownloadBrandTemplateEndpoint(query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
 
     async def get_brand_templates(
         self,
         query: TemplatesListEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = TemplatesListEndpoint(query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
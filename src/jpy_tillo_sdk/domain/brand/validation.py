@@ -0,0 +1,87 @@
+import logging
+from enum import Enum
+from typing import Any, Protocol
+
+from ...errors import BrandNotFound, InvalidValue, SaleDisabled, UnsupportedCurrencyIsoCode
+from .catalogue import BrandCatalogue
+
+logger = logging.getLogger("tillo.brand_validation")
+
+
+class IssuanceRequestBody(Protocol):
+    @property
+    def brand(self) -> str: ...
+
+    @property
+    def face_value(self) -> Any: ...
+
+
+class IssuanceValidator:
+    """Pre-flight validation of issuance requests against a brand catalogue.
+
+    Requests for unknown or disabled brands, unsupported currencies and face values
+    the brand does not accept are rejected locally with the exception Tillo would
+    have returned, saving the request and its rate limit budget.
+
+    Args:
+        catalogue (BrandCatalogue): Catalogue kept up to date by the caller, e.g.
+            from the brand cache and ``brands.status.updated`` webhooks
+
+    Example:
+        ```python
+        validator = IssuanceValidator(catalogue)
+        tillo = Tillo(api_key, secret, issuance_validator=validator)
+
+        tillo.digital_card.issue_digital_code(body=body)  # raises BrandNotFound locally
+        ```
+    """
+
+    def __init__(self, catalogue: BrandCatalogue):
+        self.catalogue = catalogue
+
+    def validate(self, brand: str, currency: str | Enum | None = None, amount: str | None = None) -> None:
+        """Validate a brand, currency and face value.
+
+        Args:
+            brand (str): The brand slug
+            currency (str | Enum | None): The currency code of the face value
+            amount (str | None): The face value amount
+
+        Raises:
+            BrandNotFound: If the brand is not in the catalogue
+            SaleDisabled: If the brand is not enabled
+            UnsupportedCurrencyIsoCode: If the brand is not sold in the currency
+            InvalidValue: If the brand does not accept the face value
+        """
+        if brand not in self.catalogue:
+            raise BrandNotFound()
+
+        if not self.catalogue.is_available(brand):
+            raise SaleDisabled()
+
+        if currency is not None:
+            code = str(currency.value if isinstance(currency, Enum) else currency).upper()
+            currencies = self.catalogue.currencies(brand)
+
+            if currencies and code not in currencies:
+                raise UnsupportedCurrencyIsoCode()
+
+        if amount is not None and not self.catalogue.accepts(brand, amount):
+            raise InvalidValue()
+
+    def validate_body(self, body: IssuanceRequestBody | None) -> None:
+        """Validate the brand and face value of an issuance or order request body.
+
+        Args:
+            body (IssuanceRequestBody | None): The request body, ignored when None
+        """
+        if body is None:
+            return
+
+        face_value = body.face_value
+
+        self.validate(
+            body.brand,
+            currency=getattr(face_value, "currency", None),
+            amount=getattr(face_value, "amount", None),
+        )
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from httpx import Response
+
+from ...errors import DenominationNotInStock
+from ...rate_limiter import TokenBucket
+from ...rate_limits import DigitalIssue, RateLimit
+from .endpoints import IssueDigitalCodeRequestBody
+from .stock import StockCache
+
+logger = logging.getLogger("tillo.digital_card_bulk")
+
+IssueCallable = Callable[[IssueDigitalCodeRequestBody], Awaitable[Response]]
+IssueBodies = Iterable[IssueDigitalCodeRequestBody] | AsyncIterable[IssueDigitalCodeRequestBody]
+
+# Issuances in flight by default
+DEFAULT_CONCURRENCY = 10
+ISSUE_RATE_LIMIT = DigitalIssue.post()
+
+
+@dataclass(frozen=True)
+class BulkIssueResult:
+    body: IssueDigitalCodeRequestBody
+    response: Response | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkIssuer:
+    """Issue digital codes from a lazily consumed stream of request bodies.
+
+    At most ``concurrency`` issuances are in flight, and the next body is only pulled
+    from the input once one of them completes, so the batch is never held in memory.
+    Concurrency only bounds the issuances in flight, issuances are started at the
+    pace of the ``DigitalIssue.post()`` rate limit.
+
+    With a ``StockCache``, denominations known to be out of stock fail locally with
+    ``DenominationNotInStock`` instead of spending issuance quota.
+
+    Args:
+        issue (Callable): Coroutine function issuing a single code
+        concurrency (int): Maximum number of issuances in flight
+        stock_cache (StockCache | None): Stock levels consulted before each issuance
+        rate_limit (RateLimit | None): Limit pacing issuances, None to disable
+            (e.g. when the client already has a ``RateLimiter``)
+    """
+
+    def __init__(
+        self,
+        issue: IssueCallable,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        stock_cache: StockCache | None = None,
+        rate_limit: RateLimit | None = ISSUE_RATE_LIMIT,
+    ):
+        if concurrency < 1:
+            raise ValueError("Bulk issuance concurrency must be at least 1.")
+
+        self._issue = issue
+        self.concurrency = concurrency
+        self._stock_cache = stock_cache
+        self._bucket = TokenBucket("POST digital-issue", rate_limit) if rate_limit is not None else None
+
+    def _is_out_of_stock(self, body: IssueDigitalCodeRequestBody) -> bool:
+        amount = body.face_value.amount if body.face_value is not None else None
+
+        return (
+            self._stock_cache is not None
+            and amount is not None
+            and self._stock_cache.is_out_of_stock(body.brand, amount)
+        )
+
+    async def _issue_one(self, body: IssueDigitalCodeRequestBody) -> BulkIssueResult:
+        if self._is_out_of_stock(body):
+            return BulkIssueResult(body=body, error=DenominationNotInStock())
+
+        if self._bucket is not None:
+            await self._bucket.acquire_async()
+
+        try:
+            return BulkIssueResult(body=body, response=await self._issue(body))
+        except Exception as e:
+            logger.debug("Bulk issuance of %s failed: %s", body.client_request_id, e)
+            return BulkIssueResult(body=body, error=e)
+
+    @staticmethod
+    async def _iterate(bodies: IssueBodies) -> AsyncGenerator[IssueDigitalCodeRequestBody, None]:
+        if isinstance(bodies, AsyncIterable):
+            async for body in bodies:
+                yield body
+        else:
+            for body in bodies:
+                yield body
+
+    async def run(self, bodies: IssueBodies) -> AsyncIterator[BulkIssueResult]:
+        """Issue every body and yield the results in completion order.
+
+        Args:
+            bodies (Iterable | AsyncIterable): Request bodies to issue
+
+        Yields:
+            BulkIssueResult: The response or the error of each issuance
+        """
+        source = self._iterate(bodies)
+        pending: set[asyncio.Task[BulkIssueResult]] = set()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        body = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+
+                    pending.add(asyncio.ensure_future(self._issue_one(body)))
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await source.aclose()
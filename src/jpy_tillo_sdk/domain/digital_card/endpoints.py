@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 
 from ...contracts import SignatureAttributesInterface
 from ...endpoint import Endpoint
+from ...timeouts import FAST, SLOW, STANDARD, TimeoutProfile
 from .shared import FaceValue
 
 
@@ -90,6 +91,7 @@ class IssueDigitalCodeEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "digital-issue"
     _route: str = "/api/v2/digital/issue"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -124,6 +126,7 @@ class TopUpDigitalCodeEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "digital-top-up"
     _route: str = "/api/v2/digital/top-up"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -139,6 +142,7 @@ class CheckStockEndpoint(Endpoint):
     _method: str = "GET"
     _endpoint: str = "check-stock"
     _route: str = "/api/v2/check-stock"
+    _timeout: TimeoutProfile | None = FAST
 
 
 @dataclass(frozen=True)
@@ -173,6 +177,7 @@ class CancelDigitalCodeEndpoint(Endpoint):
     _method: str = "DELETE"
     _endpoint: str = "digital-issue"
     _route: str = "/api/v2/digital/issue"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -207,6 +212,7 @@ class CancelDigitalUrlEndpoint(Endpoint):
     _method: str = "DELETE"
     _endpoint: str = "digital-issue"
     _route: str = "/api/v2/digital/issue"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -240,6 +246,7 @@ class ReverseDigitalCodeEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "digital-reverse"
     _route: str = "/api/v2/digital/reverse"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -272,6 +279,7 @@ class CheckBalanceEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "digital-check-balance"
     _route: str = "/api/v2/digital/check-balance"
+    _timeout: TimeoutProfile | None = FAST
 
 
 @dataclass(frozen=True)
@@ -330,6 +338,7 @@ class OrderDigitalCodeAsyncEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "digital-order-card"
     _route: str = "/api/v2/digital/order-card"
+    _timeout: TimeoutProfile | None = STANDARD
 
 
 @dataclass(frozen=True)
@@ -345,3 +354,4 @@ class CheckDigitalOrderStatusAsyncEndpoint(Endpoint):
     _method: str = "GET"
     _endpoint: str = "digital-order-status"
     _route: str = "/api/v2/digital/order-status"
+    _timeout: TimeoutProfile | None = FAST
@@ -0,0 +1,47 @@
+from typing import Any
+
+from ...enums import OrderStatus
+from ...responses import ResponseField, ResponseModel
+
+
+def _order_status(value: Any) -> OrderStatus:
+    return OrderStatus(str(value).lower())
+
+
+class DigitalOrderStatusResponse(ResponseModel):
+    """Typed response of ``check_digital_order``."""
+
+    __slots__ = ()
+
+    reference = ResponseField[str]("data", "reference")
+    order_status = ResponseField[OrderStatus]("data", "status", convert=_order_status)
+    brand = ResponseField[str]("data", "brand")
+    url = ResponseField[str]("data", "url")
+    expiration_date = ResponseField[str]("data", "expiration_date")
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.order_status in (OrderStatus.SUCCESS, OrderStatus.ERROR)
+
+
+class StockResponse(ResponseModel):
+    """Typed response of ``check_stock``, stock levels keyed by brand and denomination."""
+
+    __slots__ = ()
+
+    @property
+    def levels(self) -> dict[str, dict[str, str]]:
+        data = self.data
+        return data if isinstance(data, dict) else {}
+
+    def stock_level(self, brand: str, denomination: str) -> str | None:
+        """Get the stock level of a denomination of a brand.
+
+        Args:
+            brand (str): The brand slug
+            denomination (str): The face value as formatted by Tillo (e.g. "45.00")
+
+        Returns:
+            str | None: The stock level or None when it is not listed
+        """
+        return self.levels.get(brand, {}).get(denomination)
@@ -0,0 +1,256 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from httpx import Response
+
+from ...enums import OrderStatus
+from ...errors import DeadlineExceeded
+from ...rate_limiter import TokenBucket
+from ...rate_limits import DigitalOrderStatus, RateLimit
+from ...retry import RETRYABLE_EXCEPTIONS, RETRYABLE_STATUS_CODES
+from ...timeouts import Deadline
+from .endpoints import CheckDigitalOrderStatusAsyncEndpoint, CheckDigitalOrderStatusAsyncRequestQuery
+
+if TYPE_CHECKING:
+    from .services import DigitalCardServiceAsync
+
+logger = logging.getLogger("tillo.digital_card_polling")
+
+TERMINAL_STATUSES = frozenset({OrderStatus.SUCCESS, OrderStatus.ERROR})
+ORDER_STATUS_RATE_LIMIT = DigitalOrderStatus.get()
+
+
+@dataclass(frozen=True)
+class OrderStatusResult:
+    reference: str
+    status: OrderStatus
+    response: Response
+
+
+OrderCallback = Callable[[OrderStatusResult], Any]
+
+
+@dataclass
+class _TrackedOrder:
+    reference: str
+    future: "asyncio.Future[OrderStatusResult]"
+    delay: float
+    callbacks: list[OrderCallback] = field(default_factory=list)
+    polls: int = 0
+    deadline: Deadline | None = None
+
+
+class OrderStatusPoller:
+    """Poll outstanding digital orders from a single scheduler.
+
+    Orders are kept in a timer heap ordered by their next poll time, so thousands of
+    references are tracked by one task instead of one sleeping task per order. Each
+    order backs off exponentially while it stays in a non-terminal status or its status
+    check fails with an error the ``retry`` module would retry (transport errors,
+    ``429`` and server errors), and checks are paced by the ``DigitalOrderStatus.get()``
+    rate limit. Any other error fails the order.
+
+    Args:
+        service (DigitalCardServiceAsync): Service used to check order statuses
+        initial_delay (float): Seconds before the first status check of an order
+        max_delay (float): Upper bound of the backoff between two checks of an order
+        multiplier (float): Backoff growth factor applied after each non-terminal check
+        max_in_flight (int): Maximum number of status checks running concurrently
+        rate_limit (RateLimit | None): Limit pacing status checks, None to disable
+            (e.g. when the client already has a ``RateLimiter``)
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+
+    Example:
+        ```python
+        async with OrderStatusPoller(tillo.digital_card_async) as poller:
+            result = await poller.track(reference)
+        ```
+    """
+
+    def __init__(
+        self,
+        service: "DigitalCardServiceAsync",
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        max_in_flight: int = 50,
+        rate_limit: RateLimit | None = ORDER_STATUS_RATE_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._service = service
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self._clock = clock
+        self._bucket = TokenBucket("GET digital-order-status", rate_limit) if rate_limit is not None else None
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._orders: dict[str, _TrackedOrder] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+        self._scheduler: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._orders)
+
+    def track(
+        self,
+        reference: str,
+        callback: OrderCallback | None = None,
+        deadline: Deadline | None = None,
+    ) -> "asyncio.Future[OrderStatusResult]":
+        """Start polling an order until it reaches a terminal status.
+
+        Args:
+            reference (str): Order reference returned by ``order_digital_code``
+            callback (Callable | None): Called with the result once the order completes
+            deadline (Deadline | None): Deadline of the status checks, the future fails
+                with ``DeadlineExceeded`` when the order is not complete by then
+
+        Returns:
+            asyncio.Future: Resolved with the ``OrderStatusResult`` of the order
+        """
+        order = self._orders.get(reference)
+
+        if order is None:
+            future: asyncio.Future[OrderStatusResult] = asyncio.get_running_loop().create_future()
+            order = _TrackedOrder(reference=reference, future=future, delay=self.initial_delay, deadline=deadline)
+            self._orders[reference] = order
+            self._schedule(order)
+
+        if callback is not None:
+            order.callbacks.append(callback)
+
+        self.start()
+        return order.future
+
+    def start(self) -> None:
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and cancel the futures of outstanding orders."""
+        tasks: list[asyncio.Task[None]] = list(self._tasks)
+
+        if self._scheduler is not None:
+            tasks.append(self._scheduler)
+            self._scheduler = None
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for order in self._orders.values():
+            order.future.cancel()
+
+        self._orders.clear()
+        self._heap.clear()
+
+    async def __aenter__(self) -> "OrderStatusPoller":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+    def _schedule(self, order: _TrackedOrder) -> None:
+        heapq.heappush(self._heap, (self._clock() + order.delay, next(self._sequence), order.reference))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            due_at, _, reference = self._heap[0]
+            wait = due_at - self._clock()
+
+            if wait > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            order = self._orders.get(reference)
+
+            if order is None or order.future.done():
+                continue
+
+            if self._bucket is not None:
+                await self._bucket.acquire_async()
+
+            await self._slots.acquire()
+            task = asyncio.ensure_future(self._poll(order))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _poll(self, order: _TrackedOrder) -> None:
+        try:
+            order.polls += 1
+            response = await self._service.check_digital_order(
+                query=CheckDigitalOrderStatusAsyncRequestQuery(reference=order.reference),
+                deadline=order.deadline,
+            )
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                logger.debug("Polling order %s returned HTTP %d, retrying", order.reference, response.status_code)
+                self._backoff(order)
+                return
+
+            status = OrderStatus(str(response.json()["data"]["status"]).lower())
+        except RETRYABLE_EXCEPTIONS as e:
+            logger.debug("Polling order %s failed, retrying: %s", order.reference, e)
+            self._backoff(order)
+        except Exception as e:
+            self._fail(order, e)
+        else:
+            if status in TERMINAL_STATUSES:
+                self._resolve(order, OrderStatusResult(order.reference, status, response))
+            else:
+                self._backoff(order)
+        finally:
+            self._slots.release()
+
+    def _backoff(self, order: _TrackedOrder) -> None:
+        order.delay = min(self.max_delay, order.delay * self.multiplier)
+
+        if order.deadline is not None and not order.deadline.allows(order.delay):
+            self._fail(order, DeadlineExceeded(CheckDigitalOrderStatusAsyncEndpoint._endpoint))
+            return
+
+        self._schedule(order)
+
+    def _resolve(self, order: _TrackedOrder, result: OrderStatusResult) -> None:
+        self._orders.pop(order.reference, None)
+
+        if order.future.done():
+            return
+
+        order.future.set_result(result)
+
+        for callback in order.callbacks:
+            try:
+                callback(result)
+            except Exception:
+                logger.exception("Order status callback for %s failed", order.reference)
+
+    def _fail(self, order: _TrackedOrder, exception: Exception) -> None:
+        self._orders.pop(order.reference, None)
+        logger.debug("Polling order %s failed: %s", order.reference, exception)
+
+        if not order.future.done():
+            order.future.set_exception(exception)
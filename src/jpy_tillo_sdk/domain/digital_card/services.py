@@ -1,8 +1,13 @@
-from typing import Any, final
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, final
 
 from httpx import Response
 
 from ...contracts import DigitalCardServiceAsyncInterface, DigitalCardServiceInterface, SignatureAttributesInterface
+from ...errors import DenominationNotInStock
+from ...timeouts import Deadline
+from ..brand.validation import IssuanceValidator
+from .bulk import DEFAULT_CONCURRENCY, ISSUE_RATE_LIMIT, BulkIssuer, BulkIssueResult, IssueBodies
 from .endpoints import (
     CancelDigitalCodeEndpoint,
     CancelDigitalCodeRequestBody,
@@ -21,149 +26,308 @@ from .endpoints import (
     TopUpDigitalCodeEndpoint,
     TopUpDigitalCodeRequestBody,
 )
+from .models import DigitalOrderStatusResponse, StockResponse
+from .stock import StockCache
+
+if TYPE_CHECKING:
+    from ...http_client import AsyncHttpClient, HttpClient
+
+
+def _stock_brand(query: Any) -> str | None:
+    brand = getattr(query, "brand", None)
+    return brand if isinstance(brand, str) and brand else None
+
+
+def _record_out_of_stock(
+    stock_cache: StockCache | None, body: IssueDigitalCodeRequestBody | OrderDigitalCodeAsyncRequestBody | None
+) -> None:
+    if stock_cache is not None and body is not None:
+        stock_cache.mark_out_of_stock(body.brand, body.face_value.amount if body.face_value else None)
 
 
 @final
 class DigitalCardServiceAsync(DigitalCardServiceAsyncInterface):
+    def __init__(
+        self,
+        *,
+        client: "AsyncHttpClient",
+        validator: IssuanceValidator | None = None,
+        stock_cache: StockCache | None = None,
+    ):
+        super().__init__(client=client)
+        self.validator = validator
+        self.stock_cache = stock_cache
+
     async def issue_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: IssueDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        if self.validator is not None:
+            self.validator.validate_body(body)
+
         endpoint = IssueDigitalCodeEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+
+        try:
+            return await self.client.request(endpoint=endpoint, deadline=deadline)
+        except DenominationNotInStock:
+            _record_out_of_stock(self.stock_cache, body)
+            raise
+
+    def issue_digital_codes_bulk(
+        self,
+        bodies: IssueBodies,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        skip_out_of_stock: bool = False,
+    ) -> AsyncIterator[BulkIssueResult]:
+        rate_limiter = self.client.rate_limiter
+        paced_by_client = rate_limiter is not None and rate_limiter.bucket_for(IssueDigitalCodeEndpoint) is not None
+        issuer = BulkIssuer(
+            lambda body: self.issue_digital_code(body=body),
+            concurrency=concurrency,
+            stock_cache=self.stock_cache if skip_out_of_stock else None,
+            rate_limit=None if paced_by_client else ISSUE_RATE_LIMIT,
+        )
+        return issuer.run(bodies)
 
     async def order_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: OrderDigitalCodeAsyncRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        if self.validator is not None:
+            self.validator.validate_body(body)
+
         endpoint = OrderDigitalCodeAsyncEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+
+        try:
+            return await self.client.request(endpoint=endpoint, deadline=deadline)
+        except DenominationNotInStock:
+            _record_out_of_stock(self.stock_cache, body)
+            raise
 
     async def check_digital_order(
         self,
         query: SignatureAttributesInterface | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CheckDigitalOrderStatusAsyncEndpoint(query=query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
+
+    async def check_digital_order_typed(
+        self,
+        query: SignatureAttributesInterface | None = None,
+        deadline: Deadline | None = None,
+    ) -> DigitalOrderStatusResponse:
+        return DigitalOrderStatusResponse.from_response(await self.check_digital_order(query=query, deadline=deadline))
 
     async def top_up_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: TopUpDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = TopUpDigitalCodeEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
 
     async def cancel_digital_url(
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelDigitalUrlRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelDigitalUrlEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
 
     async def cancel_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelDigitalCodeEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
 
     async def check_balance(
         self,
         query: Any | None = None,
         body: CheckBalanceRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CheckBalanceEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
 
     async def check_stock(
         self,
         query: Any | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        brand = _stock_brand(query)
+
+        if self.stock_cache is not None and brand is not None:
+            cached = self.stock_cache.response(brand)
+
+            if cached is not None:
+                return cached
+
         endpoint = CheckStockEndpoint(query=query)
-        return await self.client.request(endpoint=endpoint)
+        response = await self.client.request(endpoint=endpoint, deadline=deadline)
+
+        if self.stock_cache is not None:
+            self.stock_cache.store(response)
+
+        return response
+
+    async def check_stock_typed(
+        self,
+        query: Any | None = None,
+        deadline: Deadline | None = None,
+    ) -> StockResponse:
+        return StockResponse.from_response(await self.check_stock(query=query, deadline=deadline))
 
     async def reverse_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: ReverseDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = ReverseDigitalCodeEndpoint(body=body, query=query)
-        return await self.client.request(endpoint=endpoint)
+        return await self.client.request(endpoint=endpoint, deadline=deadline)
 
 
 @final
 class DigitalCardService(DigitalCardServiceInterface):
+    def __init__(
+        self,
+        *,
+        client: "HttpClient",
+        validator: IssuanceValidator | None = None,
+        stock_cache: StockCache | None = None,
+    ):
+        super().__init__(client=client)
+        self.validator = validator
+        self.stock_cache = stock_cache
+
     def issue_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: IssueDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        if self.validator is not None:
+            self.validator.validate_body(body)
+
         endpoint = IssueDigitalCodeEndpoint(body=body, query=query)
-        return self.client.request(endpoint=endpoint)
+
+        try:
+            return self.client.request(endpoint=endpoint, deadline=deadline)
+        except DenominationNotInStock:
+            _record_out_of_stock(self.stock_cache, body)
+            raise
 
     def order_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: OrderDigitalCodeAsyncRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        if self.validator is not None:
+            self.validator.validate_body(body)
+
         endpoint = OrderDigitalCodeAsyncEndpoint(body=body, query=query)
-        return self.client.request(endpoint=endpoint)
+
+        try:
+            return self.client.request(endpoint=endpoint, deadline=deadline)
+        except DenominationNotInStock:
+            _record_out_of_stock(self.stock_cache, body)
+            raise
 
     def check_digital_order(
         self,
         query: SignatureAttributesInterface | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CheckDigitalOrderStatusAsyncEndpoint(query=query)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
+
+    def check_digital_order_typed(
+        self,
+        query: SignatureAttributesInterface | None = None,
+        deadline: Deadline | None = None,
+    ) -> DigitalOrderStatusResponse:
+        return DigitalOrderStatusResponse.from_response(self.check_digital_order(query=query, deadline=deadline))
 
     def top_up_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: TopUpDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = TopUpDigitalCodeEndpoint(body=body)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
 
     def cancel_digital_url(
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelDigitalUrlRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelDigitalUrlEndpoint(body=body)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
 
     def cancel_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelDigitalCodeEndpoint(body=body)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
 
     def reverse_digital_code(
         self,
         query: SignatureAttributesInterface | None = None,
         body: ReverseDigitalCodeRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = ReverseDigitalCodeEndpoint(body=body)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
 
     def check_stock(
         self,
         query: SignatureAttributesInterface | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        brand = _stock_brand(query)
+
+        if self.stock_cache is not None and brand is not None:
+            cached = self.stock_cache.response(brand)
+
+            if cached is not None:
+                return cached
+
         endpoint = CheckStockEndpoint(query=query)
-        return self.client.request(endpoint=endpoint)
+        response = self.client.request(endpoint=endpoint, deadline=deadline)
+
+        if self.stock_cache is not None:
+            self.stock_cache.store(response)
+
+        return response
+
+    def check_stock_typed(
+        self,
+        query: SignatureAttributesInterface | None = None,
+        deadline: Deadline | None = None,
+    ) -> StockResponse:
+        return StockResponse.from_response(self.check_stock(query=query, deadline=deadline))
 
     def check_balance(
         self,
         query: SignatureAttributesInterface | None = None,
         body: CheckBalanceRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CheckBalanceEndpoint(body=body)
-        return self.client.request(endpoint=endpoint)
+        return self.client.request(endpoint=endpoint, deadline=deadline)
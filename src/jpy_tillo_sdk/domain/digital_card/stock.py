@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+
+from httpx import Response
+
+from ..brand.catalogue import normalize_amount
+from .models import StockResponse
+
+logger = logging.getLogger("tillo.digital_card_stock")
+
+OUT_OF_STOCK = "OUT"
+
+
+def _normalize(levels: Mapping[str, object]) -> dict[str, str]:
+    normalized: dict[str, str] = {}
+
+    for amount, level in levels.items():
+        key = normalize_amount(amount)
+
+        if key is not None:
+            normalized[key] = str(level)
+
+    return normalized
+
+
+@dataclass
+class _StockEntry:
+    levels: dict[str, str]
+    stored_at: float
+    response: Response | None = None
+    out_of_stock: set[str] = field(default_factory=set)
+
+
+class StockCache:
+    """Short-lived cache of stock levels per brand.
+
+    Populated by ``check_stock``, whose responses are served from the cache while
+    fresh. When an issuance fails with ``DenominationNotInStock`` the cached levels
+    of the brand are dropped and the denomination is recorded as out of stock for
+    ``ttl`` seconds, so bulk issuance can reject it locally.
+
+    Args:
+        ttl (float): Seconds stock levels are considered current
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+
+    Example:
+        ```python
+        stock = StockCache(ttl=30)
+        service = DigitalCardServiceAsync(client=client, stock_cache=stock)
+
+        await service.check_stock(CheckStockRequestQuery(brand="costa"))
+        stock.is_out_of_stock("costa", "45.00")
+        ```
+    """
+
+    def __init__(self, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[str, _StockEntry] = {}
+        self._lock = threading.Lock()
+
+    def response(self, brand: str) -> Response | None:
+        """Get the cached ``check_stock`` response of a brand while it is fresh.
+
+        Args:
+            brand (str): The brand slug
+
+        Returns:
+            Response | None: The cached response or None
+        """
+        entry = self._fresh(brand)
+        return entry.response if entry is not None else None
+
+    def store(self, response: Response) -> None:
+        """Cache the stock levels of every brand in a ``check_stock`` response.
+
+        Args:
+            response (Response): The ``check_stock`` response
+        """
+        if response.status_code >= 400:
+            return
+
+        now = self._clock()
+
+        with self._lock:
+            for brand, levels in StockResponse.from_response(response).levels.items():
+                if isinstance(levels, Mapping):
+                    self._entries[brand] = _StockEntry(levels=_normalize(levels), stored_at=now, response=response)
+
+    def update(self, brand: str, levels: Mapping[str, str]) -> None:
+        with self._lock:
+            self._entries[brand] = _StockEntry(levels=_normalize(levels), stored_at=self._clock())
+
+    def level(self, brand: str, denomination: str) -> str | None:
+        """Get the cached stock level of a denomination.
+
+        Args:
+            brand (str): The brand slug
+            denomination (str): The face value (e.g. "45.00")
+
+        Returns:
+            str | None: The stock level or None when it is not cached
+        """
+        entry = self._fresh(brand)
+        key = normalize_amount(denomination)
+
+        if entry is None or key is None:
+            return None
+
+        if key in entry.out_of_stock:
+            return OUT_OF_STOCK
+
+        return entry.levels.get(key)
+
+    def is_out_of_stock(self, brand: str, denomination: str) -> bool:
+        level = self.level(brand, denomination)
+        return level is not None and level.upper() == OUT_OF_STOCK
+
+    def mark_out_of_stock(self, brand: str, denomination: str | None) -> None:
+        """Drop the cached levels of a brand after a ``DenominationNotInStock`` error.
+
+        Args:
+            brand (str): The brand slug
+            denomination (str | None): The face value that was not in stock
+        """
+        key = normalize_amount(denomination) if denomination is not None else None
+
+        with self._lock:
+            entry = self._entries.get(brand)
+            out_of_stock = entry.out_of_stock if entry is not None and self._is_fresh(entry) else set()
+
+            if key is not None:
+                out_of_stock.add(key)
+
+            self._entries[brand] = _StockEntry(levels={}, stored_at=self._clock(), out_of_stock=out_of_stock)
+
+        logger.debug("Invalidated stock of %s, %s is out of stock", brand, denomination)
+
+    def invalidate(self, brand: str) -> None:
+        with self._lock:
+            self._entries.pop(brand, None)
+
+    def _is_fresh(self, entry: _StockEntry) -> bool:
+        return self._clock() - entry.stored_at < self.ttl
+
+    def _fresh(self, brand: str) -> _StockEntry | None:
+        entry = self._entries.get(brand)
+
+        if entry is None or not self._is_fresh(entry):
+            return None
+
+        return entry
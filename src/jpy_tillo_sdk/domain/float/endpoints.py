@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from ...contracts import SignatureAttributesInterface
 from ...endpoint import Endpoint
 from ...enums import Currency
+from ...timeouts import FAST, STANDARD, TimeoutProfile
 
 
 @dataclass(frozen=True)
@@ -18,6 +19,7 @@ class CheckFloatsEndpoint(Endpoint):
     _method: str = "GET"
     _endpoint: str = "check-floats"
     _route: str = "/api/v2/check-floats"
+    _timeout: TimeoutProfile | None = FAST
 
 
 @dataclass(frozen=True)
@@ -50,3 +52,4 @@ class RequestPaymentTransferEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "float-request-payment-transfer"
     _route: str = "/api/v2/float/request-payment-transfer"
+    _timeout: TimeoutProfile | None = STANDARD
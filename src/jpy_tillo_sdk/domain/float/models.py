@@ -0,0 +1,26 @@
+from typing import Any
+
+from ...responses import ResponseField, ResponseModel
+
+
+class FloatsResponse(ResponseModel):
+    """Typed response of ``check_floats``."""
+
+    __slots__ = ()
+
+    floats = ResponseField[list[dict[str, Any]]]("data", "floats")
+
+    def float_for(self, currency: str) -> dict[str, Any] | None:
+        """Get the float of a currency.
+
+        Args:
+            currency (str): The currency code (e.g. "GBP")
+
+        Returns:
+            dict[str, Any] | None: The float or None when there is none in the currency
+        """
+        for item in self.floats or ():
+            if item.get("currency") == currency:
+                return item
+
+        return None
@@ -4,12 +4,14 @@ from typing import final
 from httpx import Response
 
 from ...contracts import FloatServiceAsyncInterface, FloatServiceInterface
+from ...timeouts import Deadline
 from .endpoints import (
     CheckFloatsEndpoint,
     CheckFloatsEndpointRequestQuery,
     RequestPaymentTransferEndpoint,
     RequestPaymentTransferEndpointRequestBody,
 )
+from .models import FloatsResponse
 
 logger = logging.getLogger("tillo.float_services")
 
@@ -19,18 +21,32 @@ class FloatService(FloatServiceInterface):
     def check_floats(
         self,
         query: CheckFloatsEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CheckFloatsEndpoint(query=query)
         response = self.client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
 
-    def request_payment_transfer(self, body: RequestPaymentTransferEndpointRequestBody) -> Response:
+    def check_floats_typed(
+        self,
+        query: CheckFloatsEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
+    ) -> FloatsResponse:
+        return FloatsResponse.from_response(self.check_floats(query=query, deadline=deadline))
+
+    def request_payment_transfer(
+        self,
+        body: RequestPaymentTransferEndpointRequestBody,
+        deadline: Deadline | None = None,
+    ) -> Response:
         endpoint = RequestPaymentTransferEndpoint(body=body)
         response = self.client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
@@ -41,18 +57,32 @@ class FloatServiceAsync(FloatServiceAsyncInterface):
     async def check_floats(
         self,
         query: CheckFloatsEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CheckFloatsEndpoint(query=query)
         response = await self.client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
 
-    async def request_payment_transfer(self, body: RequestPaymentTransferEndpointRequestBody) -> Response:
+    async def check_floats_typed(
+        self,
+        query: CheckFloatsEndpointRequestQuery | None = None,
+        deadline: Deadline | None = None,
+    ) -> FloatsResponse:
+        return FloatsResponse.from_response(await self.check_floats(query=query, deadline=deadline))
+
+    async def request_payment_transfer(
+        self,
+        body: RequestPaymentTransferEndpointRequestBody,
+        deadline: Deadline | None = None,
+    ) -> Response:
         endpoint = RequestPaymentTransferEndpoint(body=body)
         response = await self.client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
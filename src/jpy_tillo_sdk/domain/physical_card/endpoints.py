@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from ...contracts import SignatureAttributesInterface
 from ...endpoint import Endpoint
 from ...enums import Sector
+from ...timeouts import FAST, SLOW, TimeoutProfile
 from .shared import FaceValue
 
 
@@ -38,6 +39,7 @@ class ActivatePhysicalCardEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "physical-activate"
     _route: str = "/api/v2/physical/activate"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -74,6 +76,7 @@ class CancelActivateEndpoint(Endpoint):
     _method: str = "DELETE"
     _endpoint: str = "physical-activate"
     _route: str = "/api/v2/physical/activate"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -97,6 +100,7 @@ class CashOutOriginalTransactionEndpoint(Endpoint):
     _method: str = "DELETE"
     _endpoint: str = "cash-out-original-transaction"
     _route: str = "/api/v2/physical/cash-out-original-transaction"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -131,6 +135,7 @@ class TopUpPhysicalCardEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "physical-top-up"
     _route: str = "/api/v2/physical/top-up"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -152,6 +157,7 @@ class CancelTopUpEndpoint(Endpoint):
     _method: str = "DELETE"
     _endpoint: str = "physical-top-up"
     _route: str = "/api/v2/physical/top-up"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -198,6 +204,7 @@ class OrderPhysicalCardEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "physical-order-card"
     _route: str = "/api/v2/physical/order-card"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -213,6 +220,7 @@ class PhysicalCardOrderStatusEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "physical-order-status"
     _route: str = "/api/v2/physical/order-status"
+    _timeout: TimeoutProfile | None = FAST
 
 
 @dataclass(frozen=True)
@@ -232,6 +240,7 @@ class FulfilPhysicalCardOrderEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "physical-fulfil-order"
     _route: str = "/api/v2/physical/fulfil-order"
+    _timeout: TimeoutProfile | None = SLOW
 
 
 @dataclass(frozen=True)
@@ -266,3 +275,4 @@ class BalanceCheckPhysicalEndpoint(Endpoint):
     _method: str = "POST"
     _endpoint: str = "physical-check-balance"
     _route: str = "/api/v2/physical/check-balance"
+    _timeout: TimeoutProfile | None = FAST
@@ -1,8 +1,11 @@
 import logging
+from typing import TYPE_CHECKING
 
 from httpx import Response
 
 from ...contracts import PhysicalCardsAsyncServiceInterface, PhysicalCardsServiceInterface, SignatureAttributesInterface
+from ...timeouts import Deadline
+from ..brand.validation import IssuanceValidator
 from .endpoints import (
     ActivatePhysicalCardEndpoint,
     ActivatePhysicalCardERequestBody,
@@ -23,19 +26,28 @@ from .endpoints import (
     TopUpPhysicalCardRequestBody,
 )
 
+if TYPE_CHECKING:
+    from ...http_client import AsyncHttpClient, HttpClient
+
 logger = logging.getLogger("tillo.brand_physical_cards")
 
 
 class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
+    def __init__(self, *, client: "AsyncHttpClient", validator: IssuanceValidator | None = None):
+        super().__init__(client=client)
+        self.validator = validator
+
     async def activate_physical_card_async(
         self,
         query: SignatureAttributesInterface | None = None,
         body: ActivatePhysicalCardERequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = ActivatePhysicalCardEndpoint(body=body, query=query)
 
         response = await self._client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
@@ -44,21 +56,27 @@ class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelActivateRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelActivateEndpoint(body=body, query=query)
 
         response = await self._client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
 
-    async def order_status_async(self, body: PhysicalCardOrderStatusRequestBody) -> Response:
+    async def order_status_async(
+        self,
+        body: PhysicalCardOrderStatusRequestBody,
+        deadline: Deadline | None = None,
+    ) -> Response:
         endpoint = PhysicalCardOrderStatusEndpoint(
             body=body,
         )
 
-        response = await self._client.request(endpoint=endpoint)
+        response = await self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -66,11 +84,13 @@ class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: CashOutOriginalTransactionRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CashOutOriginalTransactionEndpoint(body=body, query=query)
 
         response = await self._client.request(
             endpoint=endpoint,
+            deadline=deadline,
         )
 
         return response
@@ -79,13 +99,14 @@ class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: BalanceCheckPhysicalRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = BalanceCheckPhysicalEndpoint(
             body=body,
             query=query,
         )
 
-        response = await self._client.request(endpoint=endpoint)
+        response = await self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -93,13 +114,17 @@ class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: OrderPhysicalCardRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        if self.validator is not None:
+            self.validator.validate_body(body)
+
         endpoint = OrderPhysicalCardEndpoint(
             body=body,
             query=query,
         )
 
-        response = await self._client.request(endpoint=endpoint)
+        response = await self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -107,13 +132,14 @@ class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelTopUpRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelActivateEndpoint(
             body=body,
             query=query,
         )
 
-        response = await self._client.request(endpoint=endpoint)
+        response = await self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -121,40 +147,48 @@ class PhysicalCardsAsyncService(PhysicalCardsAsyncServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: TopUpPhysicalCardRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = TopUpPhysicalCardEndpoint(
             body=body,
             query=query,
         )
 
-        response = await self._client.request(endpoint=endpoint)
+        response = await self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
     async def fulfil_physical_card_order_async(
-        self, body: FulfilPhysicalCardOrderEndpointRequestBody | None = None
+        self,
+        body: FulfilPhysicalCardOrderEndpointRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = FulfilPhysicalCardOrderEndpoint(
             body=body,
         )
 
-        response = await self._client.request(endpoint=endpoint)
+        response = await self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
 
 class PhysicalCardsService(PhysicalCardsServiceInterface):
+    def __init__(self, *, client: "HttpClient", validator: IssuanceValidator | None = None):
+        super().__init__(client=client)
+        self.validator = validator
+
     def activate_physical_card(
         self,
         query: SignatureAttributesInterface | None = None,
         body: ActivatePhysicalCardERequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = ActivatePhysicalCardEndpoint(
             body=body,
             query=query,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -162,13 +196,14 @@ class PhysicalCardsService(PhysicalCardsServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: CancelActivateRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelActivateEndpoint(
             body=body,
             query=query,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -176,37 +211,40 @@ class PhysicalCardsService(PhysicalCardsServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: CashOutOriginalTransactionRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = ActivatePhysicalCardEndpoint(
             body=body,
             query=query,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
     def top_up_physical_card(
         self,
         body: TopUpPhysicalCardRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = TopUpPhysicalCardEndpoint(
             body=body,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
     def cancel_top_up(
         self,
         body: CancelTopUpRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = CancelActivateEndpoint(
             body=body,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -214,37 +252,43 @@ class PhysicalCardsService(PhysicalCardsServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: OrderPhysicalCardRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
+        if self.validator is not None:
+            self.validator.validate_body(body)
+
         endpoint = OrderPhysicalCardEndpoint(
             body=body,
             query=query,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
     def order_status(
         self,
         body: PhysicalCardOrderStatusRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = PhysicalCardOrderStatusEndpoint(
             body=body,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
     def fulfil_order(
         self,
         body: FulfilPhysicalCardOrderEndpointRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = FulfilPhysicalCardOrderEndpoint(
             body=body,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
 
@@ -252,12 +296,13 @@ class PhysicalCardsService(PhysicalCardsServiceInterface):
         self,
         query: SignatureAttributesInterface | None = None,
         body: BalanceCheckPhysicalRequestBody | None = None,
+        deadline: Deadline | None = None,
     ) -> Response:
         endpoint = BalanceCheckPhysicalEndpoint(
             body=body,
             query=query,
         )
 
-        response = self._client.request(endpoint=endpoint)
+        response = self._client.request(endpoint=endpoint, deadline=deadline)
 
         return response
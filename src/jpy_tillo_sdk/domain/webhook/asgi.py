@@ -0,0 +1,281 @@
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, MutableMapping
+from dataclasses import dataclass
+from typing import Any
+
+from ...errors import InvalidWebhookPayload, InvalidWebhookSignature
+from .models import Webhook
+from .services import WebhookHandlerAsync, WebhookServiceAsync
+
+logger = logging.getLogger("tillo.webhook_receiver")
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+@dataclass
+class ReceiverStats:
+    """Counters of a webhook receiver.
+
+    Attributes:
+        received (int): Webhook requests received
+        accepted (int): Webhooks queued for handling
+        duplicates (int): Redelivered webhooks acknowledged without queueing
+        rejected (int): Requests rejected as invalid
+        overloaded (int): Webhooks refused because the queue was full
+        processed (int): Queued webhooks handled
+        failed (int): Queued webhooks whose handler raised
+        ack_latency (float): Total time spent answering requests in seconds
+        max_ack_latency (float): Longest time spent answering a request in seconds
+        processing_latency (float): Total time from queueing to handled in seconds
+    """
+
+    received: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    overloaded: int = 0
+    processed: int = 0
+    failed: int = 0
+    ack_latency: float = 0.0
+    max_ack_latency: float = 0.0
+    processing_latency: float = 0.0
+
+    @property
+    def mean_ack_latency(self) -> float:
+        return self.ack_latency / self.received if self.received else 0.0
+
+    @property
+    def mean_processing_latency(self) -> float:
+        handled = self.processed + self.failed
+        return self.processing_latency / handled if handled else 0.0
+
+
+class WebhookReceiver:
+    """ASGI application receiving webhooks.
+
+    A ``POST`` request is verified and decoded, put on an in-process queue and
+    acknowledged with ``202`` before it is handled. Worker tasks take webhooks
+    from the queue and call the handler. When the queue is full the request is
+    refused with ``503`` and ``Retry-After``, so Tillo delivers the webhook again
+    later instead of the receiver buffering without bound.
+
+    The workers start with the ASGI lifespan, or with ``start`` when the server
+    does not send lifespan events.
+
+    Args:
+        service (WebhookServiceAsync): Verifies, decodes and deduplicates the webhooks
+        handler (WebhookHandlerAsync): Called with every queued webhook
+        concurrency (int): Number of worker tasks
+        max_queue_size (int): Webhooks queued before requests are refused
+        max_body_size (int): Largest request body accepted, in bytes
+        retry_after (int): Seconds sent in ``Retry-After`` when the queue is full
+        stats_path (str | None): Path answering ``GET`` requests with the counters, None to disable
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+    """
+
+    def __init__(
+        self,
+        service: WebhookServiceAsync,
+        handler: WebhookHandlerAsync,
+        concurrency: int = 10,
+        max_queue_size: int = 1_000,
+        max_body_size: int = 1_048_576,
+        retry_after: int = 5,
+        stats_path: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if concurrency < 1 or max_queue_size < 1:
+            raise ValueError("Webhook receiver concurrency and max_queue_size must be at least 1.")
+
+        self.service = service
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_body_size = max_body_size
+        self.retry_after = retry_after
+        self.stats_path = stats_path
+        self.stats = ReceiverStats()
+        self._clock = clock
+        self._started_at = clock()
+        self._queue: asyncio.Queue[tuple[Webhook, float]] = asyncio.Queue(maxsize=max_queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the counters, throughput and mean latencies.
+
+        Returns:
+            dict[str, float]: The counters keyed by name
+        """
+        elapsed = self._clock() - self._started_at
+
+        return {
+            "received": self.stats.received,
+            "accepted": self.stats.accepted,
+            "duplicates": self.stats.duplicates,
+            "rejected": self.stats.rejected,
+            "overloaded": self.stats.overloaded,
+            "processed": self.stats.processed,
+            "failed": self.stats.failed,
+            "queued": self.queued,
+            "throughput": self.stats.processed / elapsed if elapsed > 0 else 0.0,
+            "mean_ack_latency": self.stats.mean_ack_latency,
+            "max_ack_latency": self.stats.max_ack_latency,
+            "mean_processing_latency": self.stats.mean_processing_latency,
+        }
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+
+        self._started_at = self._clock()
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        """Handle the queued webhooks, then stop the workers."""
+        if not self._workers:
+            return
+
+        await self._queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.stats_path is not None and scope["path"] == self.stats_path and scope["method"] == "GET":
+            await _respond(send, 200, self.snapshot())
+            return
+
+        if scope["method"] != "POST":
+            await _respond(send, 405, {"error": "Method not allowed"}, [(b"allow", b"POST")])
+            return
+
+        started = self._clock()
+        self.stats.received += 1
+
+        try:
+            status, body, headers = await self._accept(receive)
+        finally:
+            latency = self._clock() - started
+            self.stats.ack_latency += latency
+            self.stats.max_ack_latency = max(self.stats.max_ack_latency, latency)
+
+        await _respond(send, status, body, headers)
+
+    async def _accept(self, receive: Receive) -> tuple[int, dict[str, Any], list[tuple[bytes, bytes]]]:
+        json_data = await self._read_body(receive)
+
+        if json_data is None:
+            self.stats.rejected += 1
+            return 413, {"error": "Payload too large"}, []
+
+        try:
+            webhook = self.service.parse(json_data)
+        except InvalidWebhookSignature:
+            self.stats.rejected += 1
+            return 401, {"error": InvalidWebhookSignature.MESSAGE}, []
+        except InvalidWebhookPayload:
+            self.stats.rejected += 1
+            return 400, {"error": InvalidWebhookPayload.MESSAGE}, []
+
+        deduplicator = self.service.deduplicator
+
+        if deduplicator is not None and deduplicator.seen(webhook):
+            self.stats.duplicates += 1
+            return 200, {"status": "duplicate"}, []
+
+        try:
+            self._queue.put_nowait((webhook, self._clock()))
+        except asyncio.QueueFull:
+            if deduplicator is not None:
+                deduplicator.forget(webhook)
+
+            self.stats.overloaded += 1
+            logger.warning("Webhook queue full, refused %s webhook of %s", webhook.type, webhook.timestamp)
+            return 503, {"error": "Webhook queue full"}, [(b"retry-after", str(self.retry_after).encode())]
+
+        self.stats.accepted += 1
+        return 202, {"status": "accepted"}, []
+
+    async def _read_body(self, receive: Receive) -> bytes | None:
+        chunks: list[bytes] = []
+        size = 0
+
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+
+            if size > self.max_body_size:
+                return None
+
+            chunks.append(chunk)
+
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    async def _work(self) -> None:
+        while True:
+            webhook, queued_at = await self._queue.get()
+
+            try:
+                await self.service.dispatch(webhook, self.handler)
+            except Exception as e:
+                logger.warning("Handler of %s webhook of %s failed: %r", webhook.type, webhook.timestamp, e)
+                self.stats.failed += 1
+            else:
+                self.stats.processed += 1
+            finally:
+                self.stats.processing_latency += self._clock() - queued_at
+                self._queue.task_done()
+
+
+async def _respond(
+    send: Send,
+    status: int,
+    body: dict[str, Any],
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    content = json.dumps(body).encode()
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(content)).encode()),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": content})
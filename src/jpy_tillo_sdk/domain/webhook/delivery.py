@@ -0,0 +1,222 @@
+import dataclasses
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from .enums import Types
+from .models import Webhook
+
+logger = logging.getLogger("tillo.webhook_delivery")
+
+T = TypeVar("T")
+
+# Size of the digests kept per webhook, 128 bits make collisions negligible
+DIGEST_SIZE = 16
+
+
+def webhook_key(webhook: Webhook) -> bytes:
+    """Get the identity of a webhook delivery.
+
+    The key is a digest of the webhook type, timestamp and data, so a redelivered
+    webhook has the key of the first delivery whatever its certificate or version.
+
+    Args:
+        webhook (Webhook): The webhook
+
+    Returns:
+        bytes: A digest of ``DIGEST_SIZE`` bytes
+    """
+    webhook_type = webhook.type.value if isinstance(webhook.type, Types) else webhook.type
+    data = webhook.data
+
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        data = dataclasses.asdict(data)
+
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    digest.update(str(webhook_type).encode())
+    digest.update(b"\0")
+    digest.update(str(webhook.timestamp).encode())
+    digest.update(b"\0")
+    digest.update(json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode())
+
+    return digest.digest()
+
+
+class WebhookDeduplicator:
+    """Bounded memory of the webhooks seen recently.
+
+    Keys live in a ring buffer and a map of their slots: lookups are O(1) and once
+    ``capacity`` webhooks are remembered, each new one evicts the oldest.
+
+    Args:
+        capacity (int): Number of webhooks remembered
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        if capacity < 1:
+            raise ValueError("Webhook deduplicator capacity must be at least 1.")
+
+        self.capacity = capacity
+        self.duplicates = 0
+        self._ring: list[bytes | None] = [None] * capacity
+        self._position = 0
+        self._slots: dict[bytes, int] = {}
+        self._lock = threading.Lock()
+
+    def seen(self, webhook: Webhook) -> bool:
+        """Check whether a webhook was seen before, remembering it otherwise.
+
+        Args:
+            webhook (Webhook): The webhook
+
+        Returns:
+            bool: True when the webhook is a duplicate
+        """
+        key = webhook_key(webhook)
+
+        with self._lock:
+            if key in self._slots:
+                self.duplicates += 1
+                return True
+
+            evicted = self._ring[self._position]
+
+            if evicted is not None:
+                del self._slots[evicted]
+
+            self._ring[self._position] = key
+            self._slots[key] = self._position
+            self._position = (self._position + 1) % self.capacity
+
+        return False
+
+    def forget(self, webhook: Webhook) -> None:
+        """Forget a webhook, so a redelivery is processed, e.g. after its handler failed.
+
+        Args:
+            webhook (Webhook): The webhook
+        """
+        with self._lock:
+            slot = self._slots.pop(webhook_key(webhook), None)
+
+            # Free the slot, so a redelivery remembered in another slot is not evicted with it.
+            if slot is not None:
+                self._ring[slot] = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ring = [None] * self.capacity
+            self._position = 0
+            self._slots.clear()
+
+
+def timestamp_key(timestamp: str) -> tuple[int, float, str]:
+    """Get the sort key of a webhook timestamp.
+
+    Numeric timestamps are compared as numbers, other timestamps as strings after them.
+
+    Args:
+        timestamp (str): The webhook timestamp
+
+    Returns:
+        tuple[int, float, str]: The sort key
+    """
+    try:
+        return 0, float(timestamp), ""
+    except (TypeError, ValueError):
+        return 1, 0.0, str(timestamp)
+
+
+class ReorderWindow(Generic[T]):
+    """Hold webhooks for a short delay and release them in timestamp order.
+
+    A webhook is released once the earliest webhook held has waited ``delay``
+    seconds, or once more than ``max_size`` webhooks are held.
+
+    Args:
+        delay (float): Seconds a webhook is held to let earlier ones arrive
+        max_size (int): Number of webhooks held before the earliest is released
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+    """
+
+    def __init__(self, delay: float = 1.0, max_size: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        if delay < 0 or max_size < 1:
+            raise ValueError("Reorder window delay must be positive and max_size at least 1.")
+
+        self.delay = delay
+        self.max_size = max_size
+        self._clock = clock
+        self._heap: list[tuple[tuple[int, float, str], int, T]] = []
+        # Arrival order of the held webhooks, entries released out of order are skipped lazily.
+        self._arrivals: deque[tuple[float, int]] = deque()
+        self._released: set[int] = set()
+        self._sequence = itertools.count()
+
+    def push(self, webhook: Webhook, item: T) -> None:
+        """Hold a webhook.
+
+        Args:
+            webhook (Webhook): The webhook
+            item (T): Released with the webhook, e.g. the webhook itself
+        """
+        sequence = next(self._sequence)
+        heapq.heappush(self._heap, (timestamp_key(webhook.timestamp), sequence, item))
+        self._arrivals.append((self._clock(), sequence))
+
+    def pop_ready(self) -> list[T]:
+        """Release the webhooks whose delay has passed, in timestamp order.
+
+        Returns:
+            list[T]: Items of the released webhooks
+        """
+        released: list[T] = []
+        now = self._clock()
+
+        while self._heap and (len(self._heap) > self.max_size or self._oldest_arrival() + self.delay <= now):
+            _, sequence, item = heapq.heappop(self._heap)
+            self._released.add(sequence)
+            released.append(item)
+
+        return released
+
+    def flush(self) -> list[T]:
+        """Release every webhook held, in timestamp order.
+
+        Returns:
+            list[T]: Items of the released webhooks
+        """
+        released = [entry[2] for entry in sorted(self._heap)]
+        self._heap.clear()
+        self._arrivals.clear()
+        self._released.clear()
+        return released
+
+    def next_release(self) -> float | None:
+        """Get the time until the next webhook is released.
+
+        Returns:
+            float | None: Seconds until ``pop_ready`` releases a webhook, None when empty
+        """
+        if not self._heap:
+            return None
+
+        return max(0.0, self._oldest_arrival() + self.delay - self._clock())
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _oldest_arrival(self) -> float:
+        while self._arrivals[0][1] in self._released:
+            self._released.discard(self._arrivals.popleft()[1])
+
+        return self._arrivals[0][0]
@@ -1,9 +1,90 @@
 import json
+from collections.abc import Mapping
+from typing import Any
 
-from .models import Webhook
+from ...errors import InvalidWebhookPayload
+from .enums import Types
+from .models import Brand, BrandList, Status, Webhook
 
+TYPES_BY_VALUE = {webhook_type.value: webhook_type for webhook_type in Types}
 
-def handle_webhook_event(json_data: str) -> Webhook:
-    data_dict = json.loads(json_data)
 
-    return Webhook(**data_dict)
+def load_webhook_payload(json_data: str | bytes) -> dict[str, Any]:
+    """Decode the JSON body of a webhook request.
+
+    Args:
+        json_data (str | bytes): The request body
+
+    Returns:
+        dict[str, Any]: The decoded payload
+
+    Raises:
+        InvalidWebhookPayload: If the body is not a JSON object
+    """
+    try:
+        payload = json.loads(json_data)
+    except ValueError as e:
+        raise InvalidWebhookPayload() from e
+
+    if not isinstance(payload, dict):
+        raise InvalidWebhookPayload()
+
+    return payload
+
+
+def decode_webhook(payload: Mapping[str, Any]) -> Webhook:
+    """Build the typed webhook model of a decoded payload.
+
+    Known webhook types are decoded into their enum and data models, e.g. the data of
+    ``brands.status.updated`` into a ``BrandList``. The data of other types is kept as is.
+
+    Args:
+        payload (Mapping[str, Any]): The decoded payload
+
+    Returns:
+        Webhook: The webhook
+
+    Raises:
+        InvalidWebhookPayload: If a field every webhook carries is missing
+    """
+    try:
+        raw_type = payload["type"]
+        timestamp = payload["timestamp"]
+        certificate = payload["certificate"]
+        version = payload["version"]
+    except KeyError as e:
+        raise InvalidWebhookPayload() from e
+
+    webhook_type = TYPES_BY_VALUE.get(raw_type, raw_type)
+    data = payload.get("data")
+
+    if webhook_type is Types.TYPE_BRAND_STATUS_UPDATED:
+        data = decode_brand_list(data)
+
+    return Webhook(type=webhook_type, timestamp=timestamp, certificate=certificate, version=version, data=data)
+
+
+def decode_brand_list(data: object) -> BrandList:
+    if isinstance(data, BrandList):
+        return data
+
+    brands = data.get("brands") if isinstance(data, Mapping) else None
+
+    return BrandList(
+        brands=[
+            Brand(name=brand.get("name"), slug=brand.get("slug"), status=decode_status(brand.get("status")))
+            for brand in brands or ()
+            if isinstance(brand, Mapping)
+        ]
+    )
+
+
+def decode_status(value: object) -> Status:
+    if isinstance(value, Mapping):
+        return Status(code=value.get("code"), reason=value.get("reason"))
+
+    return Status(code=value if isinstance(value, str) else None)
+
+
+def handle_webhook_event(json_data: str | bytes) -> Webhook:
+    return decode_webhook(load_webhook_payload(json_data))
@@ -1,6 +1,279 @@
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .delivery import ReorderWindow, WebhookDeduplicator
+from .handlers import decode_webhook, load_webhook_payload
+from .models import Webhook
+from .verification import WebhookVerifier
+
+logger = logging.getLogger("tillo.webhook_services")
+
+WebhookHandler = Callable[[Webhook], Any]
+WebhookHandlerAsync = Callable[[Webhook], Awaitable[Any] | Any]
+
+
+@dataclass
+class WebhookBatchResult:
+    """Outcome of processing a batch of webhooks.
+
+    Attributes:
+        processed (int): Webhooks verified, decoded and handled
+        duplicates (int): Redelivered webhooks skipped
+        failed (list[tuple[int, Exception]]): Position in the batch and error of the other webhooks
+    """
+
+    processed: int = 0
+    duplicates: int = 0
+    failed: list[tuple[int, Exception]] = field(default_factory=list)
+
+
 class WebhookService:
-    pass
+    """Verify, decode and handle webhook requests.
+
+    Args:
+        verifier (WebhookVerifier | None): Checks the certificate of every webhook, None to skip the check
+        deduplicator (WebhookDeduplicator | None): Skips redelivered webhooks when processing
+    """
+
+    def __init__(self, verifier: WebhookVerifier | None = None, deduplicator: WebhookDeduplicator | None = None):
+        self.verifier = verifier
+        self.deduplicator = deduplicator
+
+    def parse(self, json_data: str | bytes) -> Webhook:
+        """Verify and decode the body of a webhook request.
+
+        Args:
+            json_data (str | bytes): The request body
+
+        Returns:
+            Webhook: The typed webhook
+
+        Raises:
+            InvalidWebhookPayload: If the body is not a webhook
+            InvalidWebhookSignature: If the certificate does not match
+        """
+        payload = load_webhook_payload(json_data)
+
+        if self.verifier is not None:
+            self.verifier.verify(payload)
+
+        return decode_webhook(payload)
+
+    def process(self, payloads: Iterable[str | bytes], handler: WebhookHandler) -> WebhookBatchResult:
+        """Parse and handle a batch of webhook request bodies.
+
+        A webhook that fails verification, decoding or handling is recorded in the
+        result and does not stop the batch. Redelivered webhooks are skipped.
+
+        Args:
+            payloads (Iterable[str | bytes]): The request bodies
+            handler (WebhookHandler): Called with every valid webhook
+
+        Returns:
+            WebhookBatchResult: The processed and failed webhooks
+        """
+        result = WebhookBatchResult()
+
+        for index, json_data in enumerate(payloads):
+            webhook = self._receive(index, json_data, result)
+
+            if webhook is None:
+                continue
+
+            try:
+                handler(webhook)
+            except Exception as e:
+                self._fail(index, webhook, e, result)
+            else:
+                result.processed += 1
+
+        return result
+
+    def _receive(self, index: int, json_data: str | bytes, result: WebhookBatchResult) -> Webhook | None:
+        try:
+            webhook = self.parse(json_data)
+        except Exception as e:
+            logger.warning("Webhook %d failed: %r", index, e)
+            result.failed.append((index, e))
+            return None
+
+        if self.deduplicator is not None and self.deduplicator.seen(webhook):
+            logger.debug("Skipped redelivered %s webhook of %s", webhook.type, webhook.timestamp)
+            result.duplicates += 1
+            return None
+
+        return webhook
+
+    def _fail(self, index: int, webhook: Webhook, error: Exception, result: WebhookBatchResult) -> None:
+        logger.warning("Webhook %d failed: %r", index, error)
+        result.failed.append((index, error))
+
+        if self.deduplicator is not None:
+            self.deduplicator.forget(webhook)
+
+
+class WebhookServiceAsync(WebhookService):
+    """Verify, decode and handle webhook requests with concurrent handlers.
+
+    Handlers may be plain functions or coroutine functions.
+
+    Args:
+        verifier (WebhookVerifier | None): Checks the certificate of every webhook, None to skip the check
+        deduplicator (WebhookDeduplicator | None): Skips redelivered webhooks when processing
+    """
+
+    async def process_async(
+        self,
+        payloads: Iterable[str | bytes],
+        handler: WebhookHandlerAsync,
+        concurrency: int = 10,
+    ) -> WebhookBatchResult:
+        """Parse and handle a batch of webhook request bodies concurrently.
+
+        Args:
+            payloads (Iterable[str | bytes]): The request bodies
+            handler (WebhookHandlerAsync): Called with every valid webhook
+            concurrency (int): Number of webhooks handled at the same time
+
+        Returns:
+            WebhookBatchResult: The processed and failed webhooks
+        """
+        if concurrency < 1:
+            raise ValueError("Webhook concurrency must be at least 1.")
+
+        result = WebhookBatchResult()
+        # Workers share the iterator, so at most ``concurrency`` handlers are pending.
+        items = iter(enumerate(payloads))
+
+        async def worker() -> None:
+            for index, json_data in items:
+                webhook = self._receive(index, json_data, result)
+
+                if webhook is not None:
+                    await self._dispatch(index, webhook, handler, result)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return result
+
+    async def consume(
+        self,
+        queue: "asyncio.Queue[str | bytes]",
+        handler: WebhookHandlerAsync,
+        concurrency: int = 10,
+        result: WebhookBatchResult | None = None,
+    ) -> None:
+        """Handle webhook request bodies from a queue until the task is cancelled.
+
+        Every item is marked done, so ``queue.join()`` waits for the queued webhooks.
+
+        Args:
+            queue (asyncio.Queue[str | bytes]): Queue of request bodies
+            handler (WebhookHandlerAsync): Called with every valid webhook
+            concurrency (int): Number of webhooks handled at the same time
+            result (WebhookBatchResult | None): Records the processed and failed webhooks
+        """
+        if concurrency < 1:
+            raise ValueError("Webhook concurrency must be at least 1.")
+
+        outcome = result if result is not None else WebhookBatchResult()
+        counter = 0
+
+        async def worker() -> None:
+            nonlocal counter
+
+            while True:
+                json_data = await queue.get()
+                index = counter
+                counter += 1
+
+                try:
+                    webhook = self._receive(index, json_data, outcome)
+
+                    if webhook is not None:
+                        await self._dispatch(index, webhook, handler, outcome)
+                finally:
+                    queue.task_done()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def consume_ordered(
+        self,
+        queue: "asyncio.Queue[str | bytes]",
+        handler: WebhookHandlerAsync,
+        window: ReorderWindow[tuple[int, Webhook]] | None = None,
+        result: WebhookBatchResult | None = None,
+    ) -> None:
+        """Handle webhook request bodies from a queue in timestamp order until the task is cancelled.
+
+        Webhooks are held in a reorder window and handled one at a time once released.
+        An item is marked done once its webhook is handled, so ``queue.join()`` waits
+        for the webhooks held in the window.
+
+        Args:
+            queue (asyncio.Queue[str | bytes]): Queue of request bodies
+            handler (WebhookHandlerAsync): Called with every valid webhook
+            window (ReorderWindow | None): The reorder window, one holding webhooks for a second when None
+            result (WebhookBatchResult | None): Records the processed and failed webhooks
+        """
+        held: ReorderWindow[tuple[int, Webhook]] = window if window is not None else ReorderWindow()
+        outcome = result if result is not None else WebhookBatchResult()
+        counter = 0
+
+        while True:
+            timeout = held.next_release()
+
+            if timeout != 0:
+                try:
+                    json_data = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    webhook = self._receive(counter, json_data, outcome)
+
+                    if webhook is None:
+                        queue.task_done()
+                    else:
+                        held.push(webhook, (counter, webhook))
+
+                    counter += 1
+
+            for index, webhook in held.pop_ready():
+                try:
+                    await self._dispatch(index, webhook, handler, outcome)
+                finally:
+                    queue.task_done()
+
+    async def dispatch(self, webhook: Webhook, handler: WebhookHandlerAsync) -> None:
+        """Call a handler with a webhook, forgetting the webhook when the handler raises.
+
+        Args:
+            webhook (Webhook): The webhook
+            handler (WebhookHandlerAsync): The handler
+        """
+        try:
+            outcome = handler(webhook)
 
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception:
+            if self.deduplicator is not None:
+                self.deduplicator.forget(webhook)
+            raise
 
-class WebhookServiceAsync:
-    pass
+    async def _dispatch(
+        self,
+        index: int,
+        webhook: Webhook,
+        handler: WebhookHandlerAsync,
+        result: WebhookBatchResult,
+    ) -> None:
+        try:
+            await self.dispatch(webhook, handler)
+        except Exception as e:
+            self._fail(index, webhook, e, result)
+        else:
+            result.processed += 1
@@ -0,0 +1,73 @@
+import hmac
+import json
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from ...errors import InvalidWebhookSignature
+from ...signature import SignatureGenerator
+
+logger = logging.getLogger("tillo.webhook_verification")
+
+CertificateSeed = Callable[[str, Mapping[str, Any]], str]
+
+
+def canonical_certificate_seed(api_key: str, payload: Mapping[str, Any]) -> str:
+    """Get the string signed into the certificate of a webhook by the canonical scheme.
+
+    The API key, webhook type, timestamp and a canonical serialization of the data
+    are joined with "-", like request signatures. The data is serialized as JSON with
+    sorted keys and no whitespace, so the certificate covers the whole webhook while
+    not depending on the key order or spacing of the request body.
+
+    Check the scheme against the certificates Tillo sends to your account before
+    relying on it, and pass another ``CertificateSeed`` otherwise.
+
+    Args:
+        api_key (str): Your Tillo API key
+        payload (Mapping[str, Any]): The decoded webhook payload
+
+    Returns:
+        str: The signed string
+    """
+    data = json.dumps(payload.get("data"), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    return "-".join((api_key, str(payload.get("type", "")), str(payload.get("timestamp", "")), data))
+
+
+class WebhookVerifier:
+    """Verify webhook certificates with the HMAC of your API credentials.
+
+    The HMAC of the ``SignatureGenerator`` is keyed once, so verifying a webhook
+    costs one copy and one digest of the signed string. Pass the generator of the
+    HTTP client, ``client.signature_generator``, to reuse its key.
+
+    Args:
+        generator (SignatureGenerator): Generator holding your API key and secret key
+        seed (CertificateSeed): Builds the signed string, e.g. ``canonical_certificate_seed``
+    """
+
+    def __init__(self, generator: SignatureGenerator, seed: CertificateSeed):
+        self._generator = generator
+        self._api_key = generator.get_api_key()
+        self._seed = seed
+
+    def certificate(self, payload: Mapping[str, Any]) -> str:
+        return self._generator.generate_signature(self._seed(self._api_key, payload))
+
+    def verify(self, payload: Mapping[str, Any]) -> None:
+        """Check the certificate of a decoded webhook payload.
+
+        Args:
+            payload (Mapping[str, Any]): The decoded webhook payload
+
+        Raises:
+            InvalidWebhookSignature: If the certificate is missing or does not match
+        """
+        certificate = payload.get("certificate")
+
+        if not isinstance(certificate, str) or not hmac.compare_digest(
+            certificate.encode(), self.certificate(payload).encode()
+        ):
+            logger.warning("Rejected %s webhook with an invalid certificate", payload.get("type"))
+            raise InvalidWebhookSignature()
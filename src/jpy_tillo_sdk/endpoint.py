@@ -6,6 +6,7 @@ from jpy_tillo_sdk.contracts import (
     EndpointInterface,
     SignatureAttributesInterface,
 )
+from jpy_tillo_sdk.timeouts import TimeoutProfile
 
 logger = logging.getLogger("tillo.endpoint")
 
@@ -15,7 +16,6 @@ class SignedEndpointInterface(EndpointInterface, ABC):
 
     @property
     def sign_attrs(self) -> tuple[str, ...]:
-        logger.debug("Getting signature attributes for request")
         _sign_attrs: list[str] = []
 
         if isinstance(self.body, SignatureAttributesInterface):
@@ -24,16 +24,14 @@ class SignedEndpointInterface(EndpointInterface, ABC):
         if isinstance(self.query, SignatureAttributesInterface):
             _sign_attrs += self.query.sign_attrs
 
-        _sign_attrs = [attr for attr in _sign_attrs if attr is not None]
-
-        logger.debug("Generated signature attributes: %s", _sign_attrs)
-        return tuple(_sign_attrs)
+        return tuple(attr for attr in _sign_attrs if attr is not None)
 
 
 class Endpoint(SignedEndpointInterface, ABC):
     _method: str
     _endpoint: str
     _route: str
+    _timeout: TimeoutProfile | None = None
     _query: Any
     _body: Any
 
@@ -73,3 +71,7 @@ class Endpoint(SignedEndpointInterface, ABC):
     @property
     def query(self) -> Any:
         return self._query
+
+    @property
+    def timeout(self) -> TimeoutProfile | None:
+        return self._timeout
@@ -9,6 +9,9 @@ The error hierarchy is organized as follows:
   - AuthenticationError
     - AuthorizationErrorInvalidAPITokenOrSecret
   - Various API-specific exceptions
+
+Error classes are indexed at import time by HTTP status and Tillo error code, see
+``find_exception_class``.
 """
 
 from httpx import Response
@@ -683,3 +686,134 @@ class InternalServerError(TilloException):
     MESSAGE: str | None = "Internal error"
     DESCRIPTION: str | None = "An internal server error occurred"
     API_VERSION: int | None = 2
+
+
+# SDK Errors
+class CircuitOpenError(TilloException):
+    """Raised instead of sending a request while the circuit of its endpoint is open.
+
+    This error occurs when recent requests to the same endpoint failed often enough
+    for the circuit breaker to stop sending them for a while.
+
+    Attributes:
+        endpoint (str): The endpoint whose circuit is open.
+        retry_after (float): Seconds until the circuit lets a probe request through.
+    """
+
+    MESSAGE: str | None = "Circuit open"
+    DESCRIPTION: str | None = "Requests to the endpoint are failing, the request was not sent"
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__()
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return f"{self.MESSAGE} for {self.endpoint}, retry in {self.retry_after:.1f}s"
+
+
+class DeadlineExceeded(TilloException):
+    """Raised when the deadline of a call passes before it completes.
+
+    This error occurs when no time is left for another attempt of a request,
+    including its retries, hedges and order status polls.
+
+    Attributes:
+        endpoint (str | None): The endpoint that was about to be requested.
+    """
+
+    MESSAGE: str | None = "Deadline exceeded"
+    DESCRIPTION: str | None = "The call did not complete before its deadline"
+
+    def __init__(self, endpoint: str | None = None) -> None:
+        super().__init__()
+        self.endpoint = endpoint
+
+    def __str__(self) -> str:
+        return f"{self.MESSAGE} for {self.endpoint}" if self.endpoint else str(self.MESSAGE)
+
+
+class DeadlineExceededInFlight(DeadlineExceeded):
+    """Raised when the deadline of a call passes while a request is in flight.
+
+    Only raised when the time left at sending covered the read timeout of the
+    endpoint, so the backend failed to answer in the time it is normally given.
+    Circuit breakers count it as a failure and adaptive concurrency limits as
+    overload. A tighter deadline of the caller raises ``DeadlineExceeded``.
+    """
+
+
+class InvalidWebhookPayload(TilloException):
+    """Raised when a webhook payload cannot be decoded.
+
+    This error occurs when the payload is not JSON or misses the fields
+    every webhook carries.
+    """
+
+    MESSAGE: str | None = "Invalid webhook payload"
+    DESCRIPTION: str | None = "The webhook payload is malformed"
+
+
+class InvalidWebhookSignature(TilloException):
+    """Raised when the certificate of a webhook does not match its content.
+
+    This error occurs when a webhook was not sent by Tillo with your
+    credentials or was altered on its way.
+    """
+
+    MESSAGE: str | None = "Invalid webhook signature"
+    DESCRIPTION: str | None = "The webhook certificate could not be verified"
+
+
+def _exception_classes(base: type[TilloException]) -> list[type[TilloException]]:
+    classes: list[type[TilloException]] = []
+
+    for subclass in base.__subclasses__():
+        classes.append(subclass)
+        classes.extend(_exception_classes(subclass))
+
+    return classes
+
+
+def _build_error_index() -> tuple[dict[tuple[int, str], type[TilloException]], dict[str, type[TilloException]]]:
+    by_status_and_code: dict[tuple[int, str], type[TilloException]] = {}
+    by_code: dict[str, type[TilloException] | None] = {}
+
+    for exception_class in _exception_classes(TilloException):
+        code = exception_class.TILLO_ERROR_CODE
+        status = exception_class.HTTP_ERROR_CODE
+
+        if code is None or status is None:
+            continue
+
+        # Classes sharing a key are resolved in favour of the one defined last.
+        by_status_and_code[(status, code)] = exception_class
+
+        if by_code.get(code, exception_class) is not exception_class:
+            by_code[code] = None
+        else:
+            by_code[code] = exception_class
+
+    return by_status_and_code, {code: cls for code, cls in by_code.items() if cls is not None}
+
+
+ERRORS_BY_STATUS_AND_CODE, ERRORS_BY_CODE = _build_error_index()
+
+
+def find_exception_class(status_code: int, code: str | None) -> type[TilloException] | None:
+    """Find the exception class matching an error response.
+
+    The class is looked up by HTTP status and Tillo error code, then by the Tillo
+    error code alone when exactly one class declares it.
+
+    Args:
+        status_code (int): HTTP status code of the response
+        code (str | None): The ``code`` field of the response body
+
+    Returns:
+        type[TilloException] | None: The matching exception class, if any
+    """
+    if code is None:
+        return None
+
+    return ERRORS_BY_STATUS_AND_CODE.get((status_code, code)) or ERRORS_BY_CODE.get(code)
@@ -0,0 +1,184 @@
+"""Tillo SDK Request Hedging Module.
+
+This module cuts the latency tail of read-only requests. When a hedged request has
+not completed after a high percentile of the recent latencies of its endpoint, the
+asynchronous client sends the same request a second time, returns whichever response
+arrives first and cancels the other one.
+
+Hedges are paid for with a budget that grows with the hedged traffic, so they never
+exceed ``max_hedge_ratio`` of the requests of the hedged endpoints, even when the
+backend is slow across the board.
+
+The module consists of two main classes:
+- HedgingPolicy: Hedged endpoints, hedge delay and budget
+- HedgingStats: Counters of the hedged requests
+
+Example:
+    ```python
+    hedging = HedgingPolicy(percentile=95.0, max_hedge_ratio=0.05)
+    client = create_client_async(
+        api_key="your_api_key",
+        secret_key="your_secret_key",
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        hedging_policy=hedging,
+    )
+
+    print(hedging.stats.hedge_ratio)
+    ```
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .contracts import EndpointInterface
+
+logger = logging.getLogger("tillo.hedging")
+
+# Tolerance of the budget sums, 10 * 0.1 must pay for a hedge
+_EPSILON = 1e-9
+
+HEDGED_ENDPOINTS = frozenset(
+    {
+        "digital-check-balance",
+        "digital-order-status",
+        "physical-check-balance",
+        "physical-order-status",
+    }
+)
+
+
+@dataclass
+class HedgingStats:
+    """Counters of the hedged requests.
+
+    Attributes:
+        requests (int): Requests to hedged endpoints
+        hedges (int): Hedge requests sent
+        hedge_wins (int): Hedge requests that completed before the original request
+        budget_exhausted (int): Hedges skipped because the budget was spent
+    """
+
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_exhausted: int = 0
+
+    @property
+    def hedge_ratio(self) -> float:
+        return self.hedges / self.requests if self.requests else 0.0
+
+
+class HedgingPolicy:
+    """Hedged endpoints, hedge delay and budget of the asynchronous client.
+
+    Only read-only endpoints may be hedged, since the request is sent twice. Every
+    attempt is sampled, including failed attempts and attempts cancelled because the
+    other one completed first. The latter are sampled at their cancellation, a lower
+    bound of their latency.
+
+    Args:
+        endpoints (Iterable[str]): Names of the hedged endpoints
+        percentile (float): Latency percentile after which a hedge is sent
+        max_hedge_ratio (float): Maximum share of hedged requests that are hedged
+        initial_delay (float): Hedge delay in seconds until enough latencies are recorded
+        min_delay (float): Lower bound of the hedge delay in seconds
+        max_delay (float): Upper bound of the hedge delay in seconds
+        window (int): Number of recent latencies kept per endpoint
+        min_samples (int): Latencies required before the percentile is used
+        max_burst (float): Budget that can be saved up for a burst of hedges
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = HEDGED_ENDPOINTS,
+        percentile: float = 95.0,
+        max_hedge_ratio: float = 0.05,
+        initial_delay: float = 0.1,
+        min_delay: float = 0.005,
+        max_delay: float = 2.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_burst: float = 10.0,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("Hedging percentile must be between 0 and 100.")
+
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("Hedging max_hedge_ratio must be between 0 and 1.")
+
+        self.endpoints = frozenset(endpoints)
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.max_burst = max_burst
+        self.stats = HedgingStats()
+        self._latencies: dict[str, deque[float]] = {}
+        self._budget = 0.0
+        self._lock = threading.Lock()
+
+    def applies(self, endpoint: EndpointInterface) -> bool:
+        return endpoint.endpoint in self.endpoints
+
+    def delay(self, endpoint: EndpointInterface) -> float:
+        """Get the time after which a hedge of a request is sent.
+
+        Args:
+            endpoint (EndpointInterface): The endpoint
+
+        Returns:
+            float: The ``percentile`` of the recent latencies of the endpoint in seconds
+        """
+        with self._lock:
+            latencies = self._latencies.get(endpoint.endpoint)
+
+            if latencies is None or len(latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(latencies)
+                delay = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * self.percentile / 100) - 1)]
+
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record(self, endpoint: EndpointInterface, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint.endpoint)
+
+            if latencies is None:
+                latencies = self._latencies[endpoint.endpoint] = deque(maxlen=self.window)
+
+            latencies.append(latency)
+
+    def start(self) -> None:
+        """Count a request to a hedged endpoint and add its share to the budget."""
+        with self._lock:
+            self.stats.requests += 1
+            self._budget = min(self.max_burst, self._budget + self.max_hedge_ratio)
+
+    def acquire_hedge(self) -> bool:
+        """Spend the budget of one hedge.
+
+        Returns:
+            bool: True when the hedge may be sent
+        """
+        with self._lock:
+            if self._budget < 1 - _EPSILON:
+                self.stats.budget_exhausted += 1
+                return False
+
+            self._budget = max(0.0, self._budget - 1)
+            self.stats.hedges += 1
+            return True
+
+    def record_win(self, endpoint: EndpointInterface) -> None:
+        with self._lock:
+            self.stats.hedge_wins += 1
+
+        logger.debug("Hedge of %s %s completed first", endpoint.method, endpoint.route)
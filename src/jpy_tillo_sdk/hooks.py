@@ -0,0 +1,148 @@
+"""Tillo SDK Request Hooks Module.
+
+This module lets applications observe every request sent by the clients, e.g. to
+feed a metrics system, without wrapping or patching them. The clients call the hooks
+when an attempt starts, when it returns a response, when it raises and before a retry.
+
+Each event carries the endpoint name used for signing, the HTTP method and route, the
+status code and Tillo error code of the response, and the time the attempt spent
+waiting for the rate limiter and concurrency permits, signing, serializing the request
+and on the network. Exceptions raised by hooks are logged and never fail a request.
+
+The module consists of four main classes:
+- RequestHooks: Base class of the hooks, every method does nothing by default
+- CompositeHooks: Hooks calling several other hooks
+- RequestEvent: An attempt of a request
+- RequestTimings: Time spent in each stage of an attempt
+
+Example:
+    ```python
+    class StatsdHooks(RequestHooks):
+        def on_response(self, event: RequestEvent) -> None:
+            statsd.timing(f"tillo.{event.endpoint}.network", event.timings.network * 1000)
+
+    client = Tillo(api_key, secret, hooks=StatsdHooks())
+    ```
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("tillo.hooks")
+
+
+@dataclass
+class RequestTimings:
+    """Time spent in each stage of an attempt, in seconds.
+
+    Attributes:
+        queueing (float): Waiting for the rate limiter and concurrency permits
+        signing (float): Signing the request
+        serialization (float): Serializing the body and query
+        network (float): Sending the request and receiving the response
+    """
+
+    queueing: float = 0.0
+    signing: float = 0.0
+    serialization: float = 0.0
+    network: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.queueing + self.signing + self.serialization + self.network
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """An attempt of a request.
+
+    Attributes:
+        endpoint (str): The endpoint name, e.g. ``digital-issue``
+        method (str): The HTTP method
+        route (str): The requested route
+        status_code (int | None): Status code of the response, if any
+        error_code (str | None): Tillo error code of an error response or exception, if any
+        timings (RequestTimings): Time spent in each stage so far
+    """
+
+    endpoint: str
+    method: str
+    route: str
+    status_code: int | None = None
+    error_code: str | None = None
+    timings: RequestTimings = field(default_factory=RequestTimings)
+
+
+class RequestHooks:
+    """Hooks called by the clients around every attempt of a request.
+
+    Subclass and override the methods of the events to observe. Hooks of the
+    asynchronous client run on the event loop and should not block.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before an attempt waits for the rate limiter.
+
+        Args:
+            event (RequestEvent): The attempt, without status code or timings
+        """
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Called when an attempt returns a response.
+
+        Error responses matching a Tillo error raise, and are reported by ``on_error``.
+
+        Args:
+            event (RequestEvent): The attempt
+        """
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        """Called when an attempt raises, including for error responses.
+
+        Args:
+            event (RequestEvent): The attempt, with the status code and Tillo error code of an error response
+            error (BaseException): The exception raised
+        """
+
+    def on_retry(self, event: RequestEvent, attempt: int, delay: float) -> None:
+        """Called before a failed request is sent again.
+
+        Args:
+            event (RequestEvent): The request, with the status code of a retried response
+            attempt (int): Number of the next attempt, starting at 2
+            delay (float): Seconds waited before the next attempt
+        """
+
+
+class CompositeHooks(RequestHooks):
+    """Call several hooks in order.
+
+    A hook that raises is logged and does not prevent the hooks after it from being called.
+
+    Args:
+        hooks (Iterable[RequestHooks]): The hooks
+    """
+
+    def __init__(self, hooks: Iterable[RequestHooks]):
+        self.hooks = tuple(hooks)
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        self._call("on_request_start", event)
+
+    def on_response(self, event: RequestEvent) -> None:
+        self._call("on_response", event)
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        self._call("on_error", event, error)
+
+    def on_retry(self, event: RequestEvent, attempt: int, delay: float) -> None:
+        self._call("on_retry", event, attempt, delay)
+
+    def _call(self, method: str, *args: Any) -> None:
+        for hooks in self.hooks:
+            try:
+                getattr(hooks, method)(*args)
+            except Exception:
+                logger.exception("Request hook %s.%s failed", type(hooks).__name__, method)
@@ -1,65 +1,103 @@
+import asyncio
 import logging
+import re
+import threading
+import time
 from abc import ABC
-from dataclasses import asdict
+from collections.abc import Callable
 from typing import Any, Generic, TypeAlias, TypeVar, cast, final
 
-from httpx import AsyncBaseTransport, AsyncClient, BaseTransport, Client, Response
+from httpx import (
+    USE_CLIENT_DEFAULT,
+    AsyncBaseTransport,
+    AsyncClient,
+    BaseTransport,
+    Client,
+    Response,
+    TimeoutException,
+)
 from httpx._client import BaseClient
 
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AdaptiveConcurrencyLimiter, Permit
 from .contracts import ClientInterface, EndpointInterface, SignatureAttributesInterface
 from .endpoint import Endpoint
-from .errors import AuthenticationFailed, InvalidIpAddress, UnprocessableContent, ValidationError
-from .signature import SignatureBridge
+from .errors import DeadlineExceeded, DeadlineExceededInFlight, InvalidIpAddress, TilloException, find_exception_class
+from .hedging import HedgingPolicy
+from .hooks import RequestEvent, RequestHooks, RequestTimings
+from .pool import PoolConfig, PoolStats, collect_pool_stats
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .serialization import SerializerRegistry, default_registry
+from .signature import SignatureBridge, SignatureGenerator
+from .single_flight import AsyncSingleFlight, SingleFlight, request_key
+from .timeouts import Deadline, cap_timeout
 
 logger = logging.getLogger("tillo.http_client")
 
+_CODE_PATTERN = re.compile(rb'"code"\s*:\s*"?([^",}\s]*)')
+
 
 class ErrorHandler:
+    """Raise the ``TilloException`` matching an error response.
+
+    Successful responses are not decoded. For error responses only the ``code``
+    field is read from the body and the exception class is found with a single
+    lookup in the index built by ``errors``.
+    """
+
     def handle(
         self,
         response: Response,
     ) -> None:
         status_code = response.status_code
-        content_code = response.json().get("code")
-
-        logger.debug(
-            "Checking response code and content code: %d - %s",
-            status_code,
-            content_code,
-        )
 
         if status_code == 201:
             logger.error("Received 201 response code, raising InvalidIpAddress")
             raise InvalidIpAddress(response)
-        elif status_code == 422:
-            if content_code == UnprocessableContent.TILLO_ERROR_CODE:
-                logger.error("Received 422 response code, invalid data")
-                raise UnprocessableContent(response)
-            elif content_code == UnprocessableContent.TILLO_ERROR_CODE:
-                logger.error("Received 401 response code, unauthorized")
-                raise ValidationError(response)
-        elif status_code == 401:
-            if content_code == AuthenticationFailed.TILLO_ERROR_CODE:
-                logger.error("Received 401 response code, unauthorized")
-                raise AuthenticationFailed(response)
+
+        if status_code < 400:
+            return
+
+        content_code = self.extract_code(response.content)
+        exception_class = find_exception_class(status_code, content_code)
+
+        if exception_class is not None:
+            logger.error(
+                "Received %d response code with Tillo code %s, raising %s",
+                status_code,
+                content_code,
+                exception_class.__name__,
+            )
+            raise exception_class(response)
+
+    @staticmethod
+    def extract_code(content: bytes) -> str | None:
+        match = _CODE_PATTERN.search(content)
+
+        return match.group(1).decode() if match else None
 
 
 class RequestDataExtractor:
     _signer: SignatureBridge
+    _serializers: SerializerRegistry
 
-    def __init__(self, signer: SignatureBridge) -> None:
+    def __init__(self, signer: SignatureBridge, serializers: SerializerRegistry | None = None) -> None:
         self._signer = signer
+        self._serializers = serializers or default_registry
 
-    def extract_request_headers(self, endpoint: EndpointInterface) -> dict[str, Any]:
-        logger.debug("Generating headers for %s %s", endpoint.method, endpoint.endpoint)
+    @property
+    def signer(self) -> SignatureBridge:
+        return self._signer
 
+    def extract_request_headers(self, endpoint: EndpointInterface) -> dict[str, Any]:
         request_api_key, request_signature, request_timestamp = self._signer.sign(
             endpoint.endpoint,
             endpoint.method,
             endpoint.sign_attrs,
         )
 
-        headers = {
+        return {
             "Accept": "application/json",
             "Content-Type": "application/json",
             "API-Key": request_api_key,
@@ -68,19 +106,16 @@ class RequestDataExtractor:
             "User-Agent": "JpyTilloSDKClient/0.3",
         }
 
-        logger.debug(
-            "Generated headers: %s",
-            {k: v for k, v in headers.items() if k not in ["Signature", "API-Key"]},
-        )
-
-        return headers
-
     def extract_request_params(self, endpoint: EndpointInterface) -> tuple[dict[str, Any] | None, ...]:
         json: dict[str, Any] | None = (
-            asdict(endpoint.body) if isinstance(endpoint.body, SignatureAttributesInterface) else None
+            self._serializers.serialize(endpoint.body)
+            if isinstance(endpoint.body, SignatureAttributesInterface)
+            else None
         )
         params: dict[str, Any] | None = (
-            asdict(endpoint.query) if isinstance(endpoint.query, SignatureAttributesInterface) else None
+            self._serializers.serialize(endpoint.query)
+            if isinstance(endpoint.query, SignatureAttributesInterface)
+            else None
         )
 
         return params, json
@@ -94,6 +129,22 @@ class RequestDataExtractor:
             json,
         )
 
+    def extract_all_timed(self, endpoint: EndpointInterface) -> tuple[tuple[dict[str, Any] | None, ...], float, float]:
+        """Extract the headers, params and body of a request, timing each stage.
+
+        Args:
+            endpoint (EndpointInterface): The endpoint
+
+        Returns:
+            tuple: The headers, params and body, the seconds spent serializing and the seconds spent signing
+        """
+        started_at = time.perf_counter()
+        params, json = self.extract_request_params(endpoint)
+        serialized_at = time.perf_counter()
+        headers = self.extract_request_headers(endpoint)
+
+        return (headers, params, json), serialized_at - started_at, time.perf_counter() - serialized_at
+
 
 TClient = TypeVar("TClient", bound=BaseClient)
 UTransport: TypeAlias = BaseTransport | AsyncBaseTransport | None
@@ -104,6 +155,8 @@ class AbstractClient(ClientInterface, ABC, Generic[TClient]):
     _error_handler: ErrorHandler
     _client: TClient | None = None
     _transport: UTransport = None
+    _pool_config: PoolConfig | None = None
+    _rate_limiter: RateLimiter | None = None
 
     def __init__(
         self,
@@ -113,47 +166,401 @@ class AbstractClient(ClientInterface, ABC, Generic[TClient]):
         error_handler: ErrorHandler,
         transport: UTransport = None,
         client: TClient | None = None,
+        pool_config: PoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hooks: RequestHooks | None = None,
     ):
         self.tillo_client_options = tillo_client_options or {}
         self._extractor = extractor
         self._error_handler = error_handler
         self._client = client
         self._transport = transport
+        self._pool_config = pool_config
+        self._rate_limiter = rate_limiter
+        self._coalesce_requests = coalesce_requests
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._hooks = hooks
+        self._client_lock = threading.Lock()
+        # A timeout configured by the caller, directly or on their own client, wins over the endpoint profiles.
+        self._timeout_profiles = client is None and "timeout" not in self.tillo_client_options
+
+    @property
+    def pool_config(self) -> PoolConfig | None:
+        return self._pool_config
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        return self._circuit_breaker
+
+    @property
+    def hooks(self) -> RequestHooks | None:
+        return self._hooks
+
+    @property
+    def signature_generator(self) -> SignatureGenerator:
+        return self._extractor.signer.generator
+
+    def pool_stats(self) -> PoolStats:
+        return collect_pool_stats(self._client)
+
+    @staticmethod
+    def _log_request(endpoint: EndpointInterface, status_code: int | None, started_at: float) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        logger.debug(
+            "%s %s -> %s in %.1fms",
+            endpoint.method,
+            endpoint.route,
+            status_code,
+            duration_ms,
+            extra={
+                "tillo_endpoint": endpoint.endpoint,
+                "tillo_method": endpoint.method,
+                "tillo_route": endpoint.route,
+                "tillo_status_code": status_code,
+                "tillo_duration_ms": duration_ms,
+            },
+        )
+
+    @staticmethod
+    def _event(
+        endpoint: EndpointInterface,
+        timings: RequestTimings | None = None,
+        response: Response | None = None,
+        error: BaseException | None = None,
+    ) -> RequestEvent:
+        if response is None and isinstance(error, TilloException):
+            response = error.response
+
+        status_code: int | None = None
+        error_code: str | None = None
+
+        if response is not None:
+            status_code = response.status_code
+
+            if status_code >= 400:
+                error_code = ErrorHandler.extract_code(response.content)
+
+        return RequestEvent(
+            endpoint=endpoint.endpoint,
+            method=endpoint.method,
+            route=endpoint.route,
+            status_code=status_code,
+            error_code=error_code or getattr(error, "TILLO_ERROR_CODE", None),
+            timings=timings or RequestTimings(),
+        )
+
+    @staticmethod
+    def _emit(hook: Callable[..., None], *args: Any) -> None:
+        try:
+            hook(*args)
+        except Exception:
+            logger.exception("Request hook %s failed", getattr(hook, "__name__", hook))
+
+    def _emit_retry(
+        self,
+        endpoint: EndpointInterface,
+        attempt: int,
+        delay: float,
+        response: Response | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        if self._hooks is not None:
+            self._emit(self._hooks.on_retry, self._event(endpoint, response=response, error=error), attempt, delay)
+
+    def _timeout(self, endpoint: EndpointInterface, deadline: Deadline | None, client: BaseClient) -> Any:
+        remaining = deadline.check(endpoint.endpoint) if deadline is not None else None
+        profile = endpoint.timeout if self._timeout_profiles else None
+
+        if profile is not None:
+            return profile.to_timeout(remaining)
+
+        if remaining is not None:
+            return cap_timeout(client.timeout, remaining)
+
+        return USE_CLIENT_DEFAULT
+
+    def _bounded_by_deadline(self, endpoint: EndpointInterface, client: BaseClient, budget: float | None) -> bool:
+        """Check whether the deadline of the call was tighter than the read timeout of the endpoint.
+
+        A request cut short by such a deadline says nothing about the health of the
+        backend, so it is not reported as a failure or overload.
+
+        Args:
+            endpoint (EndpointInterface): The endpoint
+            client (BaseClient): The client sending the request
+            budget (float | None): Seconds left until the deadline when the request was sent
+
+        Returns:
+            bool: True when the caller's deadline bounded the request
+        """
+        if budget is None:
+            return False
+
+        profile = endpoint.timeout if self._timeout_profiles else None
+        read = profile.read if profile is not None else client.timeout.read
+
+        return read is None or budget < read
+
+    def _extract(
+        self, endpoint: EndpointInterface, timings: RequestTimings | None
+    ) -> tuple[dict[str, Any] | None, ...]:
+        if timings is None:
+            return self._extractor.extract_all(endpoint)
+
+        extracted, timings.serialization, timings.signing = self._extractor.extract_all_timed(endpoint)
+        return extracted
+
+    def _client_options(self) -> dict[str, Any]:
+        if self._pool_config is None:
+            return self.tillo_client_options
+
+        return {**self._pool_config.to_client_options(), **self.tillo_client_options}
 
 
 @final
 class AsyncHttpClient(AbstractClient["AsyncClient"]):
-    async def request(self, endpoint: Endpoint) -> Response:  # type: ignore
-        headers, params, json = self._extractor.extract_all(endpoint)
+    _single_flight: AsyncSingleFlight | None = None
+    _hedging_policy: HedgingPolicy | None = None
+    _concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
 
-        if self._client is None:
-            self._client = AsyncClient(
-                transport=cast(AsyncBaseTransport, self._transport),
-                **self.tillo_client_options,
-            )
+    def __init__(
+        self,
+        tillo_client_options: dict[str, Any] | None,
+        *,
+        hedging_policy: HedgingPolicy | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(tillo_client_options, **kwargs)
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+
+    @property
+    def hedging_policy(self) -> HedgingPolicy | None:
+        return self._hedging_policy
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        return self._concurrency_limiter
+
+    async def request(self, endpoint: Endpoint, deadline: Deadline | None = None) -> Response:  # type: ignore
+        key = request_key(endpoint) if self._coalesce_requests else None
+
+        if key is None:
+            return await self._send(endpoint, deadline)
+
+        if self._single_flight is None:
+            self._single_flight = AsyncSingleFlight()
+
+        return await self._single_flight.do(key, lambda: self._send(endpoint, deadline), deadline, endpoint.endpoint)
+
+    async def _send(self, endpoint: Endpoint, deadline: Deadline | None = None) -> Response:
+        if self._retry_policy is None:
+            return await self._hedged_attempt(endpoint, deadline)
+
+        retry = self._retry_policy.start(endpoint)
+
+        while True:
+            try:
+                response = await self._hedged_attempt(endpoint, deadline)
+            except Exception as e:
+                delay = retry.after_exception(e)
+
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    raise
+
+                self._emit_retry(endpoint, retry.attempt, delay, error=e)
+            else:
+                delay = retry.after_response(response)
+
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    return response
+
+                self._emit_retry(endpoint, retry.attempt, delay, response=response)
+
+            await asyncio.sleep(delay)
+
+    async def _hedged_attempt(self, endpoint: Endpoint, deadline: Deadline | None) -> Response:
+        policy = self._hedging_policy
+
+        if policy is None or not policy.applies(endpoint):
+            return await self._attempt(endpoint, deadline)
+
+        policy.start()
+        primary = asyncio.ensure_future(self._timed_attempt(endpoint, deadline, policy))
+        tasks = [primary]
 
         try:
-            logger.debug(
-                "Sending async request to %s with method %s",
-                endpoint.route,
-                endpoint.method,
-            )
+            done, _ = await asyncio.wait(tasks, timeout=policy.delay(endpoint))
+
+            if not done and policy.acquire_hedge():
+                tasks.append(asyncio.ensure_future(self._timed_attempt(endpoint, deadline, policy)))
+
+            pending = set(tasks)
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in tasks if task in done and task.exception() is None]
 
-            response = await self._client.request(
+                if succeeded:
+                    if succeeded[0] is not primary:
+                        policy.record_win(endpoint)
+
+                    return succeeded[0].result()
+
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _timed_attempt(self, endpoint: Endpoint, deadline: Deadline | None, policy: HedgingPolicy) -> Response:
+        started_at = time.perf_counter()
+
+        try:
+            return await self._attempt(endpoint, deadline)
+        finally:
+            # A cancelled attempt is sampled at its cancellation, a lower bound of its latency.
+            policy.record(endpoint, time.perf_counter() - started_at)
+
+    async def _attempt(self, endpoint: Endpoint, deadline: Deadline | None) -> Response:
+        breaker = self._circuit_breaker
+
+        if breaker is None:
+            return await self._call(endpoint, deadline)
+
+        breaker.acquire(endpoint.endpoint)
+
+        try:
+            response = await self._call(endpoint, deadline)
+        except BaseException as e:
+            breaker.record_exception(endpoint.endpoint, e)
+            raise
+
+        breaker.record_response(endpoint.endpoint, response)
+        return response
+
+    async def _call(self, endpoint: Endpoint, deadline: Deadline | None) -> Response:
+        hooks = self._hooks
+
+        if hooks is None:
+            return await self._exchange(endpoint, deadline, None)
+
+        timings = RequestTimings()
+        self._emit(hooks.on_request_start, self._event(endpoint))
+
+        try:
+            response = await self._exchange(endpoint, deadline, timings)
+        except BaseException as e:
+            self._emit(hooks.on_error, self._event(endpoint, timings, error=e), e)
+            raise
+
+        self._emit(hooks.on_response, self._event(endpoint, timings, response))
+        return response
+
+    async def _exchange(
+        self, endpoint: Endpoint, deadline: Deadline | None, timings: RequestTimings | None
+    ) -> Response:
+        queued_at = time.perf_counter()
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(endpoint, deadline)
+
+        permit = await self._acquire_permit(endpoint, deadline) if self._concurrency_limiter is not None else None
+        error: Exception | None = None
+
+        if timings is not None:
+            timings.queueing = time.perf_counter() - queued_at
+
+        try:
+            client = self._get_client()
+            timeout = self._timeout(endpoint, deadline, client)
+            headers, params, json = self._extract(endpoint, timings)
+        except BaseException:
+            # Nothing was sent, so the permit is returned without a sample.
+            if permit is not None:
+                permit.release()
+            raise
+
+        started_at = time.perf_counter()
+        status_code: int | None = None
+        budget = deadline.remaining() if deadline is not None else None
+
+        try:
+            sending = client.request(
                 url=endpoint.route,
                 method=endpoint.method,
                 params=params,
                 json=json,
                 headers=headers,
+                timeout=timeout,
             )
-            logger.debug("Received response with status code: %d", response.status_code)
+
+            try:
+                response = await sending if budget is None else await asyncio.wait_for(sending, budget)
+            except asyncio.TimeoutError:
+                if self._bounded_by_deadline(endpoint, client, budget):
+                    raise DeadlineExceeded(endpoint.endpoint) from None
+                raise DeadlineExceededInFlight(endpoint.endpoint) from None
+            except TimeoutException as e:
+                if self._bounded_by_deadline(endpoint, client, budget):
+                    raise DeadlineExceeded(endpoint.endpoint) from e
+                raise
+
+            status_code = response.status_code
 
             if response.status_code != 200:
                 self._error_handler.handle(response)
             return response
         except Exception as e:
+            error = e
             logger.error("Error making async request to %s: %s", endpoint.route, str(e))
             raise e
+        finally:
+            latency = time.perf_counter() - started_at
+
+            if timings is not None:
+                timings.network = latency
+
+            if permit is not None:
+                permit.release(status_code, error, latency)
+
+            self._log_request(endpoint, status_code, started_at)
+
+    async def _acquire_permit(self, endpoint: Endpoint, deadline: Deadline | None) -> Permit:
+        limiter = cast(AdaptiveConcurrencyLimiter, self._concurrency_limiter)
+
+        if deadline is None:
+            return await limiter.acquire(endpoint.endpoint)
+
+        try:
+            return await asyncio.wait_for(limiter.acquire(endpoint.endpoint), deadline.check(endpoint.endpoint))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(endpoint.endpoint) from None
+
+    def _get_client(self) -> AsyncClient:
+        if self._client is None:
+            self._client = AsyncClient(
+                transport=cast(AsyncBaseTransport, self._transport),
+                **self._client_options(),
+            )
+
+        return self._client
 
     async def close_connection(self) -> None:
         if isinstance(self._client, AsyncClient):
@@ -162,30 +569,123 @@ class AsyncHttpClient(AbstractClient["AsyncClient"]):
 
 @final
 class HttpClient(AbstractClient[Client]):
+    _single_flight: SingleFlight | None = None
+
     def request(
         self,
         endpoint: Endpoint | EndpointInterface,
+        deadline: Deadline | None = None,
     ) -> Response:
-        headers, params, json = self._extractor.extract_all(endpoint)
+        key = request_key(endpoint) if self._coalesce_requests else None
 
-        if self._client is None:
-            self._client = Client(transport=cast(BaseTransport, self._transport), **self.tillo_client_options)
+        if key is None:
+            return self._send(endpoint, deadline)
+
+        if self._single_flight is None:
+            with self._client_lock:
+                if self._single_flight is None:
+                    self._single_flight = SingleFlight()
+
+        return self._single_flight.do(key, lambda: self._send(endpoint, deadline), deadline, endpoint.endpoint)
+
+    def _send(self, endpoint: Endpoint | EndpointInterface, deadline: Deadline | None = None) -> Response:
+        if self._retry_policy is None:
+            return self._attempt(endpoint, deadline)
+
+        retry = self._retry_policy.start(endpoint)
+
+        while True:
+            try:
+                response = self._attempt(endpoint, deadline)
+            except Exception as e:
+                delay = retry.after_exception(e)
+
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    raise
+
+                self._emit_retry(endpoint, retry.attempt, delay, error=e)
+            else:
+                delay = retry.after_response(response)
+
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    return response
+
+                self._emit_retry(endpoint, retry.attempt, delay, response=response)
+
+            time.sleep(delay)
+
+    def _attempt(self, endpoint: Endpoint | EndpointInterface, deadline: Deadline | None) -> Response:
+        breaker = self._circuit_breaker
+
+        if breaker is None:
+            return self._call(endpoint, deadline)
+
+        breaker.acquire(endpoint.endpoint)
 
         try:
-            logger.debug(
-                "Sending sync request to %s with method %s",
-                endpoint.route,
-                endpoint.method,
-            )
+            response = self._call(endpoint, deadline)
+        except BaseException as e:
+            breaker.record_exception(endpoint.endpoint, e)
+            raise
 
-            response = self._client.request(
-                url=endpoint.route,
-                method=endpoint.method,
-                params=params,
-                json=json,
-                headers=headers,
-            )
-            logger.debug("Received response with status code: %d", response.status_code)
+        breaker.record_response(endpoint.endpoint, response)
+        return response
+
+    def _call(self, endpoint: Endpoint | EndpointInterface, deadline: Deadline | None) -> Response:
+        hooks = self._hooks
+
+        if hooks is None:
+            return self._exchange(endpoint, deadline, None)
+
+        timings = RequestTimings()
+        self._emit(hooks.on_request_start, self._event(endpoint))
+
+        try:
+            response = self._exchange(endpoint, deadline, timings)
+        except BaseException as e:
+            self._emit(hooks.on_error, self._event(endpoint, timings, error=e), e)
+            raise
+
+        self._emit(hooks.on_response, self._event(endpoint, timings, response))
+        return response
+
+    def _exchange(
+        self,
+        endpoint: Endpoint | EndpointInterface,
+        deadline: Deadline | None,
+        timings: RequestTimings | None,
+    ) -> Response:
+        queued_at = time.perf_counter()
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(endpoint, deadline)
+
+        if timings is not None:
+            timings.queueing = time.perf_counter() - queued_at
+
+        client = self._get_client()
+        timeout = self._timeout(endpoint, deadline, client)
+        headers, params, json = self._extract(endpoint, timings)
+        started_at = time.perf_counter()
+        status_code: int | None = None
+        budget = deadline.remaining() if deadline is not None else None
+
+        try:
+            try:
+                response = client.request(
+                    url=endpoint.route,
+                    method=endpoint.method,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=timeout,
+                )
+            except TimeoutException as e:
+                if self._bounded_by_deadline(endpoint, client, budget):
+                    raise DeadlineExceeded(endpoint.endpoint) from e
+                raise
+
+            status_code = response.status_code
 
             if response.status_code != 200:
                 self._error_handler.handle(response)
@@ -194,6 +694,19 @@ class HttpClient(AbstractClient[Client]):
         except Exception as e:
             logger.error("Error making sync request to %s: %s", endpoint.route, str(e))
             raise
+        finally:
+            if timings is not None:
+                timings.network = time.perf_counter() - started_at
+
+            self._log_request(endpoint, status_code, started_at)
+
+    def _get_client(self) -> Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = Client(transport=cast(BaseTransport, self._transport), **self._client_options())
+
+        return self._client
 
     def close_connection(self) -> None:
         if self._client is not None:
@@ -13,11 +13,12 @@ Example:
         tillo_client_params={"base_url": "https://api.tillo.io"}
     )
 
-    # Create an asynchronous client
+    # Create an asynchronous client with an explicitly sized connection pool
     async_client = create_client_async(
         api_key="your_api_key",
         secret_key="your_secret_key",
-        tillo_client_params={"base_url": "https://api.tillo.io"}
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        pool_config=PoolConfig(max_connections=50),
     )
     ```
 """
@@ -25,8 +26,15 @@ Example:
 import logging
 from typing import Any
 
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AdaptiveConcurrencyLimiter
 from .errors import AuthorizationErrorInvalidAPITokenOrSecret
+from .hedging import HedgingPolicy
+from .hooks import RequestHooks
 from .http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from .pool import PoolConfig
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
 from .signature import SignatureBridge, SignatureGenerator
 
 logger = logging.getLogger("tillo.http_client_factory")
@@ -54,13 +62,34 @@ def create_signer(api_key: str, secret_key: str) -> SignatureBridge:
     return SignatureBridge(generator)
 
 
-def create_client_async(api_key: str, secret_key: str, tillo_client_params: dict[str, Any] | None) -> AsyncHttpClient:
+def create_client_async(
+    api_key: str,
+    secret_key: str,
+    tillo_client_params: dict[str, Any] | None,
+    *,
+    pool_config: PoolConfig | None = None,
+    rate_limiter: RateLimiter | None = None,
+    coalesce_requests: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    hedging_policy: HedgingPolicy | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    hooks: RequestHooks | None = None,
+) -> AsyncHttpClient:
     """Create an asynchronous HTTP client.
 
     Args:
         api_key (str): Your Tillo API key
         secret_key (str): Your Tillo secret key
         tillo_client_params (dict[str, Any]): Configuration parameters for the client
+        pool_config (PoolConfig | None): Connection pool configuration, defaults to ``PoolConfig()``
+        rate_limiter (RateLimiter | None): Limiter pacing requests per endpoint, disabled by default
+        coalesce_requests (bool): Share one request between concurrent identical GET requests
+        retry_policy (RetryPolicy | None): Retries of failed idempotent requests, disabled by default
+        circuit_breaker (CircuitBreaker | None): Fail fast on endpoints that keep failing
+        hedging_policy (HedgingPolicy | None): Hedge slow read-only requests, disabled by default
+        concurrency_limiter (AdaptiveConcurrencyLimiter | None): Adaptive in-flight limits per endpoint
+        hooks (RequestHooks | None): Hooks observing every request attempt, disabled by default
 
     Returns:
         AsyncHttpClient: A configured asynchronous HTTP client
@@ -74,6 +103,7 @@ def create_client_async(api_key: str, secret_key: str, tillo_client_params: dict
         {
             "api_key": api_key[:4] + "..." if api_key else None,
             "client_params": tillo_client_params,
+            "pool_config": pool_config,
         },
     )
 
@@ -82,7 +112,19 @@ def create_client_async(api_key: str, secret_key: str, tillo_client_params: dict
         raise AuthorizationErrorInvalidAPITokenOrSecret()
 
     signer = create_signer(api_key, secret_key)
-    client = AsyncHttpClient(tillo_client_params, error_handler=ErrorHandler(), extractor=RequestDataExtractor(signer))
+    client = AsyncHttpClient(
+        tillo_client_params,
+        error_handler=ErrorHandler(),
+        extractor=RequestDataExtractor(signer),
+        pool_config=pool_config or PoolConfig(),
+        rate_limiter=rate_limiter,
+        coalesce_requests=coalesce_requests,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        hedging_policy=hedging_policy,
+        concurrency_limiter=concurrency_limiter,
+        hooks=hooks,
+    )
     logger.debug("Asynchronous HTTP client created successfully")
     return client
 
@@ -91,6 +133,13 @@ def create_client(
     api_key: str,
     secret_key: str,
     tillo_client_params: dict[str, Any] | None,
+    *,
+    pool_config: PoolConfig | None = None,
+    rate_limiter: RateLimiter | None = None,
+    coalesce_requests: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    hooks: RequestHooks | None = None,
 ) -> HttpClient:
     """Create a synchronous HTTP client.
 
@@ -98,6 +147,12 @@ def create_client(
         api_key (str): Your Tillo API key
         secret_key (str): Your Tillo secret key
         tillo_client_params (dict[str, Any]): Configuration parameters for the client
+        pool_config (PoolConfig | None): Connection pool configuration, defaults to ``PoolConfig()``
+        rate_limiter (RateLimiter | None): Limiter pacing requests per endpoint, disabled by default
+        coalesce_requests (bool): Share one request between concurrent identical GET requests
+        retry_policy (RetryPolicy | None): Retries of failed idempotent requests, disabled by default
+        circuit_breaker (CircuitBreaker | None): Fail fast on endpoints that keep failing
+        hooks (RequestHooks | None): Hooks observing every request attempt, disabled by default
 
     Returns:
         HttpClient: A configured synchronous HTTP client
@@ -111,6 +166,7 @@ def create_client(
         {
             "api_key": api_key[:4] + "..." if api_key else None,
             "client_params": tillo_client_params,
+            "pool_config": pool_config,
         },
     )
 
@@ -119,6 +175,16 @@ def create_client(
         raise AuthorizationErrorInvalidAPITokenOrSecret()
 
     signer = create_signer(api_key, secret_key)
-    client = HttpClient(tillo_client_params, error_handler=ErrorHandler(), extractor=RequestDataExtractor(signer))
+    client = HttpClient(
+        tillo_client_params,
+        error_handler=ErrorHandler(),
+        extractor=RequestDataExtractor(signer),
+        pool_config=pool_config or PoolConfig(),
+        rate_limiter=rate_limiter,
+        coalesce_requests=coalesce_requests,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        hooks=hooks,
+    )
     logger.debug("Synchronous HTTP client created successfully")
     return client
@@ -0,0 +1,313 @@
+"""Tillo SDK Latency Metrics Module.
+
+This module keeps latency histograms of the requests sent by the clients, per endpoint
+family and status class, and renders them in the Prometheus text exposition format.
+It is a ``RequestHooks`` implementation, so it is enabled by passing it as the hooks
+of the client.
+
+Histograms are log-bucketed: bucket bounds grow by a constant factor, so every
+quantile is known within a constant relative error whatever the latency. Recording
+a latency computes the bucket index and increments a preallocated counter, cheap
+enough to leave on in production.
+
+The module consists of two main classes and a function:
+- LatencyHistogram: A log-bucketed histogram of latencies
+- LatencyMetrics: Request hooks recording the histograms per endpoint and status class
+- render_prometheus: Renders the histograms in the Prometheus text format
+
+Example:
+    ```python
+    metrics = LatencyMetrics()
+    client = Tillo(api_key, secret, hooks=metrics)
+
+    print(metrics.quantile("digital-issue", 0.99))
+    body = render_prometheus(metrics)
+    ```
+"""
+
+import math
+import threading
+from collections.abc import Iterator, Sequence
+
+from .hooks import RequestEvent, RequestHooks
+
+# Status class of a status code, by hundreds
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+# Status class of attempts that raised before a response arrived
+ERROR_STATUS_CLASS = "error"
+
+
+class LatencyHistogram:
+    """Histogram of latencies with logarithmic buckets.
+
+    Bucket ``i`` counts latencies up to ``min_value * factor ** i`` seconds, where the
+    factor is ``2 ** (1 / buckets_per_doubling)``. Latencies above ``max_value`` are
+    only counted by the overflow bucket.
+
+    Args:
+        min_value (float): Upper bound of the first bucket, in seconds
+        max_value (float): Upper bound of the last bucket, in seconds
+        buckets_per_doubling (int): Buckets between a latency and its double
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max", "_min_value", "_scale", "_overflow")
+
+    def __init__(self, min_value: float = 0.0001, max_value: float = 60.0, buckets_per_doubling: int = 4):
+        if not 0 < min_value < max_value or buckets_per_doubling < 1:
+            raise ValueError("Histogram bounds must satisfy 0 < min_value < max_value with buckets_per_doubling >= 1.")
+
+        size = math.ceil(math.log2(max_value / min_value) * buckets_per_doubling) + 1
+
+        self.bounds: tuple[float, ...] = tuple(min_value * 2 ** (i / buckets_per_doubling) for i in range(size))
+        self.counts = [0] * (size + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._min_value = min_value
+        self._scale = buckets_per_doubling / math.log(2)
+        self._overflow = size
+
+    def record(self, value: float) -> None:
+        """Count a latency.
+
+        Args:
+            value (float): The latency in seconds
+        """
+        if value <= self._min_value:
+            index = 0
+        else:
+            index = min(self._overflow, math.ceil(math.log(value / self._min_value) * self._scale - 1e-9))
+
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Get the latency below which a share of the recorded latencies fall.
+
+        Args:
+            q (float): The share, between 0 and 1
+
+        Returns:
+            float: Upper bound of the bucket holding the quantile in seconds, 0.0 when empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            seen += count
+
+            if seen >= rank:
+                return min(self.bounds[index], self.max) if index < self._overflow else self.max
+
+        return self.max
+
+    def cumulative(self) -> Iterator[tuple[float, int]]:
+        """Iterate over the bucket bounds with the number of latencies up to each bound.
+
+        Returns:
+            Iterator[tuple[float, int]]: Bounds in seconds and cumulative counts, ``inf`` last
+        """
+        seen = 0
+
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            yield bound, seen
+
+        yield math.inf, self.count
+
+    def reset(self) -> None:
+        for index in range(len(self.counts)):
+            self.counts[index] = 0
+
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class LatencyMetrics(RequestHooks):
+    """Latency histograms of the request attempts per endpoint family and status class.
+
+    The recorded latency is the total of the attempt timings: queueing, signing,
+    serialization and network. A metrics instance can be shared by the sync and
+    async clients.
+
+    Args:
+        min_value (float): Upper bound of the first bucket of every histogram, in seconds
+        max_value (float): Upper bound of the last bucket of every histogram, in seconds
+        buckets_per_doubling (int): Buckets between a latency and its double
+    """
+
+    def __init__(self, min_value: float = 0.0001, max_value: float = 60.0, buckets_per_doubling: int = 4):
+        # Fail on invalid bounds now rather than on the first request.
+        LatencyHistogram(min_value, max_value, buckets_per_doubling)
+
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_doubling = buckets_per_doubling
+        self._series: dict[str, dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def on_response(self, event: RequestEvent) -> None:
+        self.record(event.endpoint, event.status_code, event.timings.total)
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        self.record(event.endpoint, event.status_code, event.timings.total)
+
+    def record(self, endpoint: str, status_code: int | None, latency: float) -> None:
+        """Count the latency of an attempt.
+
+        Args:
+            endpoint (str): The endpoint name
+            status_code (int | None): Status code of the response, None when the attempt raised without one
+            latency (float): The latency in seconds
+        """
+        status_class = _status_class(status_code)
+
+        with self._lock:
+            by_status = self._series.get(endpoint)
+
+            if by_status is None:
+                by_status = self._series[endpoint] = {}
+
+            histogram = by_status.get(status_class)
+
+            if histogram is None:
+                histogram = by_status[status_class] = LatencyHistogram(
+                    self.min_value, self.max_value, self.buckets_per_doubling
+                )
+
+            histogram.record(latency)
+
+    def histogram(self, endpoint: str, status_class: str | None = None) -> LatencyHistogram | None:
+        """Get the histogram of an endpoint and status class, or of every status class merged.
+
+        Args:
+            endpoint (str): The endpoint name
+            status_class (str | None): The status class, e.g. ``2xx``, None to merge all of them
+
+        Returns:
+            LatencyHistogram | None: A copy of the histogram, None when nothing was recorded
+        """
+        with self._lock:
+            by_status = self._series.get(endpoint, {})
+            histograms = [h for key, h in by_status.items() if status_class is None or key == status_class]
+
+            if not histograms:
+                return None
+
+            merged = LatencyHistogram(self.min_value, self.max_value, self.buckets_per_doubling)
+
+            for histogram in histograms:
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts, strict=True)]
+                merged.count += histogram.count
+                merged.sum += histogram.sum
+                merged.max = max(merged.max, histogram.max)
+
+            return merged
+
+    def quantile(self, endpoint: str, q: float, status_class: str | None = None) -> float:
+        """Get a latency quantile of an endpoint, e.g. its p99 with ``q=0.99``.
+
+        Args:
+            endpoint (str): The endpoint name
+            q (float): The quantile, between 0 and 1
+            status_class (str | None): The status class, None for every status class
+
+        Returns:
+            float: The quantile in seconds, 0.0 when nothing was recorded
+        """
+        histogram = self.histogram(endpoint, status_class)
+        return histogram.quantile(q) if histogram is not None else 0.0
+
+    def series(self) -> list[tuple[str, str, LatencyHistogram]]:
+        """Get copies of every histogram.
+
+        Returns:
+            list[tuple[str, str, LatencyHistogram]]: Endpoint names, status classes and histograms, sorted
+        """
+        with self._lock:
+            keys = sorted((endpoint, status) for endpoint, by_status in self._series.items() for status in by_status)
+
+        series: list[tuple[str, str, LatencyHistogram]] = []
+
+        for endpoint, status_class in keys:
+            histogram = self.histogram(endpoint, status_class)
+
+            if histogram is not None:
+                series.append((endpoint, status_class, histogram))
+
+        return series
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+def render_prometheus(
+    metrics: LatencyMetrics,
+    name: str = "tillo_request_duration_seconds",
+    quantiles: Sequence[float] | None = None,
+) -> str:
+    """Render latency histograms in the Prometheus text exposition format.
+
+    Series are labelled with ``endpoint`` and ``status_class``. By default they are
+    rendered as histograms, so quantiles can be aggregated across instances with
+    ``histogram_quantile``. With ``quantiles`` they are rendered as summaries instead.
+
+    Args:
+        metrics (LatencyMetrics): The metrics to render
+        name (str): The metric name
+        quantiles (Sequence[float] | None): Quantiles of the summaries, e.g. ``(0.5, 0.99)``
+
+    Returns:
+        str: The exposition, ending with a newline
+    """
+    kind = "histogram" if quantiles is None else "summary"
+    lines = [
+        f"# HELP {name} Latency of Tillo API requests in seconds.",
+        f"# TYPE {name} {kind}",
+    ]
+
+    for endpoint, status_class, histogram in metrics.series():
+        labels = f'endpoint="{_escape(endpoint)}",status_class="{_escape(status_class)}"'
+
+        if quantiles is None:
+            for bound, count in histogram.cumulative():
+                lines.append(f'{name}_bucket{{{labels},le="{_format(bound)}"}} {count}')
+        else:
+            for q in quantiles:
+                lines.append(f'{name}{{{labels},quantile="{_format(q)}"}} {_format(histogram.quantile(q))}')
+
+        lines.append(f"{name}_sum{{{labels}}} {_format(histogram.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _status_class(status_code: int | None) -> str:
+    if status_code is None:
+        return ERROR_STATUS_CLASS
+
+    index = status_code // 100 - 1
+    return STATUS_CLASSES[index] if 0 <= index < len(STATUS_CLASSES) else ERROR_STATUS_CLASS
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    return f"{value:.6g}"
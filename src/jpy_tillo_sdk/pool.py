@@ -0,0 +1,152 @@
+"""Tillo SDK Connection Pool Module.
+
+This module provides the connection pool configuration shared by every Tillo service
+and a small helper for inspecting the state of the underlying ``httpx`` pool.
+
+The module consists of two main classes:
+- PoolConfig: Connection pool sizing, keep-alive and HTTP/2 settings
+- PoolStats: Snapshot of connections in use, idle connections and queued requests
+
+Example:
+    ```python
+    pool_config = PoolConfig(max_connections=50, keepalive_expiry=60.0)
+
+    client = create_client_async(
+        api_key="your_api_key",
+        secret_key="your_secret_key",
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        pool_config=pool_config,
+    )
+
+    stats = client.pool_stats()
+    ```
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from httpx import Limits
+from httpx._client import BaseClient
+
+logger = logging.getLogger("tillo.pool")
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool configuration applied to the underlying ``httpx`` client.
+
+    Every service created by a ``Tillo`` instance goes through the same HTTP client,
+    so a single pool is shared and kept alive across all of them.
+
+    Args:
+        max_connections (int | None): Maximum number of open connections
+        max_keepalive_connections (int | None): Maximum number of idle connections kept alive
+        keepalive_expiry (float | None): Seconds an idle connection is kept before closing
+        max_connections_per_host (int | None): Maximum number of connections to a single host
+        http2 (bool): Whether HTTP/2 is negotiated with the Tillo API
+
+    Note:
+        The SDK talks to a single Tillo host, so ``max_connections_per_host`` caps the
+        pool size when it is lower than ``max_connections``.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 30.0
+    max_connections_per_host: int | None = None
+    http2: bool = True
+
+    @property
+    def effective_max_connections(self) -> int | None:
+        """Get the connection cap after applying the per-host limit.
+
+        Returns:
+            int | None: The maximum number of connections, or None if unlimited
+        """
+        if self.max_connections_per_host is None:
+            return self.max_connections
+
+        if self.max_connections is None:
+            return self.max_connections_per_host
+
+        return min(self.max_connections, self.max_connections_per_host)
+
+    def to_limits(self) -> Limits:
+        """Build the ``httpx.Limits`` instance for this configuration.
+
+        Returns:
+            Limits: The pool limits
+        """
+        max_connections = self.effective_max_connections
+        max_keepalive_connections = self.max_keepalive_connections
+
+        if max_connections is not None and max_keepalive_connections is not None:
+            max_keepalive_connections = min(max_keepalive_connections, max_connections)
+
+        return Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def to_client_options(self) -> dict[str, Any]:
+        """Build the keyword arguments passed to ``httpx.Client``/``httpx.AsyncClient``.
+
+        Returns:
+            dict[str, Any]: The client options for the pool
+        """
+        return {
+            "limits": self.to_limits(),
+            "http2": self.http2,
+        }
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of the connection pool state.
+
+    Attributes:
+        in_use (int): Connections currently serving a request
+        idle (int): Open connections waiting to be reused
+        waiting (int): Requests queued for a free connection
+    """
+
+    in_use: int = 0
+    idle: int = 0
+    waiting: int = 0
+
+    @property
+    def total(self) -> int:
+        """Get the number of open connections.
+
+        Returns:
+            int: Connections in use plus idle connections
+        """
+        return self.in_use + self.idle
+
+
+def collect_pool_stats(client: BaseClient | None) -> PoolStats:
+    """Collect pool statistics from an ``httpx`` client.
+
+    Clients that have not been created yet, or that use a transport without a
+    connection pool (e.g. ``httpx.MockTransport``), report an empty pool.
+
+    Args:
+        client (BaseClient | None): The ``httpx`` client to inspect
+
+    Returns:
+        PoolStats: The current pool statistics
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+
+    if pool is None:
+        return PoolStats()
+
+    connections = getattr(pool, "connections", [])
+    requests = getattr(pool, "_requests", [])
+
+    idle = sum(1 for connection in connections if connection.is_idle())
+    waiting = sum(1 for request in requests if request.is_queued())
+
+    return PoolStats(in_use=len(connections) - idle, idle=idle, waiting=waiting)
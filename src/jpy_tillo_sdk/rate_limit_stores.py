@@ -0,0 +1,223 @@
+"""Tillo SDK Rate Limit Stores Module.
+
+This module provides the storage backends holding token bucket state for the
+``rate_limiter`` module. A store performs the whole refill-and-take step of a bucket
+as one atomic operation, so buckets sharing a store share a single budget.
+
+The module consists of three main classes:
+- BucketStore: Interface for token bucket state backends
+- LocalBucketStore: In-process store, also a stand-in for networked stores in tests
+- MmapBucketStore: Memory-mapped file shared by every process on a host
+
+Example:
+    ```python
+    # All worker processes on the host share the same budget
+    store = MmapBucketStore("/var/run/tillo/rate-limits.bin")
+    limiter = RateLimiter(store=store)
+    ```
+
+Note:
+    Multi-host deployments can implement ``BucketStore.reserve`` on top of a networked
+    store (e.g. an atomic script in Redis) and pass it to ``RateLimiter``.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from types import ModuleType
+
+try:
+    import fcntl as _fcntl
+
+    fcntl: ModuleType | None = _fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger("tillo.rate_limit_stores")
+
+
+def take_token(
+    tokens: float,
+    updated_at: float,
+    now: float,
+    rate: float,
+    burst: int,
+    max_delay: float | None = None,
+) -> tuple[float, float]:
+    """Refill a bucket up to its burst size and take one token from it.
+
+    Args:
+        tokens (float): Tokens in the bucket at ``updated_at``, negative when in debt
+        updated_at (float): Time of the previous update
+        now (float): Current time
+        rate (float): Tokens added per second
+        burst (int): Bucket capacity
+        max_delay (float | None): Longest acceptable wait, the token is left in the
+            bucket when the wait would reach it
+
+    Returns:
+        tuple[float, float]: Tokens left after the take and seconds to wait for the token
+    """
+    refilled = min(float(burst), tokens + max(0.0, now - updated_at) * rate)
+    tokens = refilled - 1.0
+    delay = -tokens / rate if tokens < 0 else 0.0
+
+    if max_delay is not None and delay >= max_delay:
+        return refilled, delay
+
+    return tokens, delay
+
+
+class BucketStore(ABC):
+    """Interface for token bucket state backends."""
+
+    @abstractmethod
+    def reserve(self, key: str, rate: float, burst: int, max_delay: float | None = None) -> float:
+        """Atomically refill the bucket and reserve one token.
+
+        Args:
+            key (str): Bucket name
+            rate (float): Tokens added per second
+            burst (int): Bucket capacity, also the initial number of tokens
+            max_delay (float | None): Longest acceptable wait. When the wait would
+                reach it the token is not reserved.
+
+        Returns:
+            float: Seconds the caller has to wait before using the token
+        """
+        ...
+
+
+class LocalBucketStore(BucketStore):
+    """Thread-safe in-process bucket store.
+
+    Args:
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, key: str, rate: float, burst: int, max_delay: float | None = None) -> float:
+        with self._lock:
+            now = self._clock()
+            tokens, updated_at = self._state.get(key, (float(burst), now))
+            tokens, delay = take_token(tokens, updated_at, now, rate, burst, max_delay)
+            self._state[key] = (tokens, now)
+
+        return delay
+
+
+class MmapBucketStore(BucketStore):
+    """Bucket store kept in a memory-mapped file shared between processes.
+
+    The file holds a fixed-size open addressing table of buckets. Every reservation
+    takes an exclusive ``fcntl`` lock on the file, so updates are atomic across all
+    processes mapping it, and a thread lock serialises threads of the same process.
+    Timestamps use the wall clock, which is common to every process on the host.
+
+    Args:
+        path (str | os.PathLike[str]): Path of the shared file, created when missing
+        slots (int): Number of buckets the file can hold
+        clock (Callable[[], float]): Wall clock, overridable for tests
+
+    Raises:
+        RuntimeError: If the platform does not support ``fcntl`` file locking
+        ValueError: If an existing file was created with a different layout
+    """
+
+    MAGIC: bytes = b"TILLORL1"
+    _HEADER = struct.Struct("<8sI")
+    _SLOT = struct.Struct("<48sdd")
+    KEY_SIZE: int = 48
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        slots: int = 64,
+        clock: Callable[[], float] = time.time,
+    ):
+        if fcntl is None:
+            raise RuntimeError("MmapBucketStore requires POSIX file locking (fcntl).")
+
+        self._fcntl: ModuleType = fcntl
+        self.path = os.fspath(path)
+        self.slots = slots
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._size = self._HEADER.size + slots * self._SLOT.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+            self._initialise()
+            self._mmap = mmap.mmap(self._fd, self._size)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        logger.debug("Opened shared rate limit store %s with %d slots", self.path, slots)
+
+    def _initialise(self) -> None:
+        self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX)
+
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, self._size)
+                os.pwrite(self._fd, self._HEADER.pack(self.MAGIC, self.slots), 0)
+                return
+
+            magic, slots = self._HEADER.unpack(os.pread(self._fd, self._HEADER.size, 0))
+
+            if magic != self.MAGIC or slots != self.slots:
+                raise ValueError(f"{self.path} is not a rate limit store with {self.slots} slots.")
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN)
+
+    def _slot_offset(self, key: bytes) -> int:
+        start = zlib.crc32(key) % self.slots
+
+        for probe in range(self.slots):
+            offset = self._HEADER.size + ((start + probe) % self.slots) * self._SLOT.size
+            stored_key = self._mmap[offset : offset + self.KEY_SIZE].rstrip(b"\0")
+
+            if stored_key in (key, b""):
+                return offset
+
+        raise RuntimeError(f"Rate limit store {self.path} has no free slots left.")
+
+    def reserve(self, key: str, rate: float, burst: int, max_delay: float | None = None) -> float:
+        encoded_key = key.encode("utf-8")
+
+        if len(encoded_key) > self.KEY_SIZE:
+            raise ValueError(f"Bucket key {key!r} is longer than {self.KEY_SIZE} bytes.")
+
+        with self._lock:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX)
+
+            try:
+                now = self._clock()
+                offset = self._slot_offset(encoded_key)
+                stored_key, tokens, updated_at = self._SLOT.unpack_from(self._mmap, offset)
+
+                if not stored_key.rstrip(b"\0"):
+                    tokens, updated_at = float(burst), now
+
+                tokens, delay = take_token(tokens, updated_at, now, rate, burst, max_delay)
+                self._SLOT.pack_into(self._mmap, offset, encoded_key, tokens, max(now, updated_at))
+            finally:
+                self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN)
+
+        return delay
+
+    def close(self) -> None:
+        """Unmap and close the shared file."""
+        self._mmap.close()
+        os.close(self._fd)
@@ -0,0 +1,327 @@
+"""Tillo SDK Rate Limiter Module.
+
+This module enforces the rate limits defined in ``rate_limits`` on outgoing requests.
+Each endpoint is mapped to a token bucket by its HTTP method and endpoint name, and
+requests are paced smoothly at the sustained rate of the bucket instead of bursting
+into ``429`` responses.
+
+Bucket state lives in a ``BucketStore`` from ``rate_limit_stores``, in-process by
+default or shared between processes with ``MmapBucketStore``.
+
+The module consists of three main classes:
+- BucketStats: Wait time metrics collected per bucket
+- TokenBucket: Thread-safe token bucket usable from sync and async code
+- RateLimiter: Registry mapping endpoints to their token buckets
+
+Example:
+    ```python
+    limiter = RateLimiter()
+    limiter.register(TopUpDigitalCodeEndpoint, RateLimit(100))
+
+    client = create_client_async(
+        api_key="your_api_key",
+        secret_key="your_secret_key",
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        rate_limiter=limiter,
+    )
+
+    stats = limiter.stats()
+    ```
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .contracts import EndpointInterface
+from .domain.digital_card.endpoints import (
+    CancelDigitalCodeEndpoint,
+    CheckBalanceEndpoint,
+    CheckDigitalOrderStatusAsyncEndpoint,
+    IssueDigitalCodeEndpoint,
+)
+from .endpoint import Endpoint
+from .errors import DeadlineExceeded
+from .rate_limit_stores import BucketStore, LocalBucketStore
+from .rate_limits import DigitalCheckBalance, DigitalIssue, DigitalOrderStatus, RateLimit
+from .timeouts import Deadline
+
+logger = logging.getLogger("tillo.rate_limiter")
+
+BucketKey = tuple[str, str]
+
+
+@dataclass
+class BucketStats:
+    """Wait time metrics for a single token bucket.
+
+    Attributes:
+        acquired (int): Number of permits handed out
+        delayed (int): Number of permits that had to wait
+        total_wait (float): Accumulated wait time in seconds
+        max_wait (float): Longest single wait in seconds
+    """
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Get the mean wait time per permit.
+
+        Returns:
+            float: Average wait in seconds
+        """
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class TokenBucket:
+    """Token bucket pacing requests at the sustained rate of a ``RateLimit``.
+
+    Permits are reserved atomically in the bucket store and the caller sleeps outside
+    of it, so the bucket is safe to share between threads and between sync and async
+    clients. A reservation that exceeds the available tokens puts the bucket in debt,
+    which spaces consecutive requests ``1 / rate`` seconds apart.
+
+    Args:
+        name (str): Bucket name used in metrics and as the key in the store
+        rate_limit (RateLimit): The limit enforced by the bucket
+        burst (int): Number of requests that may be sent back to back
+        clock (Callable[[], float]): Monotonic clock of the default in-process store
+        store (BucketStore | None): Store holding the bucket state, in-process by default
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_limit: RateLimit,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        store: BucketStore | None = None,
+    ):
+        if burst < 1:
+            raise ValueError("Token bucket burst must be at least 1.")
+
+        self.name = name
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self._rate = rate_limit.rate
+        self._store = store if store is not None else LocalBucketStore(clock)
+        self._lock = threading.Lock()
+        self._stats = BucketStats()
+
+    @property
+    def stats(self) -> BucketStats:
+        """Get a copy of the bucket metrics.
+
+        Returns:
+            BucketStats: Wait time metrics for the bucket
+        """
+        with self._lock:
+            return BucketStats(**vars(self._stats))
+
+    def reserve(self, max_delay: float | None = None) -> float:
+        """Reserve a permit without waiting for it.
+
+        Args:
+            max_delay (float | None): Longest acceptable wait. When the wait would
+                reach it the permit is not reserved.
+
+        Returns:
+            float: Seconds the caller has to wait before sending the request
+        """
+        delay = self._store.reserve(self.name, self._rate, self.burst, max_delay)
+
+        if max_delay is not None and delay >= max_delay:
+            return delay
+
+        with self._lock:
+            self._stats.acquired += 1
+            if delay > 0:
+                self._stats.delayed += 1
+                self._stats.total_wait += delay
+                self._stats.max_wait = max(self._stats.max_wait, delay)
+
+        return delay
+
+    def _reserve_before(self, deadline: Deadline | None, endpoint: str | None) -> float:
+        if deadline is None:
+            return self.reserve()
+
+        remaining = deadline.check(endpoint)
+        delay = self.reserve(remaining)
+
+        if delay >= remaining:
+            logger.debug("Rate limit bucket %s cannot serve %s before its deadline", self.name, endpoint)
+            raise DeadlineExceeded(endpoint)
+
+        return delay
+
+    def acquire(self, deadline: Deadline | None = None, endpoint: str | None = None) -> float:
+        """Block the current thread until a permit is available.
+
+        Args:
+            deadline (Deadline | None): Deadline of the call, bounding the wait
+            endpoint (str | None): The endpoint about to be requested, for the error
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            DeadlineExceeded: If the permit is not available before the deadline,
+                in which case no permit is used
+        """
+        delay = self._reserve_before(deadline, endpoint)
+
+        if delay > 0:
+            logger.debug("Rate limit bucket %s delaying request by %.3fs", self.name, delay)
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self, deadline: Deadline | None = None, endpoint: str | None = None) -> float:
+        """Wait for a permit without blocking the event loop.
+
+        Args:
+            deadline (Deadline | None): Deadline of the call, bounding the wait
+            endpoint (str | None): The endpoint about to be requested, for the error
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            DeadlineExceeded: If the permit is not available before the deadline,
+                in which case no permit is used
+        """
+        delay = self._reserve_before(deadline, endpoint)
+
+        if delay > 0:
+            logger.debug("Rate limit bucket %s delaying request by %.3fs", self.name, delay)
+            await asyncio.sleep(delay)
+
+        return delay
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by endpoint method and name.
+
+    By default the limits from ``rate_limits`` are registered for the endpoints they
+    describe. Endpoints without a registered limit are not throttled.
+
+    Args:
+        limits (dict | None): Custom mapping of endpoint classes to rate limits,
+            replaces the defaults when provided
+        burst (int): Number of requests per bucket that may be sent back to back
+        store (BucketStore | None): Store shared by all buckets, e.g. ``MmapBucketStore``
+            to share one budget between processes. In-process by default.
+    """
+
+    DEFAULT_LIMITS: dict[type[Endpoint], Callable[[], RateLimit]] = {
+        IssueDigitalCodeEndpoint: DigitalIssue.post,
+        CancelDigitalCodeEndpoint: DigitalIssue.delete,
+        CheckBalanceEndpoint: DigitalCheckBalance.post,
+        CheckDigitalOrderStatusAsyncEndpoint: DigitalOrderStatus.get,
+    }
+
+    def __init__(
+        self,
+        limits: dict[type[Endpoint], RateLimit] | None = None,
+        burst: int = 1,
+        store: BucketStore | None = None,
+    ):
+        self._burst = burst
+        self._store = store if store is not None else LocalBucketStore()
+        self._buckets: dict[BucketKey, TokenBucket] = {}
+
+        if limits is None:
+            limits = {endpoint: factory() for endpoint, factory in self.DEFAULT_LIMITS.items()}
+
+        for endpoint, rate_limit in limits.items():
+            self.register(endpoint, rate_limit)
+
+    @staticmethod
+    def key_for(endpoint: EndpointInterface | type[Endpoint]) -> BucketKey:
+        """Get the bucket key of an endpoint instance or class.
+
+        Args:
+            endpoint (EndpointInterface | type[Endpoint]): The endpoint
+
+        Returns:
+            tuple[str, str]: The HTTP method and endpoint name
+        """
+        if isinstance(endpoint, type):
+            return endpoint._method, endpoint._endpoint
+
+        return endpoint.method, endpoint.endpoint
+
+    def register(self, endpoint: type[Endpoint], rate_limit: RateLimit) -> TokenBucket:
+        """Register or replace the rate limit of an endpoint.
+
+        Args:
+            endpoint (type[Endpoint]): The endpoint class
+            rate_limit (RateLimit): The limit to enforce
+
+        Returns:
+            TokenBucket: The bucket created for the endpoint
+        """
+        method, name = key = self.key_for(endpoint)
+        bucket = TokenBucket(f"{method} {name}", rate_limit, burst=self._burst, store=self._store)
+        self._buckets[key] = bucket
+        logger.debug("Registered rate limit for %s: %d per %.1fs", bucket.name, rate_limit.limit, rate_limit.period)
+        return bucket
+
+    def bucket_for(self, endpoint: EndpointInterface | type[Endpoint]) -> TokenBucket | None:
+        """Get the bucket enforcing the limit of an endpoint.
+
+        Args:
+            endpoint (EndpointInterface | type[Endpoint]): The endpoint
+
+        Returns:
+            TokenBucket | None: The bucket, or None if the endpoint is not limited
+        """
+        return self._buckets.get(self.key_for(endpoint))
+
+    def acquire(self, endpoint: EndpointInterface, deadline: Deadline | None = None) -> float:
+        """Block until the endpoint may be called.
+
+        Args:
+            endpoint (EndpointInterface): The endpoint about to be requested
+            deadline (Deadline | None): Deadline of the call, bounding the wait
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            DeadlineExceeded: If the endpoint may not be called before the deadline
+        """
+        bucket = self.bucket_for(endpoint)
+        return bucket.acquire(deadline, endpoint.endpoint) if bucket is not None else 0.0
+
+    async def acquire_async(self, endpoint: EndpointInterface, deadline: Deadline | None = None) -> float:
+        """Wait until the endpoint may be called without blocking the event loop.
+
+        Args:
+            endpoint (EndpointInterface): The endpoint about to be requested
+            deadline (Deadline | None): Deadline of the call, bounding the wait
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            DeadlineExceeded: If the endpoint may not be called before the deadline
+        """
+        bucket = self.bucket_for(endpoint)
+        return await bucket.acquire_async(deadline, endpoint.endpoint) if bucket is not None else 0.0
+
+    def stats(self) -> dict[str, BucketStats]:
+        """Get wait time metrics for every bucket.
+
+        Returns:
+            dict[str, BucketStats]: Metrics keyed by bucket name
+        """
+        return {bucket.name: bucket.stats for bucket in self._buckets.values()}
@@ -33,14 +33,27 @@ class RateLimit:
     across different types of operations in the Tillo API.
     """
 
-    def __init__(self, limit: int):
+    DEFAULT_PERIOD: float = 60.0
+
+    def __init__(self, limit: int, period: float = DEFAULT_PERIOD):
         """Initialize rate limit with maximum requests per period.
 
         Args:
             limit (int): Maximum number of requests allowed per period
+            period (float): Length of the period in seconds, one minute by default
         """
         self.limit = limit
-        logger.debug("Initialized rate limit: %d requests per period", limit)
+        self.period = period
+        logger.debug("Initialized rate limit: %d requests per %.1f seconds", limit, period)
+
+    @property
+    def rate(self) -> float:
+        """Get the sustained request rate.
+
+        Returns:
+            float: Requests allowed per second
+        """
+        return self.limit / self.period
 
 
 class GC(RateLimit):
@@ -0,0 +1,124 @@
+"""Tillo SDK Response Models Module.
+
+This module provides the base for typed response models. A model keeps the raw bytes
+of an ``httpx.Response`` and decodes them only when a field is first read, so callers
+that only need a couple of values (e.g. ``status`` and ``reference``) do not pay for
+decoding and carrying a full dict tree around.
+
+Models declare ``__slots__`` and describe their fields with ``ResponseField``
+descriptors holding the path of the value in the JSON document.
+
+The module consists of two main classes:
+- ResponseField: Descriptor reading a value of the decoded payload by path
+- ResponseModel: Base class of the typed response models
+
+Example:
+    ```python
+    class OrderResponse(ResponseModel):
+        __slots__ = ()
+
+        reference = ResponseField[str]("data", "reference")
+
+    order = OrderResponse.from_response(response)
+    order.reference  # the body is decoded here
+    ```
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar, cast, overload
+
+from httpx import Response
+
+T = TypeVar("T")
+TModel = TypeVar("TModel", bound="ResponseModel")
+
+
+class ResponseField(Generic[T]):
+    """Descriptor exposing a value of the decoded payload of a ``ResponseModel``.
+
+    Args:
+        *path (str): Keys leading to the value in the JSON document
+        convert (Callable[[Any], T] | None): Applied to the raw value when it is present
+    """
+
+    __slots__ = ("_path", "_convert", "name")
+
+    def __init__(self, *path: str, convert: Callable[[Any], T] | None = None):
+        self._path = path
+        self._convert = convert
+        self.name = path[-1]
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "ResponseField[T]": ...
+
+    @overload
+    def __get__(self, instance: "ResponseModel", owner: type) -> T | None: ...
+
+    def __get__(self, instance: "ResponseModel | None", owner: type) -> "ResponseField[T] | T | None":
+        if instance is None:
+            return self
+
+        value: Any = instance.payload
+
+        for key in self._path:
+            if not isinstance(value, dict):
+                return None
+
+            value = value.get(key)
+
+        if value is None or self._convert is None:
+            return cast(T | None, value)
+
+        return self._convert(value)
+
+
+class ResponseModel:
+    """Base class of typed response models decoded lazily from the response bytes.
+
+    Args:
+        content (bytes): Raw body of the response
+        status_code (int): HTTP status code of the response
+    """
+
+    __slots__ = ("_content", "_payload", "status_code")
+
+    code = ResponseField[str]("code")
+    status = ResponseField[str]("status")
+    message = ResponseField[str]("message")
+
+    def __init__(self, content: bytes, status_code: int = 200):
+        self._content = content
+        self._payload: dict[str, Any] | None = None
+        self.status_code = status_code
+
+    @classmethod
+    def from_response(cls: type[TModel], response: Response) -> TModel:
+        """Wrap a response without decoding its body.
+
+        Args:
+            response (Response): The response returned by the client
+
+        Returns:
+            ResponseModel: The typed model of the response
+        """
+        return cls(response.content, response.status_code)
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """Decoded JSON document, parsed on first access."""
+        if self._payload is None:
+            decoded = json.loads(self._content) if self._content else {}
+            self._payload = decoded if isinstance(decoded, dict) else {}
+
+        return self._payload
+
+    @property
+    def data(self) -> Any:
+        return self.payload.get("data")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(status_code={self.status_code}, size={len(self._content)})"
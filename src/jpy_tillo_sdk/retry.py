@@ -0,0 +1,172 @@
+"""Tillo SDK Retry Module.
+
+This module decides when a failed request is sent again and how long to wait before
+the next attempt. Transport errors, ``429`` responses and server errors are retried
+with decorrelated jitter backoff, so clients recovering from an incident do not retry
+in lockstep.
+
+Every attempt goes through the client again, so it is re-signed with a fresh
+``Timestamp`` and takes its own rate limiter permit. Requests with side effects are
+only retried when they carry a ``client_request_id``, which makes them idempotent on
+Tillo's side; ``DuplicateRequestIncomplete`` is then treated as "poll again".
+
+The module consists of two main classes:
+- RetryPolicy: Configuration of the retried failures and of the backoff
+- RetryState: Attempt bookkeeping of a single request
+
+Example:
+    ```python
+    client = create_client_async(
+        api_key="your_api_key",
+        secret_key="your_secret_key",
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        retry_policy=RetryPolicy(max_attempts=4, base_delay=0.2, max_delay=10.0),
+    )
+    ```
+"""
+
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from httpx import Response, TransportError
+
+from .contracts import EndpointInterface
+from .errors import DuplicateRequestIncomplete, InternalServerError, UrlHostingServiceUnavailable
+
+logger = logging.getLogger("tillo.retry")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+    TransportError,
+    InternalServerError,
+    UrlHostingServiceUnavailable,
+    DuplicateRequestIncomplete,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Configuration of request retries.
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts per request, including the first
+        base_delay (float): Lower bound of the delay before a retry in seconds
+        max_delay (float): Upper bound of the delay before a retry in seconds
+        status_codes (frozenset[int]): Response status codes that are retried
+        exceptions (tuple[type[Exception], ...]): Exceptions that are retried
+        random (Callable[[float, float], float]): Uniform random source, overridable for tests
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+    exceptions: tuple[type[Exception], ...] = RETRYABLE_EXCEPTIONS
+    random: Callable[[float, float], float] = field(default=random.uniform, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("Retry policy max_attempts must be at least 1.")
+
+        if not 0 < self.base_delay <= self.max_delay:
+            raise ValueError("Retry policy delays must satisfy 0 < base_delay <= max_delay.")
+
+    def next_delay(self, previous: float) -> float:
+        """Get the delay before the next attempt with decorrelated jitter.
+
+        Args:
+            previous (float): The previous delay, ``base_delay`` before the first retry
+
+        Returns:
+            float: Delay in seconds between ``base_delay`` and ``max_delay``
+        """
+        return min(self.max_delay, self.random(self.base_delay, previous * 3))
+
+    @staticmethod
+    def is_idempotent(endpoint: EndpointInterface) -> bool:
+        """Check whether sending an endpoint twice has the effect of sending it once.
+
+        Args:
+            endpoint (EndpointInterface): The endpoint
+
+        Returns:
+            bool: True for ``GET`` requests and bodies carrying a ``client_request_id``
+        """
+        return endpoint.method == "GET" or bool(getattr(endpoint.body, "client_request_id", None))
+
+    def start(self, endpoint: EndpointInterface) -> "RetryState":
+        return RetryState(self, endpoint, retryable=self.is_idempotent(endpoint))
+
+
+class RetryState:
+    """Attempt bookkeeping of a single request.
+
+    Args:
+        policy (RetryPolicy): The retry policy
+        endpoint (EndpointInterface): The requested endpoint
+        retryable (bool): Whether the request may be sent again at all
+    """
+
+    def __init__(self, policy: RetryPolicy, endpoint: EndpointInterface, retryable: bool):
+        self.policy = policy
+        self.endpoint = endpoint
+        self.retryable = retryable
+        self.attempt = 1
+        self._delay = policy.base_delay
+
+    def after_response(self, response: Response) -> float | None:
+        """Decide whether a response that did not raise is retried.
+
+        Args:
+            response (Response): The response of the last attempt
+
+        Returns:
+            float | None: Seconds to wait before the next attempt, None to return the response
+        """
+        if response.status_code not in self.policy.status_codes:
+            return None
+
+        return self._next(f"HTTP {response.status_code}", _retry_after(response))
+
+    def after_exception(self, exception: Exception) -> float | None:
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            exception (Exception): The exception raised by the last attempt
+
+        Returns:
+            float | None: Seconds to wait before the next attempt, None to raise the exception
+        """
+        if not isinstance(exception, self.policy.exceptions):
+            return None
+
+        return self._next(type(exception).__name__)
+
+    def _next(self, reason: str, retry_after: float | None = None) -> float | None:
+        if not self.retryable or self.attempt >= self.policy.max_attempts:
+            return None
+
+        self._delay = self.policy.next_delay(self._delay)
+        delay = max(self._delay, min(retry_after or 0.0, self.policy.max_delay))
+        self.attempt += 1
+
+        logger.debug(
+            "Retrying %s %s after %s, attempt %d in %.3fs",
+            self.endpoint.method,
+            self.endpoint.route,
+            reason,
+            self.attempt,
+            delay,
+        )
+        return delay
+
+
+def _retry_after(response: Response) -> float | None:
+    value = response.headers.get("Retry-After")
+
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
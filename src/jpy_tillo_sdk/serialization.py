@@ -0,0 +1,145 @@
+"""Tillo SDK Request Serialization Module.
+
+This module turns request dataclasses into the JSON bodies and query parameters sent
+to the Tillo API. The first time a dataclass is seen, a flat encoder function is
+generated for it and cached, replacing the recursive deep copy of ``dataclasses.asdict``.
+
+Encoders drop ``None`` fields, convert enums (e.g. ``Currency``) to their values and
+encode nested dataclasses with their own cached encoders.
+
+The module consists of one main class:
+- SerializerRegistry: Generates and caches an encoder per dataclass
+
+Example:
+    ```python
+    registry = SerializerRegistry()
+    payload = registry.serialize(IssueDigitalCodeRequestBody(client_request_id="id", brand="costa"))
+    # {"client_request_id": "id", "brand": "costa"}
+    ```
+"""
+
+import dataclasses
+import threading
+import types
+import typing
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+Encoder = Callable[[Any], dict[str, Any]]
+
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _annotation_members(annotation: Any) -> tuple[Any, ...]:
+    if isinstance(annotation, types.UnionType) or typing.get_origin(annotation) is typing.Union:
+        return typing.get_args(annotation)
+
+    return (annotation,)
+
+
+def _is_enum_type(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
+
+
+class SerializerRegistry:
+    """Registry generating and caching a flat encoder per request dataclass.
+
+    Fields annotated with primitive types are copied as-is, fields annotated with a
+    single enum are replaced by their value, and any other field goes through a
+    generic encoder handling nested dataclasses, enums, lists and dicts.
+    """
+
+    def __init__(self) -> None:
+        self._encoders: dict[type, Encoder] = {}
+        self._lock = threading.Lock()
+
+    def encoder_for(self, cls: type) -> Encoder:
+        """Get the encoder of a dataclass, generating it on first use.
+
+        Args:
+            cls (type): The dataclass type
+
+        Returns:
+            Callable: Function encoding an instance of ``cls`` into a dict
+        """
+        encoder = self._encoders.get(cls)
+
+        if encoder is None:
+            with self._lock:
+                encoder = self._encoders.get(cls)
+
+                if encoder is None:
+                    encoder = self._compile(cls)
+                    self._encoders[cls] = encoder
+
+        return encoder
+
+    def serialize(self, obj: Any) -> dict[str, Any]:
+        """Encode a dataclass instance into a dict without ``None`` fields.
+
+        Args:
+            obj (Any): The dataclass instance
+
+        Returns:
+            dict[str, Any]: The encoded payload
+        """
+        return self.encoder_for(type(obj))(obj)
+
+    def encode_value(self, value: Any) -> Any:
+        """Encode a value of a field without a statically known encoding.
+
+        Args:
+            value (Any): The field value
+
+        Returns:
+            Any: The JSON compatible value
+        """
+        if isinstance(value, Enum):
+            return value.value
+
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return self.serialize(value)
+
+        if isinstance(value, (list, tuple)):
+            return [self.encode_value(item) for item in value if item is not None]
+
+        if isinstance(value, dict):
+            return {key: self.encode_value(item) for key, item in value.items() if item is not None}
+
+        return value
+
+    def _compile(self, cls: type) -> Encoder:
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{cls.__name__} is not a dataclass and cannot be serialized.")
+
+        lines = [f"def encode_{cls.__name__}(obj):", "    result = {}"]
+
+        for field in dataclasses.fields(cls):
+            members = _annotation_members(field.type)
+            non_none_members = [member for member in members if member is not type(None)]
+
+            # ``str`` enums such as ``Currency`` are commonly passed to ``str`` fields.
+            if all(member in _PRIMITIVE_TYPES for member in members) or (
+                len(non_none_members) == 1 and _is_enum_type(non_none_members[0])
+            ):
+                expression = "value.value if isinstance(value, Enum) else value"
+            else:
+                expression = "encode_value(value)"
+
+            lines += [
+                f"    value = obj.{field.name}",
+                "    if value is not None:",
+                f"        result[{field.name!r}] = {expression}",
+            ]
+
+        lines.append("    return result")
+
+        namespace: dict[str, Any] = {"Enum": Enum, "encode_value": self.encode_value}
+        exec("\n".join(lines), namespace)
+
+        encoder: Encoder = namespace[f"encode_{cls.__name__}"]
+        return encoder
+
+
+default_registry = SerializerRegistry()
@@ -50,6 +50,9 @@ class SignatureGenerator(SignatureGeneratorInterface):
     Note:
         The API key and secret key should be kept secure and never exposed
         in client-side code or public repositories.
+
+        The HMAC is keyed once at construction and copied for every signature,
+        so the secret key is not re-encoded and re-hashed per request.
     """
 
     def __init__(self, api_key: str, secret_key: str):
@@ -61,6 +64,7 @@ class SignatureGenerator(SignatureGeneratorInterface):
         """
         self.__api_key = api_key
         self.__secret_key = secret_key
+        self.__hmac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
         logger.debug("Initialized SignatureGenerator")
 
     def get_api_key(self) -> str:
@@ -69,7 +73,6 @@ class SignatureGenerator(SignatureGeneratorInterface):
         Returns:
             str: The API key
         """
-        logger.debug("Retrieving API key")
         return self.__api_key
 
     def get_secret_key_as_bytes(self) -> bytearray:
@@ -88,9 +91,7 @@ class SignatureGenerator(SignatureGeneratorInterface):
         Returns:
             str: Current timestamp in milliseconds as a string
         """
-        timestamp = str(int(round(time.time() * 1000)))
-        logger.debug("Generated timestamp: %s", timestamp)
-        return timestamp
+        return str(int(round(time.time() * 1000)))
 
     @staticmethod
     def generate_unique_client_request_id() -> uuid.UUID:
@@ -120,27 +121,10 @@ class SignatureGenerator(SignatureGeneratorInterface):
         Returns:
             str: The string to be signed
         """
-        logger.debug(
-            "Generating signature string: %s",
-            {
-                "endpoint": endpoint,
-                "request_type": request_type,
-                "timestamp": timestamp,
-                "params": params,
-            },
+        return "-".join(
+            (self.__api_key, request_type, endpoint, *[str(v) for v in params or () if v is not None], timestamp)
         )
 
-        query: str = ""
-
-        if params and len(params):
-            for v in params:
-                if v is not None:
-                    query += f"-{v}"
-
-        signature_string = f"{self.__api_key}-{request_type}-{endpoint}{query}-{timestamp}"
-        logger.debug("Generated signature string: %s", signature_string)
-        return signature_string
-
     def generate_signature(self, seed: str) -> str:
         """Generate HMAC-SHA256 signature for the given string.
 
@@ -150,11 +134,9 @@ class SignatureGenerator(SignatureGeneratorInterface):
         Returns:
             str: The hexadecimal HMAC-SHA256 signature
         """
-        logger.debug("Generating HMAC-SHA256 signature for seed")
-        signature_hmac = hmac.new(self.get_secret_key_as_bytes(), bytearray(seed, "utf-8"), hashlib.sha256)
-        signature = str(signature_hmac.hexdigest())
-        logger.debug("Generated signature: %s", signature)
-        return signature
+        signature_hmac = self.__hmac.copy()
+        signature_hmac.update(seed.encode("utf-8"))
+        return signature_hmac.hexdigest()
 
 
 class SignatureBridge(SignatureBridgeInterface):
@@ -170,6 +152,9 @@ class SignatureBridge(SignatureBridgeInterface):
     Note:
         This class acts as a bridge between the HTTP client and the signature
         generation logic, providing a clean interface for request signing.
+
+        Signing is on the hot path of every request and does not log; the HTTP
+        client emits a single debug record per request instead.
     """
 
     __signature_generator: SignatureGenerator
@@ -183,6 +168,10 @@ class SignatureBridge(SignatureBridgeInterface):
         self.__signature_generator = signature_generator
         logger.debug("Initialized SignatureBridge")
 
+    @property
+    def generator(self) -> SignatureGenerator:
+        return self.__signature_generator
+
     def sign(
         self,
         endpoint: str,
@@ -213,16 +202,6 @@ class SignatureBridge(SignatureBridgeInterface):
             )
             ```
         """
-        logger.info("Generating signature for %s %s", method, endpoint)
-        logger.debug(
-            "Signature request details: %s",
-            {
-                "endpoint": endpoint,
-                "method": method,
-                "sign_attrs": sign_attrs,
-            },
-        )
-
         request_timestamp = self.__signature_generator.generate_timestamp()
 
         signature_string = self.__signature_generator.generate_signature_string(
@@ -236,13 +215,4 @@ class SignatureBridge(SignatureBridgeInterface):
 
         request_api_key = self.__signature_generator.get_api_key()
 
-        logger.debug(
-            "Generated signature components: %s",
-            {
-                "api_key": request_api_key,
-                "timestamp": request_timestamp,
-                "signature_length": len(request_signature),
-            },
-        )
-
         return request_api_key, request_signature, request_timestamp
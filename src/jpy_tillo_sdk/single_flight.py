@@ -0,0 +1,199 @@
+"""Tillo SDK Request Coalescing Module.
+
+This module coalesces concurrent identical read-only requests into a single HTTP call
+whose result (or exception) is shared by every caller. Only ``GET`` endpoints are
+coalesced, keyed by their endpoint class and query dataclass, so requests with side
+effects are always sent.
+
+Every caller waits for the shared call within its own deadline: a caller whose
+deadline passes first raises ``DeadlineExceeded`` while the call completes for the
+others.
+
+The module consists of two main classes:
+- SingleFlight: Thread-safe coalescing for the synchronous client
+- AsyncSingleFlight: Coalescing of concurrent coroutines for the asynchronous client
+
+Example:
+    ```python
+    client = create_client_async(
+        api_key="your_api_key",
+        secret_key="your_secret_key",
+        tillo_client_params={"base_url": "https://api.tillo.io"},
+        coalesce_requests=True,
+    )
+
+    # One request to /api/v2/brands is sent
+    await asyncio.gather(*(brands.get_available_brands(query) for _ in range(100)))
+    ```
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar, cast
+
+from .contracts import EndpointInterface
+from .errors import DeadlineExceeded
+from .timeouts import Deadline
+
+logger = logging.getLogger("tillo.single_flight")
+
+T = TypeVar("T")
+
+COALESCED_METHODS = frozenset({"GET"})
+
+
+def request_key(endpoint: EndpointInterface) -> Hashable | None:
+    """Get the key identifying identical read-only requests.
+
+    Args:
+        endpoint (EndpointInterface): The endpoint about to be requested
+
+    Returns:
+        Hashable | None: The key, or None when the request must not be coalesced
+    """
+    if endpoint.method not in COALESCED_METHODS:
+        return None
+
+    key = (type(endpoint), endpoint.route, endpoint.query)
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Share the result of a call between threads making it concurrently."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        deadline: Deadline | None = None,
+        endpoint: str | None = None,
+    ) -> T:
+        """Run ``fn`` unless a call with the same key is in flight, then wait for it.
+
+        Args:
+            key (Hashable): Key identifying identical calls
+            fn (Callable[[], T]): The call
+            deadline (Deadline | None): Deadline of the caller, bounding the wait for a call in flight
+            endpoint (str | None): The endpoint requested, for the error
+
+        Returns:
+            T: The result of the call shared by every caller
+
+        Raises:
+            DeadlineExceeded: If the deadline passes while waiting for a call in flight
+        """
+        with self._lock:
+            existing: _Call[T] | None = self._calls.get(key)
+
+            if existing is None:
+                call: _Call[T] = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if existing is not None:
+            return self._wait(existing, deadline, endpoint)
+
+        try:
+            result = fn()
+            call.result = result
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+            call.done.set()
+
+    @staticmethod
+    def _wait(call: _Call[T], deadline: Deadline | None, endpoint: str | None) -> T:
+        if deadline is None:
+            call.done.wait()
+        elif not call.done.wait(timeout=deadline.check(endpoint)):
+            raise DeadlineExceeded(endpoint)
+
+        if call.error is not None:
+            raise call.error
+
+        return cast(T, call.result)
+
+
+class AsyncSingleFlight:
+    """Share the result of a coroutine between tasks awaiting it concurrently."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        deadline: Deadline | None = None,
+        endpoint: str | None = None,
+    ) -> T:
+        """Await ``fn`` unless a call with the same key is in flight, then await it.
+
+        The call runs in its own task, so it completes for the remaining callers
+        when one of them is cancelled or runs out of time.
+
+        Args:
+            key (Hashable): Key identifying identical calls
+            fn (Callable[[], Awaitable[T]]): The coroutine function
+            deadline (Deadline | None): Deadline of the caller, bounding its wait for the call
+            endpoint (str | None): The endpoint requested, for the error
+
+        Returns:
+            T: The result of the call shared by every caller
+
+        Raises:
+            DeadlineExceeded: If the deadline passes while waiting for the call
+        """
+        task = self._tasks.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        if deadline is None:
+            result: T = await asyncio.shield(task)
+            return result
+
+        try:
+            return cast(T, await asyncio.wait_for(asyncio.shield(task), deadline.check(endpoint)))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(endpoint) from None
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        if not task.cancelled():
+            task.exception()
@@ -1,22 +1,34 @@
 from typing import Any
 
-from .contracts import DigitalCardServiceInterface, TemplateServiceAsyncInterface, TilloInterface
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AdaptiveConcurrencyLimiter
+from .contracts import TemplateServiceAsyncInterface, TilloInterface
+from .domain.brand.cache import BrandCache
 from .domain.brand.services import (
     BrandService,
     BrandServiceAsync,
     TemplateService,
     TemplateServiceAsync,
 )
+from .domain.brand.validation import IssuanceValidator
 from .domain.digital_card.services import (
     DigitalCardService,
     DigitalCardServiceAsync,
 )
+from .domain.digital_card.stock import StockCache
 from .domain.float.services import FloatService, FloatServiceAsync
 from .domain.physical_card.services import PhysicalCardsAsyncService, PhysicalCardsService
+from .domain.webhook.delivery import WebhookDeduplicator
 from .domain.webhook.services import WebhookService, WebhookServiceAsync
+from .domain.webhook.verification import CertificateSeed, WebhookVerifier
 from .errors import AuthorizationErrorInvalidAPITokenOrSecret
+from .hedging import HedgingPolicy
+from .hooks import RequestHooks
 from .http_client import AsyncHttpClient, HttpClient
 from .http_client_factory import create_client, create_client_async
+from .pool import PoolConfig
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
 
 # TBrandService = TypeVar('TBrandService', bound=ServiceInterface)
 
@@ -31,6 +43,19 @@ class Tillo(TilloInterface):
         api_key (str): The API key for authentication.
         secret (str): The secret key for authentication.
         options (dict | None): Additional configuration options for the client.
+        pool_config (PoolConfig | None): Connection pool configuration shared by all services.
+        rate_limiter (RateLimiter | None): Rate limiter shared by the sync and async clients.
+        brand_cache (BrandCache | None): Cache of brand list responses shared by the brand services.
+        issuance_validator (IssuanceValidator | None): Pre-flight validation of digital and physical card orders.
+        stock_cache (StockCache | None): Stock levels shared by the digital card services.
+        coalesce_requests (bool): Share one request between concurrent identical GET requests.
+        retry_policy (RetryPolicy | None): Retries of failed idempotent requests by both clients.
+        circuit_breaker (CircuitBreaker | None): Circuit breakers per endpoint shared by both clients.
+        hedging_policy (HedgingPolicy | None): Hedging of slow read-only requests by the async client.
+        concurrency_limiter (AdaptiveConcurrencyLimiter | None): Adaptive in-flight limits of the async client.
+        webhook_deduplicator (WebhookDeduplicator | None): Skips redelivered webhooks in both webhook services.
+        webhook_certificate_seed (CertificateSeed | None): Scheme of webhook certificates, None to skip verification.
+        hooks (RequestHooks | None): Hooks observing every request attempt of both clients.
 
     Raises:
         AuthorizationErrorInvalidAPITokenOrSecret: If either api_key or secret is None.
@@ -41,6 +66,20 @@ class Tillo(TilloInterface):
         api_key: str,
         secret: str,
         options: dict[str, Any] | None = None,
+        *,
+        pool_config: PoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        brand_cache: BrandCache | None = None,
+        issuance_validator: IssuanceValidator | None = None,
+        stock_cache: StockCache | None = None,
+        coalesce_requests: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        webhook_deduplicator: WebhookDeduplicator | None = None,
+        webhook_certificate_seed: CertificateSeed | None = None,
+        hooks: RequestHooks | None = None,
     ):
         if api_key is None or secret is None:
             raise AuthorizationErrorInvalidAPITokenOrSecret()
@@ -48,6 +87,19 @@ class Tillo(TilloInterface):
         self.__api_key = api_key
         self.__secret = secret
         self.__options = options
+        self.__pool_config = pool_config
+        self.__rate_limiter = rate_limiter
+        self.__brand_cache = brand_cache
+        self.__issuance_validator = issuance_validator
+        self.__stock_cache = stock_cache
+        self.__coalesce_requests = coalesce_requests
+        self.__retry_policy = retry_policy
+        self.__circuit_breaker = circuit_breaker
+        self.__hedging_policy = hedging_policy
+        self.__concurrency_limiter = concurrency_limiter
+        self.__webhook_deduplicator = webhook_deduplicator
+        self.__webhook_certificate_seed = webhook_certificate_seed
+        self.__hooks = hooks
         self.__async_http_client: AsyncHttpClient = self.__get_async_client()
         self.__http_client: HttpClient = self.__get_client()
 
@@ -96,7 +148,7 @@ class Tillo(TilloInterface):
             BrandService: Service for managing brand-related operations.
         """
         if self.__brands is None:
-            self.__brands = BrandService(client=self.__http_client)
+            self.__brands = BrandService(client=self.__http_client, cache=self.__brand_cache)
 
         return self.__brands
 
@@ -108,7 +160,7 @@ class Tillo(TilloInterface):
             BrandService: Service for managing brand-related operations.
         """
         if self.__brands_async is None:
-            self.__brands_async = BrandServiceAsync(client=self.__async_http_client)
+            self.__brands_async = BrandServiceAsync(client=self.__async_http_client, cache=self.__brand_cache)
 
         return self.__brands_async
 
@@ -137,7 +189,7 @@ class Tillo(TilloInterface):
         return self.__brand_templates_async
 
     @property
-    def digital_card(self) -> DigitalCardServiceInterface:
+    def digital_card(self) -> DigitalCardService:
         """Get the digital card service instance.
 
         Note: This feature is not yet implemented.
@@ -146,7 +198,9 @@ class Tillo(TilloInterface):
             DigitalCardService: Service for managing digital card operations.
         """
         if self.__digital_card is None:
-            self.__digital_card = DigitalCardService(client=self.__http_client)
+            self.__digital_card = DigitalCardService(
+                client=self.__http_client, validator=self.__issuance_validator, stock_cache=self.__stock_cache
+            )
 
         return self.__digital_card
 
@@ -161,51 +215,67 @@ class Tillo(TilloInterface):
 
         """
         if self.__digital_card_async is None:
-            self.__digital_card_async = DigitalCardServiceAsync(client=self.__async_http_client)
+            self.__digital_card_async = DigitalCardServiceAsync(
+                client=self.__async_http_client, validator=self.__issuance_validator, stock_cache=self.__stock_cache
+            )
 
         return self.__digital_card_async
 
     @property
     def physical_card(self) -> PhysicalCardsService:
         if self.__physical_card is None:
-            self.__physical_card = PhysicalCardsService(client=self.__http_client)
+            self.__physical_card = PhysicalCardsService(client=self.__http_client, validator=self.__issuance_validator)
 
         return self.__physical_card
 
     @property
     def physical_card_async(self) -> PhysicalCardsAsyncService:
         if self.__physical_card_async is None:
-            self.__physical_card_async = PhysicalCardsAsyncService(client=self.__async_http_client)
+            self.__physical_card_async = PhysicalCardsAsyncService(
+                client=self.__async_http_client, validator=self.__issuance_validator
+            )
 
         return self.__physical_card_async
 
     @property
-    def webhook(self) -> None:
+    def webhook(self) -> WebhookService:
         """Get the webhook service instance.
 
-        Note: This feature is not yet implemented.
+        Webhook certificates are verified with your API key and secret key when a
+        ``webhook_certificate_seed`` is given.
 
         Returns:
-            WebhookService: Service for managing webhook operations.
-
-        Raises:
-            NotImplementedError: This feature is not yet implemented.
+            WebhookService: Service for verifying, decoding and handling webhooks.
         """
-        raise NotImplementedError("Webhook service is not yet implemented")
+        if self.__webhook is None:
+            self.__webhook = WebhookService(
+                verifier=self.__get_webhook_verifier(), deduplicator=self.__webhook_deduplicator
+            )
+
+        return self.__webhook
 
     @property
-    async def webhook_async(self) -> None:
-        """Get the webhook service instance.
+    def webhook_async(self) -> WebhookServiceAsync:
+        """Get the asynchronous webhook service instance.
 
-        Note: This feature is not yet implemented.
+        Webhook certificates are verified with your API key and secret key when a
+        ``webhook_certificate_seed`` is given.
 
         Returns:
-            WebhookService: Service for managing webhook operations.
-
-        Raises:
-            NotImplementedError: This feature is not yet implemented.
+            WebhookServiceAsync: Service for verifying, decoding and concurrently handling webhooks.
         """
-        raise NotImplementedError("Webhook service is not yet implemented")
+        if self.__webhook_async is None:
+            self.__webhook_async = WebhookServiceAsync(
+                verifier=self.__get_webhook_verifier(), deduplicator=self.__webhook_deduplicator
+            )
+
+        return self.__webhook_async
+
+    def __get_webhook_verifier(self) -> WebhookVerifier | None:
+        if self.__webhook_certificate_seed is None:
+            return None
+
+        return WebhookVerifier(self.__http_client.signature_generator, self.__webhook_certificate_seed)
 
     def __get_async_client(self) -> AsyncHttpClient:
         """Create and return an asynchronous HTTP client.
@@ -213,7 +283,19 @@ class Tillo(TilloInterface):
         Returns:
             AsyncHttpClient: Configured asynchronous HTTP client instance.
         """
-        return create_client_async(self.__api_key, self.__secret, self.__options)
+        return create_client_async(
+            self.__api_key,
+            self.__secret,
+            self.__options,
+            pool_config=self.__pool_config,
+            rate_limiter=self.__rate_limiter,
+            coalesce_requests=self.__coalesce_requests,
+            retry_policy=self.__retry_policy,
+            circuit_breaker=self.__circuit_breaker,
+            hedging_policy=self.__hedging_policy,
+            concurrency_limiter=self.__concurrency_limiter,
+            hooks=self.__hooks,
+        )
 
     def __get_client(self) -> HttpClient:
         """Create and return a synchronous HTTP client.
@@ -221,7 +303,17 @@ class Tillo(TilloInterface):
         Returns:
             HttpClient: Configured synchronous HTTP client instance.
         """
-        return create_client(self.__api_key, self.__secret, self.__options)
+        return create_client(
+            self.__api_key,
+            self.__secret,
+            self.__options,
+            pool_config=self.__pool_config,
+            rate_limiter=self.__rate_limiter,
+            coalesce_requests=self.__coalesce_requests,
+            retry_policy=self.__retry_policy,
+            circuit_breaker=self.__circuit_breaker,
+            hooks=self.__hooks,
+        )
 
     def close_sync(self) -> None:
         self.__http_client.close_connection()
@@ -0,0 +1,169 @@
+"""Tillo SDK Timeouts Module.
+
+This module provides timeout profiles attached to endpoint classes and deadlines
+attached to calls. A quick ``check-floats`` request fails after a few seconds while
+``digital/issue`` is given the time issuance takes, instead of both sharing the
+timeouts of the ``httpx`` client.
+
+Profiles are only used while the caller has not configured a timeout of their own.
+A ``timeout`` in the client options, or a prebuilt ``httpx`` client, is applied to
+every endpoint as before.
+
+A deadline bounds a whole call: rate limiting, every retry and backoff, hedges and
+order status polling. Before each attempt the timeouts of the endpoint profile are
+capped by the time left, and a call whose deadline has passed raises
+``DeadlineExceeded`` instead of sending another request.
+
+The module consists of two main classes:
+- TimeoutProfile: Connect, read, write and pool timeouts of an endpoint class
+- Deadline: Point in time by which a call must complete
+
+Example:
+    ```python
+    deadline = Deadline.after(2.0)
+
+    response = await tillo.floats_async.check_floats(deadline=deadline)
+    ```
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from httpx import Timeout
+
+from .errors import DeadlineExceeded
+
+logger = logging.getLogger("tillo.timeouts")
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    """Timeouts of the requests to an endpoint, in seconds.
+
+    Attributes:
+        connect (float): Time to establish a connection
+        read (float): Time to wait for a chunk of the response
+        write (float): Time to send a chunk of the request
+        pool (float): Time to wait for a connection from the pool
+    """
+
+    connect: float
+    read: float
+    write: float
+    pool: float
+
+    def to_timeout(self, remaining: float | None = None) -> Timeout:
+        """Get the ``httpx`` timeout, capped by the time left until a deadline.
+
+        Args:
+            remaining (float | None): Seconds left until the deadline of the call
+
+        Returns:
+            Timeout: The timeout of a request
+        """
+        if remaining is None:
+            return Timeout(connect=self.connect, read=self.read, write=self.write, pool=self.pool)
+
+        return Timeout(
+            connect=min(self.connect, remaining),
+            read=min(self.read, remaining),
+            write=min(self.write, remaining),
+            pool=min(self.pool, remaining),
+        )
+
+
+def cap_timeout(timeout: Timeout, remaining: float) -> Timeout:
+    """Cap every timeout of an ``httpx`` timeout by the time left until a deadline.
+
+    Args:
+        timeout (Timeout): The timeout, e.g. the default of the client
+        remaining (float): Seconds left until the deadline of the call
+
+    Returns:
+        Timeout: The capped timeout, unset timeouts are set to the time left
+    """
+    return Timeout(
+        connect=remaining if timeout.connect is None else min(timeout.connect, remaining),
+        read=remaining if timeout.read is None else min(timeout.read, remaining),
+        write=remaining if timeout.write is None else min(timeout.write, remaining),
+        pool=remaining if timeout.pool is None else min(timeout.pool, remaining),
+    )
+
+
+# Balance, stock, float and status checks
+FAST = TimeoutProfile(connect=2.0, read=5.0, write=5.0, pool=2.0)
+# Brand lists and templates
+STANDARD = TimeoutProfile(connect=5.0, read=15.0, write=15.0, pool=5.0)
+# Issuance, top ups, cancellations and other requests moving value
+SLOW = TimeoutProfile(connect=5.0, read=60.0, write=15.0, pool=5.0)
+
+
+class Deadline:
+    """Point in time by which a call must complete.
+
+    Args:
+        expires_at (float): Expiry on the clock, in seconds
+        clock (Callable[[], float]): Monotonic clock, overridable for tests
+    """
+
+    __slots__ = ("expires_at", "_clock")
+
+    def __init__(self, expires_at: float, clock: Callable[[], float] = time.monotonic):
+        self.expires_at = expires_at
+        self._clock = clock
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> "Deadline":
+        """Create a deadline a number of seconds from now.
+
+        Args:
+            seconds (float): Time budget of the call
+            clock (Callable[[], float]): Monotonic clock, overridable for tests
+
+        Returns:
+            Deadline: The deadline
+        """
+        return cls(clock() + seconds, clock)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self._clock() >= self.expires_at
+
+    def allows(self, delay: float) -> bool:
+        """Check whether waiting ``delay`` seconds still leaves time for a request.
+
+        Args:
+            delay (float): Seconds to wait, e.g. a retry backoff
+
+        Returns:
+            bool: True when the deadline does not pass during the wait
+        """
+        return self._clock() + delay < self.expires_at
+
+    def check(self, endpoint: str | None = None) -> float:
+        """Get the time left, raising when the deadline has passed.
+
+        Args:
+            endpoint (str | None): The endpoint about to be requested, for the error
+
+        Returns:
+            float: Seconds left until the deadline
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        remaining = self.expires_at - self._clock()
+
+        if remaining <= 0:
+            logger.debug("Deadline of %s exceeded by %.3fs", endpoint, -remaining)
+            raise DeadlineExceeded(endpoint)
+
+        return remaining
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
@@ -0,0 +1,195 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from httpx import Response
+
+from jpy_tillo_sdk.domain.brand.cache import BrandCache
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpointRequestQuery
+from jpy_tillo_sdk.domain.brand.services import BrandService, BrandServiceAsync
+from jpy_tillo_sdk.errors import DeadlineExceeded
+from jpy_tillo_sdk.timeouts import Deadline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _brands(*slugs: str) -> Response:
+    return Response(200, json={"code": "000", "data": {"brands": list(slugs)}})
+
+
+def test_sync_lookups_are_served_from_memory_until_ttl() -> None:
+    clock = FakeClock()
+    cache = BrandCache(ttl=10, clock=clock)
+    fetch = Mock(side_effect=[_brands("costa"), _brands("costa", "amazon-de")])
+    query = BrandEndpointRequestQuery(detail=True)
+
+    first = cache.get(query, fetch)
+    assert cache.get(BrandEndpointRequestQuery(detail=True), fetch) is first
+
+    clock.now = 11
+    assert cache.get(query, fetch) is not first
+
+    assert fetch.call_count == 2
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_entries_are_keyed_by_query_fields() -> None:
+    cache = BrandCache()
+    fetch = Mock(side_effect=lambda: _brands("costa"))
+
+    cache.get(BrandEndpointRequestQuery(currency="GBP"), fetch)
+    cache.get(BrandEndpointRequestQuery(currency="EUR"), fetch)
+    cache.get(None, fetch)
+    cache.get(None, fetch)
+
+    assert fetch.call_count == 3
+    assert len(cache) == 3
+
+
+def test_error_responses_are_not_cached() -> None:
+    cache = BrandCache()
+    fetch = Mock(return_value=Response(503, json={}))
+
+    cache.get(None, fetch)
+    cache.get(None, fetch)
+
+    assert fetch.call_count == 2
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = BrandCache(max_entries=2)
+    fetch = Mock(side_effect=lambda: _brands("costa"))
+
+    for brand in ("a", "b", "a", "c"):
+        cache.get(BrandEndpointRequestQuery(brand=brand), fetch)
+
+    cache.get(BrandEndpointRequestQuery(brand="a"), fetch)
+
+    assert fetch.call_count == 3
+    assert cache.stats.hits == 2
+
+
+async def test_stale_entries_are_served_while_refreshed_in_background() -> None:
+    clock = FakeClock()
+    cache = BrandCache(ttl=10, stale_ttl=5, clock=clock)
+    refreshed = _brands("costa", "amazon-de")
+    fetch = AsyncMock(side_effect=[_brands("costa"), refreshed])
+
+    first = await cache.get_async(None, fetch)
+
+    clock.now = 12
+    assert await cache.get_async(None, fetch) is first
+    assert await cache.get_async(None, fetch) is first
+    await asyncio.sleep(0)
+
+    assert await cache.get_async(None, fetch) is refreshed
+    assert fetch.await_count == 2
+    assert cache.stats.stale_hits == 2
+    assert cache.stats.refreshes == 1
+
+
+async def test_expired_stale_entries_are_misses() -> None:
+    clock = FakeClock()
+    cache = BrandCache(ttl=10, stale_ttl=5, clock=clock)
+    fetch = AsyncMock(side_effect=lambda: _brands("costa"))
+
+    first = await cache.get_async(None, fetch)
+    clock.now = 20
+
+    assert await cache.get_async(None, fetch) is not first
+    assert cache.stats.misses == 2
+
+
+async def test_concurrent_misses_share_one_request() -> None:
+    cache = BrandCache()
+    release = asyncio.Event()
+
+    async def fetch() -> Response:
+        await release.wait()
+        return _brands("costa")
+
+    spy = AsyncMock(side_effect=fetch)
+    waiters = [asyncio.ensure_future(cache.get_async(None, spy)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    responses = await asyncio.gather(*waiters)
+
+    assert spy.await_count == 1
+    assert all(response is responses[0] for response in responses)
+
+
+async def test_failed_background_refresh_keeps_stale_entry() -> None:
+    clock = FakeClock()
+    cache = BrandCache(ttl=10, stale_ttl=5, clock=clock)
+    fetch = AsyncMock(side_effect=[_brands("costa"), RuntimeError("boom")])
+
+    first = await cache.get_async(None, fetch)
+    clock.now = 11
+    await cache.get_async(None, fetch)
+    for _ in range(2):
+        await asyncio.sleep(0)
+
+    assert await cache.get_async(None, fetch) is first
+    assert cache.stats.refresh_errors == 1
+
+
+def test_brand_service_uses_cache(mock_http_client: Mock) -> None:
+    mock_http_client.request.return_value = _brands("costa")
+    service = BrandService(client=mock_http_client, cache=BrandCache())
+
+    service.get_available_brands(BrandEndpointRequestQuery(detail=True))
+    service.get_available_brands(BrandEndpointRequestQuery(detail=True))
+
+    mock_http_client.request.assert_called_once()
+
+
+async def test_brand_service_async_uses_cache(mock_async_http_client: AsyncMock) -> None:
+    mock_async_http_client.request.return_value = _brands("costa")
+    service = BrandServiceAsync(client=mock_async_http_client, cache=BrandCache())
+
+    await service.get_available_brands()
+    await service.get_available_brands()
+
+    mock_async_http_client.request.assert_awaited_once()
+
+
+async def test_caller_deadline_bounds_only_its_own_wait() -> None:
+    cache = BrandCache()
+    release = asyncio.Event()
+
+    async def fetch() -> Response:
+        await release.wait()
+        return _brands("costa")
+
+    waiter = asyncio.ensure_future(cache.get_async(None, fetch))
+    await asyncio.sleep(0)
+
+    with pytest.raises(DeadlineExceeded):
+        await asyncio.wait_for(cache.get_async(None, fetch, Deadline.after(0.01)), 0.5)
+
+    release.set()
+
+    assert (await waiter).json()["data"]["brands"] == ["costa"]
+    assert len(cache) == 1
+
+
+async def test_brand_service_async_does_not_pass_deadline_to_shared_fetch(mock_async_http_client: AsyncMock) -> None:
+    mock_async_http_client.request.return_value = _brands("costa")
+    service = BrandServiceAsync(client=mock_async_http_client, cache=BrandCache())
+
+    await service.get_available_brands(deadline=Deadline.after(5))
+
+    assert "deadline" not in mock_async_http_client.request.await_args.kwargs
+
+
+def test_ttl_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        BrandCache(ttl=0)
@@ -0,0 +1,159 @@
+import pytest
+from httpx import Response
+
+from jpy_tillo_sdk.domain.brand.catalogue import BrandCatalogue, normalize_amount
+from jpy_tillo_sdk.domain.webhook.handlers import handle_webhook_event
+from jpy_tillo_sdk.domain.webhook.models import Brand, BrandList, Status, Webhook
+
+BRANDS = {
+    "costa": {
+        "name": "Costa",
+        "status": {"code": "ENABLED"},
+        "countries_served": ["GB"],
+        "currency": "GBP",
+        "categories": ["food"],
+        "denominations": ["5.00", "10.00", "25.00"],
+    },
+    "amazon-uk": {
+        "name": "Amazon UK",
+        "status": {"code": "ENABLED"},
+        "countries_served": ["GB"],
+        "currency": "GBP",
+        "categories": ["retail"],
+        "digital_face_value_limits": {"lower": 1, "upper": 500},
+    },
+    "amazon-de": {
+        "name": "Amazon DE",
+        "status": {"code": "ENABLED"},
+        "countries_served": ["DE", "AT"],
+        "currency": "EUR",
+        "categories": ["retail"],
+        "digital_face_value_limits": {"lower": 5, "upper": 250},
+    },
+    "greggs": {
+        "name": "Greggs",
+        "status": {"code": "DISABLED"},
+        "countries_served": ["GB"],
+        "currency": "GBP",
+        "categories": ["food"],
+        "denominations": [25],
+    },
+}
+
+
+@pytest.fixture
+def catalogue() -> BrandCatalogue:
+    return BrandCatalogue(BRANDS)
+
+
+def test_from_response() -> None:
+    catalogue = BrandCatalogue.from_response(Response(200, json={"data": {"brands": BRANDS}}))
+
+    assert len(catalogue) == 4
+    assert "costa" in catalogue
+    assert catalogue.get("costa")["name"] == "Costa"
+
+
+@pytest.mark.parametrize(
+    "criteria,expected",
+    [
+        ({"currency": "GBP"}, {"costa", "amazon-uk"}),
+        ({"currency": "gbp", "category": "Food"}, {"costa"}),
+        ({"country": "AT"}, {"amazon-de"}),
+        ({"currency": "GBP", "denomination": "25"}, {"costa", "amazon-uk"}),
+        ({"currency": "GBP", "denomination": 7.5}, {"amazon-uk"}),
+        ({"denomination": "1000.00"}, set()),
+        ({"category": "food", "denomination": "25.00", "include_unavailable": True}, {"costa", "greggs"}),
+        ({"currency": "USD"}, set()),
+        ({}, {"costa", "amazon-uk", "amazon-de"}),
+    ],
+)
+def test_find(catalogue: BrandCatalogue, criteria: dict[str, object], expected: set[str]) -> None:
+    assert catalogue.find(**criteria) == expected  # type: ignore[arg-type]
+
+
+def test_accepts(catalogue: BrandCatalogue) -> None:
+    assert catalogue.accepts("costa", "10")
+    assert not catalogue.accepts("costa", "11.00")
+    assert catalogue.accepts("amazon-de", 250)
+    assert not catalogue.accepts("amazon-de", "4.99")
+    assert not catalogue.accepts("unknown", "10.00")
+    assert not catalogue.accepts("costa", "ten")
+
+
+def test_upsert_reindexes_a_single_brand(catalogue: BrandCatalogue) -> None:
+    catalogue.upsert("costa", {**BRANDS["costa"], "currency": "EUR", "denominations": ["20.00"]})
+
+    assert catalogue.find(currency="GBP") == {"amazon-uk"}
+    assert "costa" in catalogue.find(currency="EUR", denomination="20")
+    assert catalogue.find(denomination="5.00", currency="EUR") == {"amazon-de"}
+
+
+def test_remove(catalogue: BrandCatalogue) -> None:
+    catalogue.remove("costa")
+
+    assert "costa" not in catalogue
+    assert catalogue.find(category="food", include_unavailable=True) == {"greggs"}
+
+
+def test_apply_status_webhook(catalogue: BrandCatalogue) -> None:
+    webhook = handle_webhook_event(
+        '{"type": "brands.status.updated", "timestamp": "2024-01-01T00:00:00Z", "certificate": "",'
+        ' "version": 2, "data": {"brands": [{"name": "Costa", "slug": "costa", "status": {"code": "DISABLED"}},'
+        ' {"name": "Greggs", "slug": "greggs", "status": {"code": "ENABLED"}}]}}'
+    )
+
+    assert catalogue.apply_webhook(webhook) == 2
+    assert catalogue.find(category="food") == {"greggs"}
+    assert not catalogue.is_available("costa")
+    assert catalogue.find(currency="GBP", include_unavailable=True) == {"costa", "amazon-uk", "greggs"}
+
+
+def test_apply_webhook_with_models_keeps_only_the_status_of_unknown_brands(catalogue: BrandCatalogue) -> None:
+    data = BrandList(
+        brands=[
+            Brand(name="New", slug="new-brand", status=Status(code="ENABLED")),
+            Brand(name="Later", slug="later-brand", status=Status(code="DISABLED")),
+        ]
+    )
+    webhook = Webhook(type="brands.status.updated", timestamp="", certificate="", version=2, data=data)
+
+    catalogue.apply_webhook(webhook)
+
+    assert "new-brand" not in catalogue
+    assert not catalogue.is_available("new-brand")
+    assert not catalogue.accepts("new-brand", "12345.67")
+    assert catalogue.find(denomination="12345.67", include_unavailable=True) == set()
+
+    catalogue.upsert("later-brand", {"name": "Later", "currency": "GBP", "denominations": ["10.00"]})
+
+    assert not catalogue.is_available("later-brand")
+    assert catalogue.find(currency="GBP", include_unavailable=True) == {"costa", "amazon-uk", "greggs", "later-brand"}
+
+
+def test_find_by_denomination_matches_range_bounds(catalogue: BrandCatalogue) -> None:
+    catalogue.upsert("flex", {"name": "Flex", "digital_face_value_limits": {"lower": "5.00", "upper": "25.00"}})
+
+    assert catalogue.find(denomination="0.99") == set()
+    assert catalogue.find(denomination=1) == {"amazon-uk"}
+    assert catalogue.find(denomination=5) == {"costa", "amazon-uk", "amazon-de", "flex"}
+    assert catalogue.find(denomination="25.01") == {"amazon-uk", "amazon-de"}
+    assert catalogue.find(denomination=250) == {"amazon-uk", "amazon-de"}
+    assert catalogue.find(denomination="250.01") == {"amazon-uk"}
+
+    catalogue.remove("amazon-uk")
+
+    assert catalogue.find(denomination=1) == set()
+    assert catalogue.find(denomination=300) == set()
+
+
+def test_other_webhooks_are_ignored(catalogue: BrandCatalogue) -> None:
+    webhook = Webhook(type="orders.updated", timestamp="", certificate="", version=2, data={})
+
+    assert catalogue.apply_webhook(webhook) == 0
+
+
+def test_normalize_amount() -> None:
+    assert normalize_amount(25) == "25.00"
+    assert normalize_amount("7.5") == "7.50"
+    assert normalize_amount("abc") is None
@@ -10,6 +10,7 @@ from jpy_tillo_sdk.domain.brand.endpoints import (
     DownloadBrandTemplateEndpoint,
     TemplatesListEndpoint,
 )
+from jpy_tillo_sdk.domain.brand.models import BrandsResponse
 from jpy_tillo_sdk.domain.brand.services import (
     BrandService,
     BrandServiceAsync,
@@ -121,3 +122,23 @@ async def test_brand_service_methods_endpoint_types_async(mock_async_http_client
     await instance.get_available_brands(BrandEndpointRequestQuery())
 
     assert isinstance(mock_async_http_client.request.call_args[1]["endpoint"], BrandEndpoint)
+
+
+def test_get_available_brands_typed(mock_http_client: Mock) -> None:
+    mock_http_client.request.return_value = Response(
+        200, json={"code": "000", "status": "success", "data": {"brands": {"costa": {"name": "Costa"}}}}
+    )
+    instance = BrandService(client=mock_http_client)
+
+    model = instance.get_available_brands_typed(BrandEndpointRequestQuery(detail=True))
+
+    assert isinstance(model, BrandsResponse)
+    assert model.slugs == ["costa"]
+    assert model.brand("costa") == {"name": "Costa"}
+
+
+def test_brands_response_without_detail() -> None:
+    model = BrandsResponse.from_response(Response(200, json={"data": {"brands": ["costa", "amazon-de"]}}))
+
+    assert model.slugs == ["costa", "amazon-de"]
+    assert model.brands == {}
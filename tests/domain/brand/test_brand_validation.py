@@ -0,0 +1,99 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from jpy_tillo_sdk.domain.brand.catalogue import BrandCatalogue
+from jpy_tillo_sdk.domain.brand.validation import IssuanceValidator
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeRequestBody, OrderDigitalCodeAsyncRequestBody
+from jpy_tillo_sdk.domain.digital_card.services import DigitalCardService, DigitalCardServiceAsync
+from jpy_tillo_sdk.domain.digital_card.shared import FaceValue
+from jpy_tillo_sdk.domain.physical_card.endpoints import OrderPhysicalCardRequestBody
+from jpy_tillo_sdk.domain.physical_card.services import PhysicalCardsService
+from jpy_tillo_sdk.domain.physical_card.shared import FaceValue as PhysicalFaceValue
+from jpy_tillo_sdk.enums import Currency
+from jpy_tillo_sdk.errors import BrandNotFound, InvalidValue, SaleDisabled, UnsupportedCurrencyIsoCode
+
+
+@pytest.fixture
+def validator() -> IssuanceValidator:
+    return IssuanceValidator(
+        BrandCatalogue(
+            {
+                "costa": {"status": {"code": "ENABLED"}, "currency": "GBP", "denominations": ["10.00", "25.00"]},
+                "greggs": {"status": {"code": "DISABLED"}, "currency": "GBP"},
+            }
+        )
+    )
+
+
+def _body(brand: str = "costa", amount: str = "10.00", currency: str = "GBP") -> IssueDigitalCodeRequestBody:
+    return IssueDigitalCodeRequestBody(
+        client_request_id="id", brand=brand, face_value=FaceValue(amount=amount, currency=currency)
+    )
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (_body(brand="unknown"), BrandNotFound),
+        (_body(brand="greggs"), SaleDisabled),
+        (_body(currency="EUR"), UnsupportedCurrencyIsoCode),
+        (_body(amount="11.00"), InvalidValue),
+    ],
+)
+def test_invalid_requests_are_rejected(
+    validator: IssuanceValidator, body: IssueDigitalCodeRequestBody, expected: type[Exception]
+) -> None:
+    with pytest.raises(expected):
+        validator.validate_body(body)
+
+
+def test_valid_requests_pass(validator: IssuanceValidator) -> None:
+    validator.validate_body(_body())
+    validator.validate_body(IssueDigitalCodeRequestBody(client_request_id="id", brand="costa"))
+    validator.validate_body(None)
+
+
+def test_enum_currencies_are_supported(validator: IssuanceValidator) -> None:
+    validator.validate("costa", currency=Currency.GBP, amount="25")
+
+    with pytest.raises(UnsupportedCurrencyIsoCode):
+        validator.validate("costa", currency=Currency.EUR)
+
+
+def test_digital_card_service_validates_before_sending(validator: IssuanceValidator) -> None:
+    client = Mock()
+    service = DigitalCardService(client=client, validator=validator)
+
+    with pytest.raises(BrandNotFound):
+        service.issue_digital_code(body=_body(brand="unknown"))
+
+    service.issue_digital_code(body=_body())
+
+    client.request.assert_called_once()
+
+
+async def test_digital_card_service_async_validates_orders(validator: IssuanceValidator) -> None:
+    client = AsyncMock()
+    service = DigitalCardServiceAsync(client=client, validator=validator)
+    body = OrderDigitalCodeAsyncRequestBody(
+        client_request_id="id", brand="costa", face_value=FaceValue(amount="12.00", currency="GBP")
+    )
+
+    with pytest.raises(InvalidValue):
+        await service.order_digital_code(body=body)
+
+    client.request.assert_not_called()
+
+
+def test_physical_card_service_validates_orders(validator: IssuanceValidator) -> None:
+    client = Mock()
+    service = PhysicalCardsService(client=client, validator=validator)
+    body = OrderPhysicalCardRequestBody(
+        client_request_id="id", brand="costa", face_value=PhysicalFaceValue(amount="10.00", currency=Currency.EUR)
+    )
+
+    with pytest.raises(UnsupportedCurrencyIsoCode):
+        service.order_physical_card(body=body)
+
+    client.request.assert_not_called()
@@ -0,0 +1,182 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from httpx import MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.digital_card.bulk import DEFAULT_CONCURRENCY, BulkIssuer
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.digital_card.services import DigitalCardServiceAsync
+from jpy_tillo_sdk.errors import BrandNotFound
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.rate_limiter import RateLimiter, TokenBucket
+from jpy_tillo_sdk.rate_limits import DigitalIssue, RateLimit
+
+
+def _body(index: int) -> IssueDigitalCodeRequestBody:
+    return IssueDigitalCodeRequestBody(client_request_id=f"request-{index}", brand="costa")
+
+
+class TestBulkIssuer:
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        in_flight = 0
+        max_in_flight = 0
+
+        async def issue(body: IssueDigitalCodeRequestBody) -> Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return Response(200)
+
+        results = [
+            result
+            async for result in BulkIssuer(issue, concurrency=3, rate_limit=None).run(_body(i) for i in range(20))
+        ]
+
+        assert len(results) == 20
+        assert all(result.ok for result in results)
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_input_is_consumed_lazily(self) -> None:
+        consumed = 0
+
+        def bodies() -> Iterator[IssueDigitalCodeRequestBody]:
+            nonlocal consumed
+            for i in range(1000):
+                consumed += 1
+                yield _body(i)
+
+        results = BulkIssuer(AsyncMock(return_value=Response(200)), concurrency=2, rate_limit=None).run(bodies())
+
+        await anext(results)
+
+        assert consumed <= 3
+
+        await results.aclose()
+
+    @pytest.mark.asyncio
+    async def test_results_are_yielded_in_completion_order(self) -> None:
+        async def issue(body: IssueDigitalCodeRequestBody) -> Response:
+            await asyncio.sleep(0.02 if body.client_request_id == "request-0" else 0)
+            return Response(200)
+
+        results = [
+            result async for result in BulkIssuer(issue, concurrency=2, rate_limit=None).run([_body(0), _body(1)])
+        ]
+
+        assert [result.body.client_request_id for result in results] == ["request-1", "request-0"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_per_body(self) -> None:
+        async def issue(body: IssueDigitalCodeRequestBody) -> Response:
+            if body.client_request_id == "request-1":
+                raise BrandNotFound()
+            return Response(200)
+
+        results = {
+            result.body.client_request_id: result
+            async for result in BulkIssuer(issue, rate_limit=None).run(_body(i) for i in range(3))
+        }
+
+        assert not results["request-1"].ok
+        assert isinstance(results["request-1"].error, BrandNotFound)
+        assert results["request-0"].response is not None
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterables(self) -> None:
+        async def bodies() -> AsyncIterator[IssueDigitalCodeRequestBody]:
+            for i in range(5):
+                yield _body(i)
+
+        results = [
+            result async for result in BulkIssuer(AsyncMock(return_value=Response(200)), rate_limit=None).run(bodies())
+        ]
+
+        assert len(results) == 5
+
+    @pytest.mark.asyncio
+    async def test_issuances_are_paced_by_the_rate_limit(self) -> None:
+        started: list[float] = []
+
+        async def issue(body: IssueDigitalCodeRequestBody) -> Response:
+            started.append(time.monotonic())
+            return Response(200)
+
+        issuer = BulkIssuer(issue, concurrency=10, rate_limit=RateLimit(20, period=1.0))
+        results = [result async for result in issuer.run(_body(i) for i in range(3))]
+
+        assert len(results) == 3
+        assert started[2] - started[0] >= 0.09
+
+    def test_concurrency_is_not_capped_by_the_rate_quota(self) -> None:
+        assert BulkIssuer(AsyncMock()).concurrency == DEFAULT_CONCURRENCY
+        assert BulkIssuer(AsyncMock(), concurrency=1000).concurrency == 1000
+
+    def test_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            BulkIssuer(AsyncMock(), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_issue_digital_codes_bulk(mock_async_http_client: AsyncMock) -> None:
+    service = DigitalCardServiceAsync(client=mock_async_http_client)
+
+    results = [result async for result in service.issue_digital_codes_bulk(_body(i) for i in range(4))]
+
+    assert len(results) == 4
+    assert mock_async_http_client.request.call_count == 4
+    assert all(isinstance(result.response, Mock) for result in results)
+
+
+def _service(rate_limiter: RateLimiter | None = None) -> DigitalCardServiceAsync:
+    async def handler(request: Request) -> Response:
+        return Response(200, json={"code": "000"})
+
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        rate_limiter=rate_limiter,
+    )
+    return DigitalCardServiceAsync(client=client)
+
+
+async def _bulk_delays(service: DigitalCardServiceAsync) -> list[float]:
+    delays: list[float] = []
+
+    async def acquire_async(bucket: TokenBucket, *args: object) -> float:
+        delays.append(bucket.reserve())
+        return delays[-1]
+
+    with patch.object(TokenBucket, "acquire_async", acquire_async):
+        results = [result async for result in service.issue_digital_codes_bulk(_body(i) for i in range(3))]
+
+    assert all(result.ok for result in results)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_issue_digital_codes_bulk_is_paced_without_client_rate_limiter() -> None:
+    interval = DigitalIssue.post().period / DigitalIssue.post().limit
+
+    delays = await _bulk_delays(_service())
+
+    assert delays == [0.0, pytest.approx(interval, abs=0.05), pytest.approx(2 * interval, abs=0.05)]
+
+
+@pytest.mark.asyncio
+async def test_issue_digital_codes_bulk_leaves_pacing_to_client_rate_limiter() -> None:
+    limiter = RateLimiter(limits={IssueDigitalCodeEndpoint: RateLimit(1000, period=1.0)})
+
+    delays = await _bulk_delays(_service(limiter))
+
+    assert len(delays) == 3
+    assert limiter.stats()["POST digital-issue"].acquired == 3
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from httpx import Response
+
+from jpy_tillo_sdk.domain.digital_card.models import DigitalOrderStatusResponse, StockResponse
+from jpy_tillo_sdk.domain.digital_card.services import DigitalCardService, DigitalCardServiceAsync
+from jpy_tillo_sdk.enums import OrderStatus
+
+MOCKS = Path(__file__).parents[3] / "mocks"
+
+
+def _mock(name: str) -> Response:
+    return Response(200, content=(MOCKS / name).read_bytes())
+
+
+def test_digital_order_status_response() -> None:
+    model = DigitalOrderStatusResponse.from_response(_mock("v2-digital-card-check-digital-order-status.json"))
+
+    assert model.reference == "a6404b20-1111-1111-1111-035a01d8c540"
+    assert model.order_status is OrderStatus.SUCCESS
+    assert model.brand == "costa"
+    assert model.is_terminal
+
+
+def test_stock_response() -> None:
+    model = StockResponse.from_response(_mock("v2-digital-card-check-stock-200.json"))
+
+    assert model.levels == {"hello-fresh": {"45.00": "OUT"}}
+    assert model.stock_level("hello-fresh", "45.00") == "OUT"
+    assert model.stock_level("hello-fresh", "10.00") is None
+    assert model.stock_level("costa", "45.00") is None
+
+
+def test_check_stock_typed(mock_http_client) -> None:
+    mock_http_client.request.return_value = _mock("v2-digital-card-check-stock-200.json")
+    service = DigitalCardService(client=mock_http_client)
+
+    model = service.check_stock_typed()
+
+    mock_http_client.request.assert_called_once()
+    assert isinstance(model, StockResponse)
+
+
+async def test_check_digital_order_typed_async(mock_async_http_client) -> None:
+    mock_async_http_client.request.return_value = _mock("v2-digital-card-check-digital-order-status.json")
+    service = DigitalCardServiceAsync(client=mock_async_http_client)
+
+    model = await service.check_digital_order_typed()
+
+    assert model.order_status is OrderStatus.SUCCESS
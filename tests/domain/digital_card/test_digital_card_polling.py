@@ -0,0 +1,156 @@
+import asyncio
+import itertools
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import ConnectError, Response
+
+from jpy_tillo_sdk.domain.digital_card.polling import OrderStatusPoller
+from jpy_tillo_sdk.enums import OrderStatus
+from jpy_tillo_sdk.errors import DeadlineExceeded, InternalServerError, InvalidSaleReference
+from jpy_tillo_sdk.timeouts import Deadline
+
+
+def _status_response(status: str) -> Response:
+    return Response(200, json={"code": "000", "status": "success", "data": {"reference": "ref", "status": status}})
+
+
+def _service(statuses: Iterator[str]) -> AsyncMock:
+    service = AsyncMock()
+    service.check_digital_order.side_effect = lambda query, deadline=None: _status_response(next(statuses))
+    return service
+
+
+def _poller(service: AsyncMock, **kwargs: float) -> OrderStatusPoller:
+    return OrderStatusPoller(service, initial_delay=0.001, max_delay=0.004, rate_limit=None, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_resolves_when_order_succeeds() -> None:
+    service = _service(iter(["PENDING", "PROCESSING", "SUCCESS"]))
+    results = []
+
+    async with _poller(service) as poller:
+        result = await asyncio.wait_for(poller.track("ref", callback=results.append), 1)
+
+    assert result.status is OrderStatus.SUCCESS
+    assert result.response.json()["data"]["status"] == "SUCCESS"
+    assert results == [result]
+    assert service.check_digital_order.call_count == 3
+    assert service.check_digital_order.call_args.kwargs["query"].reference == "ref"
+
+
+@pytest.mark.asyncio
+async def test_resolves_when_order_fails() -> None:
+    async with _poller(_service(iter(["error"]))) as poller:
+        result = await asyncio.wait_for(poller.track("ref"), 1)
+
+    assert result.status is OrderStatus.ERROR
+    assert poller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_tracks_many_orders_with_one_scheduler() -> None:
+    service = AsyncMock()
+    service.check_digital_order.return_value = _status_response("SUCCESS")
+
+    async with _poller(service) as poller:
+        futures = [poller.track(f"ref-{i}") for i in range(500)]
+
+        assert poller.pending == 500
+        assert len(poller._heap) == 500
+
+        results = await asyncio.wait_for(asyncio.gather(*futures), 5)
+
+    assert {result.reference for result in results} == {f"ref-{i}" for i in range(500)}
+
+
+@pytest.mark.asyncio
+async def test_tracking_the_same_reference_twice_shares_the_future() -> None:
+    async with _poller(_service(iter(["SUCCESS"]))) as poller:
+        assert poller.track("ref") is poller.track("ref")
+
+
+@pytest.mark.asyncio
+async def test_backoff_is_capped() -> None:
+    service = _service(iter(["PENDING"] * 5 + ["SUCCESS"]))
+    poller = _poller(service)
+
+    await asyncio.wait_for(poller.track("ref"), 1)
+    await poller.stop()
+
+    assert service.check_digital_order.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_are_retried() -> None:
+    responses = iter([ConnectError("boom"), _status_response("SUCCESS")])
+
+    def check(query: object, deadline: object = None) -> Response:
+        item = next(responses)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    service = AsyncMock()
+    service.check_digital_order.side_effect = check
+
+    async with _poller(service) as poller:
+        result = await asyncio.wait_for(poller.track("ref"), 1)
+
+    assert result.status is OrderStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_throttled_and_server_errors_are_retried() -> None:
+    responses = iter([Response(429), InternalServerError(Response(500)), _status_response("SUCCESS")])
+
+    def check(query: object, deadline: object = None) -> Response:
+        item = next(responses)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    service = AsyncMock()
+    service.check_digital_order.side_effect = check
+
+    async with _poller(service) as poller:
+        result = await asyncio.wait_for(poller.track("ref"), 1)
+
+    assert result.status is OrderStatus.SUCCESS
+    assert service.check_digital_order.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_api_errors_fail_the_order() -> None:
+    service = AsyncMock()
+    service.check_digital_order.side_effect = InvalidSaleReference()
+
+    async with _poller(service) as poller:
+        with pytest.raises(InvalidSaleReference):
+            await asyncio.wait_for(poller.track("ref"), 1)
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_outstanding_orders() -> None:
+    poller = OrderStatusPoller(AsyncMock(), initial_delay=60, rate_limit=None)
+    future = poller.track("ref")
+
+    await poller.stop()
+
+    assert future.cancelled()
+    assert poller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_fails_when_deadline_passes() -> None:
+    service = _service(itertools.repeat("PENDING"))
+    deadline = Deadline.after(0.01)
+
+    async with _poller(service) as poller:
+        with pytest.raises(DeadlineExceeded):
+            await asyncio.wait_for(poller.track("ref", deadline=deadline), 1)
+
+    assert service.check_digital_order.call_args.kwargs["deadline"] is deadline
+    assert poller.pending == 0
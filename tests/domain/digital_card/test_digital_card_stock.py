@@ -0,0 +1,110 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from httpx import Response
+
+from jpy_tillo_sdk.domain.digital_card.endpoints import CheckStockRequestQuery, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.digital_card.services import DigitalCardService, DigitalCardServiceAsync
+from jpy_tillo_sdk.domain.digital_card.shared import FaceValue
+from jpy_tillo_sdk.domain.digital_card.stock import StockCache
+from jpy_tillo_sdk.errors import DenominationNotInStock
+
+MOCKS = Path(__file__).parents[3] / "mocks"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stock_response() -> Response:
+    return Response(200, content=(MOCKS / "v2-digital-card-check-stock-200.json").read_bytes())
+
+
+def _body(amount: str = "45.00") -> IssueDigitalCodeRequestBody:
+    return IssueDigitalCodeRequestBody(
+        client_request_id=f"id-{amount}", brand="hello-fresh", face_value=FaceValue(amount=amount, currency="GBP")
+    )
+
+
+def test_store_and_expire() -> None:
+    clock = FakeClock()
+    cache = StockCache(ttl=30, clock=clock)
+
+    cache.store(_stock_response())
+
+    assert cache.level("hello-fresh", "45") == "OUT"
+    assert cache.is_out_of_stock("hello-fresh", "45.00")
+    assert not cache.is_out_of_stock("hello-fresh", "10.00")
+
+    clock.now = 31
+    assert cache.level("hello-fresh", "45.00") is None
+    assert cache.response("hello-fresh") is None
+
+
+def test_mark_out_of_stock_drops_cached_levels() -> None:
+    cache = StockCache()
+    cache.update("costa", {"10.00": "IN", "25.00": "IN"})
+
+    cache.mark_out_of_stock("costa", "10")
+
+    assert cache.is_out_of_stock("costa", "10.00")
+    assert cache.level("costa", "25.00") is None
+
+
+def test_check_stock_is_served_from_cache() -> None:
+    client = Mock()
+    client.request.return_value = _stock_response()
+    service = DigitalCardService(client=client, stock_cache=StockCache())
+
+    first = service.check_stock(CheckStockRequestQuery(brand="hello-fresh"))
+    second = service.check_stock(CheckStockRequestQuery(brand="hello-fresh"))
+
+    assert first is second
+    client.request.assert_called_once()
+
+
+async def test_denomination_not_in_stock_updates_cache() -> None:
+    client = AsyncMock()
+    client.request.side_effect = DenominationNotInStock()
+    cache = StockCache()
+    service = DigitalCardServiceAsync(client=client, stock_cache=cache)
+
+    with pytest.raises(DenominationNotInStock):
+        await service.issue_digital_code(body=_body("10.00"))
+
+    assert cache.is_out_of_stock("hello-fresh", "10.00")
+
+
+async def test_bulk_issuance_rejects_out_of_stock_denominations_locally() -> None:
+    client = AsyncMock(rate_limiter=None)
+    client.request.return_value = _stock_response()
+    cache = StockCache()
+    service = DigitalCardServiceAsync(client=client, stock_cache=cache)
+    await service.check_stock(CheckStockRequestQuery(brand="hello-fresh"))
+    client.request.reset_mock()
+
+    results = [
+        result
+        async for result in service.issue_digital_codes_bulk([_body("45.00"), _body("10.00")], skip_out_of_stock=True)
+    ]
+
+    errors = {result.body.face_value.amount: result.error for result in results}
+    assert isinstance(errors["45.00"], DenominationNotInStock)
+    assert errors["10.00"] is None
+    assert client.request.await_count == 1
+
+
+async def test_bulk_issuance_ignores_stock_by_default() -> None:
+    client = AsyncMock(rate_limiter=None)
+    cache = StockCache()
+    cache.mark_out_of_stock("hello-fresh", "45.00")
+    service = DigitalCardServiceAsync(client=client, stock_cache=cache)
+
+    results = [result async for result in service.issue_digital_codes_bulk([_body("45.00")])]
+
+    assert results[0].ok
@@ -4,6 +4,7 @@ from httpx import Response
 from jpy_tillo_sdk.domain.float.endpoints import (
     RequestPaymentTransferEndpointRequestBody,
 )
+from jpy_tillo_sdk.domain.float.models import FloatsResponse
 from jpy_tillo_sdk.domain.float.services import FloatService, FloatServiceAsync
 from jpy_tillo_sdk.enums import Currency
 
@@ -57,3 +58,17 @@ async def test_request_payment_transfer_async(mock_async_http_client):
 
     mock_async_http_client.request.assert_called_once()
     assert isinstance(response, Response)
+
+
+def test_check_floats_typed(mock_http_client):
+    mock_http_client.request.return_value = Response(
+        200,
+        json={"data": {"floats": [{"currency": "GBP", "available_balance": {"amount": "10.00", "currency": "GBP"}}]}},
+    )
+    float_service = FloatService(client=mock_http_client)
+
+    model = float_service.check_floats_typed()
+
+    assert isinstance(model, FloatsResponse)
+    assert model.float_for("GBP")["available_balance"]["amount"] == "10.00"
+    assert model.float_for("EUR") is None
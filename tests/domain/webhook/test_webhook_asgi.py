@@ -0,0 +1,158 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+
+from jpy_tillo_sdk.domain.webhook.asgi import WebhookReceiver
+from jpy_tillo_sdk.domain.webhook.delivery import WebhookDeduplicator
+from jpy_tillo_sdk.domain.webhook.models import Webhook
+from jpy_tillo_sdk.domain.webhook.services import WebhookServiceAsync
+from jpy_tillo_sdk.domain.webhook.verification import WebhookVerifier, canonical_certificate_seed
+from jpy_tillo_sdk.signature import SignatureGenerator
+
+VERIFIER = WebhookVerifier(SignatureGenerator("api_key", "secret"), canonical_certificate_seed)
+
+
+def make_body(timestamp: str = "1", **overrides: Any) -> bytes:
+    payload: dict[str, Any] = {
+        "type": "brands.status.updated",
+        "timestamp": timestamp,
+        "version": 2,
+        "data": {"brands": [{"name": "Costa", "slug": "costa", "status": {"code": "DISABLED"}}]},
+    }
+    payload["certificate"] = VERIFIER.certificate(payload)
+    payload.update(overrides)
+    return json.dumps(payload).encode()
+
+
+class Handler:
+    def __init__(self) -> None:
+        self.handled: list[Webhook] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, webhook: Webhook) -> None:
+        await self.gate.wait()
+        self.handled.append(webhook)
+
+
+@pytest.fixture
+def handler() -> Handler:
+    return Handler()
+
+
+@pytest.fixture
+def receiver(handler: Handler) -> WebhookReceiver:
+    service = WebhookServiceAsync(verifier=VERIFIER, deduplicator=WebhookDeduplicator())
+    return WebhookReceiver(service, handler, concurrency=2, max_queue_size=2, stats_path="/stats")
+
+
+@pytest.fixture
+async def client(receiver: WebhookReceiver) -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=receiver), base_url="http://test") as client:
+        yield client
+
+
+async def test_valid_webhooks_are_acknowledged_and_handled(
+    receiver: WebhookReceiver, handler: Handler, client: httpx.AsyncClient
+) -> None:
+    await receiver.start()
+
+    response = await client.post("/webhooks", content=make_body())
+    await receiver.stop()
+
+    assert response.status_code == 202
+    assert [webhook.timestamp for webhook in handler.handled] == ["1"]
+    assert receiver.stats.processed == 1
+
+
+@pytest.mark.parametrize(
+    "body, status_code",
+    [(make_body(certificate="forged"), 401), (b"not json", 400), (b"x" * 2_000_000, 413)],
+)
+async def test_invalid_webhooks_are_rejected(
+    receiver: WebhookReceiver, client: httpx.AsyncClient, body: bytes, status_code: int
+) -> None:
+    response = await client.post("/webhooks", content=body)
+
+    assert response.status_code == status_code
+    assert receiver.stats.rejected == 1
+    assert receiver.queued == 0
+
+
+async def test_redeliveries_are_acknowledged_once(receiver: WebhookReceiver, client: httpx.AsyncClient) -> None:
+    first = await client.post("/webhooks", content=make_body())
+    second = await client.post("/webhooks", content=make_body())
+
+    assert (first.status_code, second.status_code) == (202, 200)
+    assert receiver.stats.duplicates == 1
+    assert receiver.queued == 1
+
+
+async def test_full_queue_refuses_webhooks(
+    receiver: WebhookReceiver, handler: Handler, client: httpx.AsyncClient
+) -> None:
+    handler.gate.clear()
+
+    responses = [await client.post("/webhooks", content=make_body(str(i))) for i in range(3)]
+
+    assert [response.status_code for response in responses] == [202, 202, 503]
+    assert responses[2].headers["retry-after"] == "5"
+    assert receiver.stats.overloaded == 1
+
+    # The refused webhook is not remembered, so its redelivery is accepted.
+    await receiver.start()
+    handler.gate.set()
+    await asyncio.wait_for(receiver.stop(), 1.0)
+
+    assert (await client.post("/webhooks", content=make_body("2"))).status_code == 202
+
+
+async def test_failed_handlers_are_counted(receiver: WebhookReceiver, client: httpx.AsyncClient) -> None:
+    async def failing(webhook: Webhook) -> None:
+        raise RuntimeError("boom")
+
+    receiver.handler = failing
+    await receiver.start()
+
+    await client.post("/webhooks", content=make_body())
+    await receiver.stop()
+
+    assert receiver.stats.failed == 1
+    assert receiver.stats.processed == 0
+
+
+async def test_stats_and_method_handling(receiver: WebhookReceiver, client: httpx.AsyncClient) -> None:
+    await client.post("/webhooks", content=make_body())
+
+    stats = (await client.get("/stats")).json()
+    other = await client.get("/webhooks")
+
+    assert stats["accepted"] == 1
+    assert stats["queued"] == 1
+    assert stats["mean_ack_latency"] >= 0
+    assert other.status_code == 405
+
+
+async def test_lifespan_starts_and_drains_the_workers(receiver: WebhookReceiver, handler: Handler) -> None:
+    messages = asyncio.Queue[dict[str, Any]]()
+    sent: list[dict[str, Any]] = []
+
+    async def send(message: Any) -> None:
+        sent.append(message)
+
+    lifespan = asyncio.create_task(receiver({"type": "lifespan"}, messages.get, send))
+    await messages.put({"type": "lifespan.startup"})
+
+    transport = httpx.ASGITransport(app=receiver)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.post("/webhooks", content=make_body())
+
+    await messages.put({"type": "lifespan.shutdown"})
+    await asyncio.wait_for(lifespan, 1.0)
+
+    assert [message["type"] for message in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert len(handler.handled) == 1
@@ -0,0 +1,192 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from jpy_tillo_sdk.domain.webhook.delivery import ReorderWindow, WebhookDeduplicator, webhook_key
+from jpy_tillo_sdk.domain.webhook.enums import Types
+from jpy_tillo_sdk.domain.webhook.models import Brand, BrandList, Status, Webhook
+from jpy_tillo_sdk.domain.webhook.services import WebhookBatchResult, WebhookService, WebhookServiceAsync
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_webhook(timestamp: str = "1", slug: str = "costa", certificate: str = "a") -> Webhook:
+    data = BrandList(brands=[Brand(name=slug, slug=slug, status=Status(code="ENABLED"))])
+    return Webhook(
+        type=Types.TYPE_BRAND_STATUS_UPDATED, timestamp=timestamp, certificate=certificate, version=2, data=data
+    )
+
+
+def make_body(timestamp: str = "1", slug: str = "costa") -> str:
+    return json.dumps(
+        {
+            "type": "brands.status.updated",
+            "timestamp": timestamp,
+            "certificate": "c",
+            "version": 2,
+            "data": {"brands": [{"name": slug, "slug": slug, "status": {"code": "ENABLED"}}]},
+        }
+    )
+
+
+def test_webhook_key_ignores_the_certificate() -> None:
+    assert webhook_key(make_webhook(certificate="a")) == webhook_key(make_webhook(certificate="b"))
+    assert webhook_key(make_webhook()) != webhook_key(make_webhook(timestamp="2"))
+    assert webhook_key(make_webhook()) != webhook_key(make_webhook(slug="greggs"))
+
+
+def test_webhook_key_of_decoded_and_raw_data_differs_only_by_content() -> None:
+    raw: dict[str, Any] = {"brands": []}
+
+    first = Webhook(type="orders.updated", timestamp="1", certificate="", version=2, data=raw)
+    second = Webhook(type="orders.updated", timestamp="1", certificate="", version=2, data={"brands": []})
+
+    assert webhook_key(first) == webhook_key(second)
+
+
+def test_deduplicator_detects_redeliveries() -> None:
+    deduplicator = WebhookDeduplicator()
+
+    assert not deduplicator.seen(make_webhook())
+    assert deduplicator.seen(make_webhook(certificate="other"))
+    assert not deduplicator.seen(make_webhook(timestamp="2"))
+    assert deduplicator.duplicates == 1
+
+
+def test_deduplicator_evicts_the_oldest_webhook() -> None:
+    deduplicator = WebhookDeduplicator(capacity=2)
+
+    for timestamp in ("1", "2", "3"):
+        deduplicator.seen(make_webhook(timestamp=timestamp))
+
+    assert len(deduplicator) == 2
+    assert not deduplicator.seen(make_webhook(timestamp="1"))
+    assert deduplicator.seen(make_webhook(timestamp="3"))
+
+
+def test_deduplicator_forgets_webhooks() -> None:
+    deduplicator = WebhookDeduplicator()
+    deduplicator.seen(make_webhook())
+
+    deduplicator.forget(make_webhook())
+
+    assert not deduplicator.seen(make_webhook())
+
+
+def test_deduplicator_keeps_forgotten_webhooks_seen_again_until_evicted() -> None:
+    deduplicator = WebhookDeduplicator(capacity=3)
+    deduplicator.seen(make_webhook(timestamp="1"))
+    deduplicator.forget(make_webhook(timestamp="1"))
+    deduplicator.seen(make_webhook(timestamp="1"))
+
+    for timestamp in ("2", "3"):
+        deduplicator.seen(make_webhook(timestamp=timestamp))
+
+    assert len(deduplicator) == 3
+    assert all(deduplicator.seen(make_webhook(timestamp=timestamp)) for timestamp in ("1", "2", "3"))
+
+    deduplicator.seen(make_webhook(timestamp="4"))
+
+    assert not deduplicator.seen(make_webhook(timestamp="1"))
+
+
+def test_reorder_window_releases_in_timestamp_order() -> None:
+    clock = Clock()
+    window: ReorderWindow[str] = ReorderWindow(delay=1.0, clock=clock)
+
+    for timestamp in ("30", "10", "20"):
+        window.push(make_webhook(timestamp=timestamp), timestamp)
+
+    assert window.pop_ready() == []
+    assert window.next_release() == 1.0
+
+    clock.now = 1.0
+
+    assert window.pop_ready() == ["10", "20", "30"]
+    assert window.next_release() is None
+
+
+def test_reorder_window_holds_late_arrivals_for_the_delay() -> None:
+    clock = Clock()
+    window: ReorderWindow[str] = ReorderWindow(delay=1.0, clock=clock)
+    window.push(make_webhook(timestamp="20"), "20")
+    clock.now = 0.5
+    window.push(make_webhook(timestamp="30"), "30")
+    clock.now = 1.0
+
+    assert window.pop_ready() == ["20"]
+    assert window.next_release() == 0.5
+
+
+def test_reorder_window_releases_when_full() -> None:
+    window: ReorderWindow[str] = ReorderWindow(delay=10.0, max_size=2, clock=Clock())
+
+    for timestamp in ("3", "1", "2"):
+        window.push(make_webhook(timestamp=timestamp), timestamp)
+
+    assert window.pop_ready() == ["1"]
+    assert window.flush() == ["2", "3"]
+    assert len(window) == 0
+
+
+def test_process_skips_redeliveries() -> None:
+    handled: list[Webhook] = []
+    service = WebhookService(deduplicator=WebhookDeduplicator())
+
+    result = service.process([make_body("1"), make_body("1"), make_body("2")], handled.append)
+
+    assert result.processed == 2
+    assert result.duplicates == 1
+    assert [webhook.timestamp for webhook in handled] == ["1", "2"]
+
+
+def test_failed_webhooks_are_processed_on_redelivery() -> None:
+    attempts: list[Webhook] = []
+
+    def handler(webhook: Webhook) -> None:
+        attempts.append(webhook)
+
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+
+    result = WebhookService(deduplicator=WebhookDeduplicator()).process([make_body(), make_body()], handler)
+
+    assert result.processed == 1
+    assert result.duplicates == 0
+    assert len(result.failed) == 1
+
+
+async def test_consume_ordered_handles_webhooks_in_timestamp_order() -> None:
+    queue: asyncio.Queue[str | bytes] = asyncio.Queue()
+    result = WebhookBatchResult()
+    handled: list[str] = []
+    service = WebhookServiceAsync(deduplicator=WebhookDeduplicator())
+
+    async def handler(webhook: Webhook) -> None:
+        handled.append(webhook.timestamp)
+
+    for timestamp in ("3", "1", "3", "2", "invalid"):
+        queue.put_nowait(make_body(timestamp) if timestamp != "invalid" else "{")
+
+    consumer = asyncio.create_task(
+        service.consume_ordered(queue, handler, window=ReorderWindow(delay=0.01), result=result)
+    )
+
+    await asyncio.wait_for(queue.join(), 1.0)
+    consumer.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    assert handled == ["1", "2", "3"]
+    assert result.processed == 3
+    assert result.duplicates == 1
+    assert len(result.failed) == 1
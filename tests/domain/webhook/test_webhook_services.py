@@ -0,0 +1,182 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from jpy_tillo_sdk.domain.webhook.enums import Types
+from jpy_tillo_sdk.domain.webhook.handlers import decode_webhook, handle_webhook_event
+from jpy_tillo_sdk.domain.webhook.models import Brand, BrandList, Status, Webhook
+from jpy_tillo_sdk.domain.webhook.services import WebhookBatchResult, WebhookService, WebhookServiceAsync
+from jpy_tillo_sdk.domain.webhook.verification import WebhookVerifier, canonical_certificate_seed
+from jpy_tillo_sdk.errors import InvalidWebhookPayload, InvalidWebhookSignature
+from jpy_tillo_sdk.signature import SignatureGenerator
+from jpy_tillo_sdk.tillo import Tillo
+
+API_KEY = "api_key"
+SECRET = "secret"
+
+
+@pytest.fixture
+def verifier() -> WebhookVerifier:
+    return WebhookVerifier(SignatureGenerator(API_KEY, SECRET), canonical_certificate_seed)
+
+
+def make_payload(verifier: WebhookVerifier, timestamp: str = "1700000000000", **overrides: Any) -> str:
+    payload: dict[str, Any] = {
+        "type": "brands.status.updated",
+        "timestamp": timestamp,
+        "version": 2,
+        "data": {
+            "brands": [
+                {"name": "Costa", "slug": "costa", "status": {"code": "DISABLED", "reason": "maintenance"}},
+                {"name": "Greggs", "slug": "greggs", "status": "ENABLED"},
+            ]
+        },
+    }
+    payload["certificate"] = verifier.certificate(payload)
+    payload.update(overrides)
+    return json.dumps(payload)
+
+
+def test_decode_brand_status_webhook() -> None:
+    webhook = decode_webhook(
+        {
+            "type": "brands.status.updated",
+            "timestamp": "1",
+            "certificate": "c",
+            "version": 2,
+            "data": {"brands": [{"name": "Costa", "slug": "costa", "status": {"code": "ENABLED"}}, "invalid"]},
+        }
+    )
+
+    assert webhook.type is Types.TYPE_BRAND_STATUS_UPDATED
+    assert webhook.data == BrandList(brands=[Brand(name="Costa", slug="costa", status=Status(code="ENABLED"))])
+
+
+def test_decode_keeps_data_of_unknown_webhooks() -> None:
+    webhook = decode_webhook(
+        {"type": "orders.updated", "timestamp": "1", "certificate": "c", "version": 2, "data": {"a": 1}}
+    )
+
+    assert webhook == Webhook(type="orders.updated", timestamp="1", certificate="c", version=2, data={"a": 1})
+
+
+@pytest.mark.parametrize("body", ["not json", "[1, 2]", json.dumps({"type": "brands.status.updated"})])
+def test_invalid_payloads_are_rejected(body: str) -> None:
+    with pytest.raises(InvalidWebhookPayload):
+        handle_webhook_event(body)
+
+
+def test_parse_verifies_and_decodes(verifier: WebhookVerifier) -> None:
+    webhook = WebhookService(verifier).parse(make_payload(verifier).encode())
+
+    assert isinstance(webhook.data, BrandList)
+    assert [brand.status for brand in webhook.data.brands] == [
+        Status(code="DISABLED", reason="maintenance"),
+        Status(code="ENABLED"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"certificate": "forged"}, {"type": "orders.updated"}, {"certificate": None}, {"data": {"brands": []}}],
+)
+def test_parse_rejects_invalid_certificates(verifier: WebhookVerifier, overrides: dict[str, Any]) -> None:
+    with pytest.raises(InvalidWebhookSignature):
+        WebhookService(verifier).parse(make_payload(verifier, **overrides))
+
+
+def test_certificate_does_not_depend_on_the_key_order_of_the_body(verifier: WebhookVerifier) -> None:
+    payload = json.loads(make_payload(verifier))
+    payload["data"]["brands"] = [dict(reversed(brand.items())) for brand in payload["data"]["brands"]]
+
+    assert WebhookService(verifier).parse(json.dumps(payload, indent=2)).type is Types.TYPE_BRAND_STATUS_UPDATED
+
+
+def test_certificate_depends_on_the_credentials(verifier: WebhookVerifier) -> None:
+    other = WebhookService(WebhookVerifier(SignatureGenerator(API_KEY, "other"), canonical_certificate_seed))
+
+    with pytest.raises(InvalidWebhookSignature):
+        other.parse(make_payload(verifier))
+
+
+def test_process_records_failures_without_stopping(verifier: WebhookVerifier) -> None:
+    handled: list[Webhook] = []
+    payloads = [make_payload(verifier), make_payload(verifier, certificate="forged"), "{", make_payload(verifier)]
+
+    result = WebhookService(verifier).process(payloads, handled.append)
+
+    assert result.processed == 2
+    assert [index for index, _ in result.failed] == [1, 2]
+    assert len(handled) == 2
+
+
+async def test_process_async_bounds_concurrency(verifier: WebhookVerifier) -> None:
+    active = peak = 0
+
+    async def handler(webhook: Webhook) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+
+    payloads = [make_payload(verifier, timestamp=str(i)) for i in range(50)]
+    result = await WebhookServiceAsync(verifier).process_async(payloads, handler, concurrency=4)
+
+    assert result.processed == 50
+    assert result.failed == []
+    assert peak == 4
+
+
+async def test_process_async_records_handler_errors(verifier: WebhookVerifier) -> None:
+    def handler(webhook: Webhook) -> None:
+        raise RuntimeError("boom")
+
+    result = await WebhookServiceAsync(verifier).process_async([make_payload(verifier)], handler)
+
+    assert result.processed == 0
+    assert isinstance(result.failed[0][1], RuntimeError)
+
+
+async def test_consume_handles_queued_webhooks(verifier: WebhookVerifier) -> None:
+    queue: asyncio.Queue[str | bytes] = asyncio.Queue()
+    result = WebhookBatchResult()
+    handled: list[Webhook] = []
+
+    for i in range(20):
+        queue.put_nowait(make_payload(verifier, timestamp=str(i)))
+
+    queue.put_nowait("invalid")
+    consumer = asyncio.create_task(WebhookServiceAsync(verifier).consume(queue, handled.append, result=result))
+
+    await queue.join()
+    consumer.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    assert result.processed == 20
+    assert len(result.failed) == 1
+    assert len(handled) == 20
+
+
+def test_tillo_webhook_services_verify_with_the_given_scheme(verifier: WebhookVerifier) -> None:
+    tillo = Tillo(
+        API_KEY, SECRET, {"base_url": "https://example.com"}, webhook_certificate_seed=canonical_certificate_seed
+    )
+
+    assert tillo.webhook is tillo.webhook
+    assert isinstance(tillo.webhook_async, WebhookServiceAsync)
+    assert tillo.webhook.parse(make_payload(verifier)).type is Types.TYPE_BRAND_STATUS_UPDATED
+
+    with pytest.raises(InvalidWebhookSignature):
+        tillo.webhook_async.parse(make_payload(verifier, certificate="forged"))
+
+
+def test_tillo_webhook_services_skip_verification_without_a_scheme(verifier: WebhookVerifier) -> None:
+    tillo = Tillo(API_KEY, SECRET, {"base_url": "https://example.com"})
+
+    assert tillo.webhook.verifier is None
+    assert tillo.webhook.parse(make_payload(verifier, certificate="unchecked")).certificate == "unchecked"
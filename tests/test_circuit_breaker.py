@@ -0,0 +1,290 @@
+import asyncio
+
+import pytest
+from httpx import ConnectError, MockTransport, ReadTimeout, Request, Response
+
+from jpy_tillo_sdk.circuit_breaker import CircuitBreaker, CircuitState
+from jpy_tillo_sdk.concurrency import AdaptiveConcurrencyLimiter
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.float.endpoints import CheckFloatsEndpoint
+from jpy_tillo_sdk.errors import (
+    CircuitOpenError,
+    DeadlineExceeded,
+    DeadlineExceededInFlight,
+    DenominationNotInStock,
+    InternalServerError,
+)
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.timeouts import Deadline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fail(breaker: CircuitBreaker, endpoint: str, times: int) -> None:
+    for _ in range(times):
+        breaker.acquire(endpoint)
+        breaker.record_exception(endpoint, ConnectError("refused"))
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=FakeClock())
+
+    _fail(breaker, "digital-issue", 2)
+    breaker.acquire("digital-issue")
+    breaker.record_response("digital-issue", Response(200))
+    _fail(breaker, "digital-issue", 2)
+
+    assert breaker.state("digital-issue") is CircuitState.CLOSED
+
+    _fail(breaker, "digital-issue", 1)
+
+    assert breaker.state("digital-issue") is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.acquire("digital-issue")
+
+    assert info.value.endpoint == "digital-issue"
+    assert info.value.retry_after == 10
+    breaker.acquire("check-floats")
+
+
+def test_half_open_probe_closes_or_reopens_the_circuit() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    _fail(breaker, "digital-issue", 1)
+
+    clock.now = 10
+    assert breaker.state("digital-issue") is CircuitState.HALF_OPEN
+
+    breaker.acquire("digital-issue")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire("digital-issue")
+
+    breaker.record_response("digital-issue", Response(503))
+    assert breaker.state("digital-issue") is CircuitState.OPEN
+
+    clock.now = 20
+    breaker.acquire("digital-issue")
+    breaker.record_response("digital-issue", Response(200))
+
+    assert breaker.state("digital-issue") is CircuitState.CLOSED
+    assert breaker.snapshot()["digital-issue"].opened == 2
+
+
+def test_business_errors_and_cancellation_are_not_failures() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+
+    breaker.acquire("digital-issue")
+    breaker.record_exception("digital-issue", DenominationNotInStock(Response(422)))
+    assert breaker.state("digital-issue") is CircuitState.CLOSED
+
+    _fail(breaker, "digital-issue", 1)
+    clock.now = 10
+    breaker.acquire("digital-issue")
+    breaker.record_exception("digital-issue", asyncio.CancelledError())
+
+    assert breaker.state("digital-issue") is CircuitState.HALF_OPEN
+    breaker.acquire("digital-issue")
+
+
+def test_snapshot_reports_counters() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=FakeClock())
+    _fail(breaker, "digital-issue", 2)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire("digital-issue")
+
+    snapshot = breaker.snapshot()["digital-issue"]
+
+    assert snapshot.state is CircuitState.OPEN
+    assert (snapshot.failures, snapshot.rejected, snapshot.retry_after) == (2, 1, 10)
+
+    breaker.reset()
+    assert breaker.snapshot() == {}
+
+
+def _extractor() -> RequestDataExtractor:
+    return RequestDataExtractor(create_signer("test_api_key", "test_secret_key"))
+
+
+def test_sync_client_fails_fast_per_endpoint() -> None:
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+
+        if request.url.path == "/api/v2/digital/issue":
+            return Response(500, json={"code": "999", "message": "Internal error"})
+
+        return Response(200, json={"code": "000"})
+
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+    )
+    issue = IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody("id", "costa"))
+
+    for _ in range(2):
+        with pytest.raises(InternalServerError):
+            client.request(issue)
+
+    with pytest.raises(CircuitOpenError):
+        client.request(issue)
+
+    assert client.request(CheckFloatsEndpoint()).status_code == 200
+    assert len(requests) == 3
+
+
+async def test_async_client_records_transport_errors() -> None:
+    async def handler(request: Request) -> Response:
+        raise ConnectError("refused")
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(ConnectError):
+        await client.request(CheckFloatsEndpoint())
+
+    with pytest.raises(CircuitOpenError):
+        await client.request(CheckFloatsEndpoint())
+
+    assert breaker.state("check-floats") is CircuitState.OPEN
+
+
+async def test_async_client_counts_in_flight_deadlines_as_failures() -> None:
+    async def handler(request: Request) -> Response:
+        await asyncio.sleep(10)
+        return Response(200, json={"code": "000"})
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com", "timeout": 0.005},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        circuit_breaker=breaker,
+        concurrency_limiter=limiter,
+    )
+
+    for _ in range(2):
+        with pytest.raises(DeadlineExceededInFlight):
+            await client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0.01))
+
+    with pytest.raises(CircuitOpenError):
+        await client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0.01))
+
+    assert breaker.state("check-floats") is CircuitState.OPEN
+    assert limiter.limit("check-floats") < 8
+    assert limiter.snapshot()["check-floats"].in_flight == 0
+
+
+async def test_async_client_ignores_deadlines_tighter_than_the_endpoint_timeout() -> None:
+    async def handler(request: Request) -> Response:
+        await asyncio.sleep(10)
+        return Response(200, json={"code": "000"})
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        circuit_breaker=breaker,
+        concurrency_limiter=limiter,
+    )
+
+    for _ in range(3):
+        with pytest.raises(DeadlineExceeded) as info:
+            await client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0.01))
+
+        assert not isinstance(info.value, DeadlineExceededInFlight)
+
+    assert breaker.state("check-floats") is CircuitState.CLOSED
+    assert limiter.limit("check-floats") == 8
+    assert limiter.snapshot()["check-floats"].decreases == 0
+
+
+def test_sync_client_ignores_timeouts_capped_by_a_tight_deadline() -> None:
+    def handler(request: Request) -> Response:
+        raise ReadTimeout("timed out", request=request)
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(DeadlineExceeded):
+        client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0.5))
+
+    assert breaker.state("check-floats") is CircuitState.CLOSED
+
+    with pytest.raises(ReadTimeout):
+        client.request(CheckFloatsEndpoint(), deadline=Deadline.after(30))
+
+    assert breaker.state("check-floats") is CircuitState.OPEN
+
+
+def test_deadlines_passing_before_a_request_are_not_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.acquire("check-floats")
+
+    breaker.record_exception("check-floats", DeadlineExceeded("check-floats"))
+
+    assert breaker.state("check-floats") is CircuitState.CLOSED
+
+
+def test_errors_before_sending_do_not_close_a_half_open_circuit() -> None:
+    clock = FakeClock()
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(503)
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        circuit_breaker=breaker,
+    )
+
+    client.request(CheckFloatsEndpoint())
+    assert breaker.state("check-floats") is CircuitState.OPEN
+
+    clock.now = 10
+
+    with pytest.raises(DeadlineExceeded):
+        client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0))
+
+    breaker.acquire("check-floats")
+    breaker.record_exception("check-floats", ValueError("not serializable"))
+
+    assert breaker.state("check-floats") is CircuitState.HALF_OPEN
+    assert breaker.snapshot()["check-floats"].successes == 0
+    assert len(requests) == 1
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+from httpx import MockTransport, ReadTimeout, Request, Response
+
+from jpy_tillo_sdk.concurrency import AdaptiveConcurrencyLimiter
+from jpy_tillo_sdk.domain.float.endpoints import CheckFloatsEndpoint
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_limit_grows_additively_while_saturated_and_healthy() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+    for _ in range(20):
+        permits = [await limiter.acquire("check-floats") for _ in range(int(limiter.limit("check-floats")))]
+
+        for permit in permits:
+            permit.release(200, latency=0.01)
+
+    assert limiter.limit("check-floats") == 4
+    assert limiter.snapshot()["check-floats"].baseline_latency == pytest.approx(0.01)
+
+
+async def test_idle_or_slow_requests_do_not_grow_the_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+    (await limiter.acquire("check-floats")).release(200, latency=0.01)
+    (await limiter.acquire("check-floats")).release(200, latency=1.0)
+
+    assert limiter.limit("check-floats") == 4
+
+
+async def test_limit_is_cut_once_per_round_trip_on_overload() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2, clock=clock)
+    (await limiter.acquire("digital-issue")).release(200, latency=0.1)
+
+    permits = [await limiter.acquire("digital-issue") for _ in range(3)]
+    permits[0].release(429, latency=0.1)
+    permits[1].release(error=ReadTimeout("timeout"))
+
+    assert limiter.limit("digital-issue") == 8
+
+    clock.now = 1
+    permits[2].release(error=ReadTimeout("timeout"))
+
+    assert limiter.limit("digital-issue") == 4
+    assert limiter.snapshot()["digital-issue"].decreases == 2
+    assert limiter.limit("check-floats") == 16
+
+
+async def test_waiters_get_permits_in_order() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    first = await limiter.acquire("check-floats")
+    second = asyncio.ensure_future(limiter.acquire("check-floats"))
+    cancelled = asyncio.ensure_future(limiter.acquire("check-floats"))
+    await asyncio.sleep(0)
+
+    assert limiter.snapshot()["check-floats"].waiting == 2
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    first.release(200, latency=1.0)
+    first.release(200, latency=1.0)
+    permit = await asyncio.wait_for(second, 1)
+
+    assert limiter.snapshot()["check-floats"].in_flight == 1
+    assert limiter.snapshot()["check-floats"].waiting == 0
+    permit.release()
+
+
+def test_invalid_limits_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=5, max_limit=2)
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(backoff=1)
+
+
+async def test_async_client_caps_in_flight_requests() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+
+        return Response(429 if peak > 2 else 200, json={"code": "000"})
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, min_limit=1)
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        concurrency_limiter=limiter,
+    )
+
+    await asyncio.gather(*(client.request(CheckFloatsEndpoint()) for _ in range(20)))
+
+    assert peak == 3
+    assert limiter.limit("check-floats") < 3
+    assert limiter.snapshot()["check-floats"].in_flight == 0
+
+
+async def test_async_client_releases_the_permit_when_the_request_cannot_be_built() -> None:
+    class FailingExtractor(RequestDataExtractor):
+        def extract_all(self, endpoint):  # type: ignore[no-untyped-def]
+            raise ValueError("unsigned")
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1)
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=FailingExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(lambda request: Response(200, json={"code": "000"})),
+        concurrency_limiter=limiter,
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await client.request(CheckFloatsEndpoint())
+
+    assert limiter.snapshot()["check-floats"].in_flight == 0
+    assert limiter.limit("check-floats") == 1
@@ -0,0 +1,47 @@
+import pytest
+
+from jpy_tillo_sdk import errors
+from jpy_tillo_sdk.errors import find_exception_class
+
+
+@pytest.mark.parametrize(
+    "status_code,code,expected",
+    [
+        (422, "433", errors.ValidationError),
+        (422, "100", errors.UnprocessableContent),
+        (400, "072", errors.BrandNotFound),
+        (401, "072", errors.InvalidBrandForPartner),
+        (403, "610", errors.InsufficientMonies),
+        (422, "610", errors.InsufficientMoniesOnAccount),
+        (500, "725", errors.DenominationNotInStock),
+        (405, "999", errors.MethodNotAllowed),
+        (500, "999", errors.InternalServerError),
+    ],
+)
+def test_find_exception_class_by_status_and_code(status_code: int, code: str, expected: type) -> None:
+    assert find_exception_class(status_code, code) is expected
+
+
+def test_find_exception_class_falls_back_to_unique_code() -> None:
+    assert find_exception_class(401, "434") is errors.AuthenticationFailed
+    assert find_exception_class(418, "610") is None
+
+
+def test_find_exception_class_unknown() -> None:
+    assert find_exception_class(400, "nope") is None
+    assert find_exception_class(400, None) is None
+
+
+def test_every_declared_error_is_indexed() -> None:
+    declared = [
+        cls
+        for cls in vars(errors).values()
+        if isinstance(cls, type)
+        and issubclass(cls, errors.TilloException)
+        and cls.TILLO_ERROR_CODE is not None
+        and cls.HTTP_ERROR_CODE is not None
+    ]
+
+    assert len(declared) > 40
+    for cls in declared:
+        assert (cls.HTTP_ERROR_CODE, cls.TILLO_ERROR_CODE) in errors.ERRORS_BY_STATUS_AND_CODE
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from httpx import ConnectError, MockTransport, Request, Response
+
+from jpy_tillo_sdk.contracts import EndpointInterface
+from jpy_tillo_sdk.domain.digital_card.endpoints import CheckBalanceEndpoint, CheckBalanceRequestBody
+from jpy_tillo_sdk.domain.float.endpoints import CheckFloatsEndpoint
+from jpy_tillo_sdk.hedging import HedgingPolicy
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+
+
+def _balance() -> CheckBalanceEndpoint:
+    return CheckBalanceEndpoint(body=CheckBalanceRequestBody("id", "costa"))
+
+
+def _client(handler: object, policy: HedgingPolicy) -> AsyncHttpClient:
+    return AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),  # type: ignore[arg-type]
+        hedging_policy=policy,
+    )
+
+
+def test_delay_uses_latency_percentile() -> None:
+    policy = HedgingPolicy(percentile=90, initial_delay=0.5, min_samples=10, min_delay=0, max_delay=1)
+    endpoint = _balance()
+
+    assert policy.delay(endpoint) == 0.5
+
+    for latency in range(1, 11):
+        policy.record(endpoint, latency / 100)
+
+    assert policy.delay(endpoint) == pytest.approx(0.09)
+    assert policy.delay(CheckFloatsEndpoint()) == 0.5
+
+
+def test_budget_caps_hedge_ratio() -> None:
+    policy = HedgingPolicy(max_hedge_ratio=0.1)
+    hedged = 0
+
+    for _ in range(100):
+        policy.start()
+        hedged += policy.acquire_hedge()
+
+    assert hedged == 10
+    assert policy.stats.hedge_ratio == pytest.approx(0.1)
+    assert policy.stats.budget_exhausted == 90
+
+
+def test_invalid_policy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=100)
+
+    with pytest.raises(ValueError):
+        HedgingPolicy(max_hedge_ratio=2)
+
+
+async def test_slow_request_is_hedged_and_loser_cancelled() -> None:
+    calls = 0
+    cancelled = asyncio.Event()
+
+    async def handler(request: Request) -> Response:
+        nonlocal calls
+        calls += 1
+
+        if calls == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        return Response(200, json={"code": "000", "attempt": calls})
+
+    policy = HedgingPolicy(max_hedge_ratio=1, max_burst=1, initial_delay=0.01)
+    response = await asyncio.wait_for(_client(handler, policy).request(_balance()), 0.5)
+    await asyncio.wait_for(cancelled.wait(), 0.5)
+
+    assert response.json()["attempt"] == 2
+    assert (policy.stats.hedges, policy.stats.hedge_wins) == (1, 1)
+
+
+async def test_cancelled_and_failed_attempts_are_sampled() -> None:
+    calls = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal calls
+        calls += 1
+
+        if calls == 1:
+            await asyncio.sleep(1)
+        elif calls == 3:
+            raise ConnectError("refused")
+
+        return Response(200, json={"code": "000"})
+
+    class SampledPolicy(HedgingPolicy):
+        def __init__(self) -> None:
+            super().__init__(max_hedge_ratio=1, max_burst=1, initial_delay=0.05)
+            self.samples: list[float] = []
+
+        def record(self, endpoint: EndpointInterface, latency: float) -> None:
+            self.samples.append(latency)
+            super().record(endpoint, latency)
+
+    policy = SampledPolicy()
+    client = _client(handler, policy)
+
+    await asyncio.wait_for(client.request(_balance()), 0.5)
+    await asyncio.sleep(0)
+
+    assert len(policy.samples) == 2
+    assert max(policy.samples) >= 0.05
+
+    with pytest.raises(ConnectError):
+        await client.request(_balance())
+
+    assert len(policy.samples) == 3
+
+
+async def test_fast_and_unlisted_requests_are_not_hedged() -> None:
+    requests: list[Request] = []
+
+    async def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(200, json={"code": "000"})
+
+    policy = HedgingPolicy(max_hedge_ratio=1, max_burst=1, initial_delay=0.01)
+    client = _client(handler, policy)
+
+    await client.request(_balance())
+    await client.request(CheckFloatsEndpoint())
+
+    assert len(requests) == 2
+    assert policy.stats.requests == 1
+    assert policy.stats.hedges == 0
+
+
+async def test_failed_request_waits_for_hedge() -> None:
+    calls = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal calls
+        calls += 1
+
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            raise ConnectError("refused")
+
+        await asyncio.sleep(0.1)
+        return Response(200, json={"code": "000"})
+
+    policy = HedgingPolicy(max_hedge_ratio=1, max_burst=1, initial_delay=0.01)
+    response = await asyncio.wait_for(_client(handler, policy).request(_balance()), 1)
+
+    assert response.status_code == 200
+    assert policy.stats.hedge_wins == 1
+
+
+async def test_budget_exhausted_waits_for_original_request() -> None:
+    async def handler(request: Request) -> Response:
+        await asyncio.sleep(0.03)
+        return Response(200, json={"code": "000"})
+
+    policy = HedgingPolicy(max_hedge_ratio=0, initial_delay=0.01)
+
+    assert (await _client(handler, policy).request(_balance())).status_code == 200
+    assert policy.stats.budget_exhausted == 1
@@ -0,0 +1,133 @@
+from typing import Any
+
+import pytest
+from httpx import ConnectError, MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpoint
+from jpy_tillo_sdk.errors import DenominationNotInStock
+from jpy_tillo_sdk.hooks import CompositeHooks, RequestEvent, RequestHooks, RequestTimings
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.retry import RetryPolicy
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, RequestEvent, Any]] = []
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        self.events.append(("start", event, None))
+
+    def on_response(self, event: RequestEvent) -> None:
+        self.events.append(("response", event, None))
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        self.events.append(("error", event, error))
+
+    def on_retry(self, event: RequestEvent, attempt: int, delay: float) -> None:
+        self.events.append(("retry", event, attempt))
+
+    @property
+    def names(self) -> list[str]:
+        return [name for name, _, _ in self.events]
+
+
+def _options(handler: Any, hooks: RequestHooks, **kwargs: Any) -> dict[str, Any]:
+    return {
+        "extractor": RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        "error_handler": ErrorHandler(),
+        "transport": MockTransport(handler),
+        "hooks": hooks,
+        **kwargs,
+    }
+
+
+def test_response_event_carries_endpoint_and_timings() -> None:
+    hooks = RecordingHooks()
+    client = HttpClient({"base_url": "https://api.test.com"}, **_options(lambda request: Response(200), hooks))
+
+    client.request(BrandEndpoint())
+    client.close_connection()
+
+    assert hooks.names == ["start", "response"]
+    event = hooks.events[1][1]
+    assert (event.endpoint, event.method, event.route, event.status_code) == ("brands", "GET", "/api/v2/brands", 200)
+    assert event.error_code is None
+    assert event.timings.network > 0
+    assert event.timings.signing > 0
+    assert event.timings.total >= event.timings.network
+
+
+def test_error_response_reports_tillo_error_code() -> None:
+    hooks = RecordingHooks()
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        **_options(lambda request: Response(500, json={"code": "725"}), hooks),
+    )
+
+    with pytest.raises(DenominationNotInStock):
+        client.request(BrandEndpoint())
+
+    client.close_connection()
+
+    name, event, error = hooks.events[1]
+    assert name == "error"
+    assert (event.status_code, event.error_code) == (500, "725")
+    assert isinstance(error, DenominationNotInStock)
+
+
+def test_retries_are_reported() -> None:
+    hooks = RecordingHooks()
+    responses: list[Response | Exception] = [ConnectError("refused"), Response(503), Response(200)]
+
+    def handler(request: Request) -> Response:
+        result = responses.pop(0)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    policy = RetryPolicy(base_delay=0.001, max_delay=0.001, random=lambda low, high: low)
+    client = HttpClient({"base_url": "https://api.test.com"}, **_options(handler, hooks, retry_policy=policy))
+
+    client.request(BrandEndpoint())
+    client.close_connection()
+
+    assert hooks.names == ["start", "error", "retry", "start", "response", "retry", "start", "response"]
+    retries = [(event.status_code, attempt) for name, event, attempt in hooks.events if name == "retry"]
+    assert retries == [(None, 2), (503, 3)]
+
+
+def test_failing_hooks_do_not_fail_requests_or_skip_other_hooks() -> None:
+    class FailingHooks(RequestHooks):
+        def on_response(self, event: RequestEvent) -> None:
+            raise RuntimeError("boom")
+
+    recording = RecordingHooks()
+    hooks = CompositeHooks([FailingHooks(), recording])
+    client = HttpClient({"base_url": "https://api.test.com"}, **_options(lambda request: Response(200), hooks))
+
+    assert client.request(BrandEndpoint()).status_code == 200
+    client.close_connection()
+    assert recording.names == ["start", "response"]
+
+
+async def test_async_client_reports_queueing_and_errors() -> None:
+    hooks = RecordingHooks()
+
+    def handler(request: Request) -> Response:
+        raise ConnectError("refused")
+
+    client = AsyncHttpClient({"base_url": "https://api.test.com"}, **_options(handler, hooks))
+
+    with pytest.raises(ConnectError):
+        await client.request(BrandEndpoint())
+
+    assert hooks.names == ["start", "error"]
+    event = hooks.events[1][1]
+    assert event.status_code is None
+    assert event.timings.queueing >= 0
+    assert isinstance(event.timings, RequestTimings)
+
+    await client.close_connection()
@@ -1,3 +1,4 @@
+import logging
 from typing import Any
 from unittest.mock import Mock
 
@@ -5,7 +6,15 @@ import pytest
 from httpx import URL, MockTransport, Request, Response
 
 from jpy_tillo_sdk.endpoint import Endpoint
+from jpy_tillo_sdk.errors import (
+    AuthenticationFailed,
+    DenominationNotInStock,
+    InvalidIpAddress,
+    UnprocessableContent,
+    ValidationError,
+)
 from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
 
 
 class MockEndpoint(Endpoint):
@@ -77,3 +86,69 @@ async def test_async_http_client_request():
 
     assert response.status_code == 200
     assert response.json() == {"mocked": True}
+
+
+def test_http_client_emits_single_debug_record_per_request(caplog: pytest.LogCaptureFixture) -> None:
+    def mock_handler(request: Request) -> Response:
+        return Response(200, json={"mocked": True})
+
+    extractor = RequestDataExtractor(create_signer("test_api_key", "test_secret_key"))
+    http_client = HttpClient(
+        {},
+        extractor=extractor,
+        error_handler=Mock(spec=ErrorHandler),
+        transport=MockTransport(mock_handler),
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="tillo"):
+        http_client.request(MockEndpoint())
+
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.name == "tillo.http_client"
+    assert record.tillo_endpoint == "/test"
+    assert record.tillo_status_code == 200
+
+
+def test_http_client_does_not_log_when_debug_is_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    extractor = RequestDataExtractor(create_signer("test_api_key", "test_secret_key"))
+    http_client = HttpClient(
+        {},
+        extractor=extractor,
+        error_handler=Mock(spec=ErrorHandler),
+        transport=MockTransport(lambda request: Response(200, json={})),
+    )
+
+    with caplog.at_level(logging.INFO, logger="tillo"):
+        http_client.request(MockEndpoint())
+
+    assert caplog.records == []
+
+
+@pytest.mark.parametrize(
+    "response,expected",
+    [
+        (Response(422, json={"code": "433", "status": "error", "message": "Validation Errors"}), ValidationError),
+        (Response(422, json={"code": "100", "status": "error"}), UnprocessableContent),
+        (Response(401, json={"code": "434", "status": "error"}), AuthenticationFailed),
+        (Response(500, content=b'{"code": 725, "status": "error"}'), DenominationNotInStock),
+        (Response(201, json={}), InvalidIpAddress),
+    ],
+)
+def test_error_handler_raises_specific_exception(response: Response, expected: type[Exception]) -> None:
+    with pytest.raises(expected) as e:
+        ErrorHandler().handle(response)
+
+    assert e.value.response is response
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        Response(200, content=b"not json"),
+        Response(502, content=b"<html>Bad Gateway</html>"),
+        Response(400, json={"code": "unknown"}),
+    ],
+)
+def test_error_handler_ignores_unknown_responses(response: Response) -> None:
+    ErrorHandler().handle(response)
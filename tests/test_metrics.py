@@ -0,0 +1,126 @@
+import math
+import random
+
+import pytest
+from httpx import MockTransport, Response
+
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpoint
+from jpy_tillo_sdk.hooks import RequestEvent, RequestTimings
+from jpy_tillo_sdk.http_client import ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.metrics import LatencyHistogram, LatencyMetrics, render_prometheus
+
+
+def test_bucket_bounds_grow_geometrically() -> None:
+    histogram = LatencyHistogram(min_value=0.001, max_value=1.0, buckets_per_doubling=1)
+
+    assert histogram.bounds[:3] == pytest.approx((0.001, 0.002, 0.004))
+    assert histogram.bounds[-1] >= 1.0
+    assert len(histogram.counts) == len(histogram.bounds) + 1
+
+
+def test_values_land_in_the_bucket_of_their_upper_bound() -> None:
+    histogram = LatencyHistogram(min_value=0.001, max_value=1.0, buckets_per_doubling=1)
+
+    for value in (0.0005, 0.001, 0.0015, 0.002, 5.0):
+        histogram.record(value)
+
+    assert histogram.counts[:3] == [2, 2, 0]
+    assert histogram.counts[-1] == 1
+    assert histogram.count == 5
+    assert histogram.sum == pytest.approx(5.005)
+
+
+def test_quantiles_are_within_the_bucket_error() -> None:
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(math.log(0.05), 0.8) for _ in range(10_000))
+    histogram = LatencyHistogram()
+
+    for value in values:
+        histogram.record(value)
+
+    for q in (0.5, 0.9, 0.99):
+        exact = values[math.ceil(q * len(values)) - 1]
+        assert exact <= histogram.quantile(q) <= exact * 2 ** (1 / 4) * 1.001
+
+
+def test_quantile_of_overflow_is_the_maximum() -> None:
+    histogram = LatencyHistogram(max_value=1.0)
+    histogram.record(3.0)
+
+    assert histogram.quantile(0.99) == 3.0
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_invalid_bounds_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        LatencyHistogram(min_value=1.0, max_value=0.5)
+
+    with pytest.raises(ValueError):
+        LatencyMetrics(buckets_per_doubling=0)
+
+
+def test_metrics_group_by_endpoint_and_status_class() -> None:
+    metrics = LatencyMetrics()
+    timings = RequestTimings(queueing=0.001, network=0.02)
+
+    metrics.on_response(RequestEvent("brands", "GET", "/api/v2/brands", 200, timings=timings))
+    metrics.on_response(RequestEvent("brands", "GET", "/api/v2/brands", 204, timings=timings))
+    metrics.on_error(RequestEvent("brands", "GET", "/api/v2/brands", timings=timings), RuntimeError())
+    metrics.record("digital-issue", 503, 1.5)
+
+    assert [(endpoint, status) for endpoint, status, _ in metrics.series()] == [
+        ("brands", "2xx"),
+        ("brands", "error"),
+        ("digital-issue", "5xx"),
+    ]
+    assert metrics.histogram("brands", "2xx").count == 2  # type: ignore[union-attr]
+    assert metrics.histogram("brands").count == 3  # type: ignore[union-attr]
+    assert 0.021 <= metrics.quantile("brands", 0.5) <= 0.021 * 1.2
+    assert metrics.quantile("unknown", 0.5) == 0.0
+
+
+def test_metrics_record_requests_as_client_hooks() -> None:
+    metrics = LatencyMetrics()
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(lambda request: Response(200)),
+        hooks=metrics,
+    )
+
+    client.request(BrandEndpoint())
+    client.close_connection()
+
+    assert metrics.histogram("brands", "2xx").count == 1  # type: ignore[union-attr]
+
+
+def test_render_prometheus_histogram() -> None:
+    metrics = LatencyMetrics(min_value=0.001, max_value=0.004, buckets_per_doubling=1)
+    metrics.record("digital-issue", 201, 0.0015)
+    metrics.record("digital-issue", 200, 0.01)
+
+    body = render_prometheus(metrics)
+
+    assert body.splitlines() == [
+        "# HELP tillo_request_duration_seconds Latency of Tillo API requests in seconds.",
+        "# TYPE tillo_request_duration_seconds histogram",
+        'tillo_request_duration_seconds_bucket{endpoint="digital-issue",status_class="2xx",le="0.001"} 0',
+        'tillo_request_duration_seconds_bucket{endpoint="digital-issue",status_class="2xx",le="0.002"} 1',
+        'tillo_request_duration_seconds_bucket{endpoint="digital-issue",status_class="2xx",le="0.004"} 1',
+        'tillo_request_duration_seconds_bucket{endpoint="digital-issue",status_class="2xx",le="+Inf"} 2',
+        'tillo_request_duration_seconds_sum{endpoint="digital-issue",status_class="2xx"} 0.0115',
+        'tillo_request_duration_seconds_count{endpoint="digital-issue",status_class="2xx"} 2',
+    ]
+    assert body.endswith("\n")
+
+
+def test_render_prometheus_summary_escapes_labels() -> None:
+    metrics = LatencyMetrics()
+    metrics.record('odd"name', 200, 0.05)
+
+    body = render_prometheus(metrics, name="latency", quantiles=(0.5, 0.99))
+
+    assert "# TYPE latency summary" in body
+    assert 'latency{endpoint="odd\\"name",status_class="2xx",quantile="0.99"} 0.05' in body
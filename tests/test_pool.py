@@ -0,0 +1,88 @@
+from unittest.mock import Mock
+
+from httpx import MockTransport, Request, Response
+
+from jpy_tillo_sdk.http_client import ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_client, create_client_async
+from jpy_tillo_sdk.pool import PoolConfig, PoolStats, collect_pool_stats
+
+
+def test_pool_config_defaults_enable_http2() -> None:
+    options = PoolConfig().to_client_options()
+
+    assert options["http2"] is True
+    assert options["limits"].max_connections == 100
+    assert options["limits"].max_keepalive_connections == 20
+    assert options["limits"].keepalive_expiry == 30.0
+
+
+def test_pool_config_per_host_limit_caps_pool() -> None:
+    limits = PoolConfig(max_connections=100, max_keepalive_connections=50, max_connections_per_host=10).to_limits()
+
+    assert limits.max_connections == 10
+    assert limits.max_keepalive_connections == 10
+
+
+def test_pool_config_unlimited_connections_uses_per_host_limit() -> None:
+    config = PoolConfig(max_connections=None, max_connections_per_host=5)
+
+    assert config.effective_max_connections == 5
+
+
+def test_client_options_take_precedence_over_pool_config() -> None:
+    client = HttpClient(
+        {"http2": False},
+        extractor=Mock(spec=RequestDataExtractor),
+        error_handler=Mock(spec=ErrorHandler),
+        pool_config=PoolConfig(),
+    )
+
+    options = client._client_options()
+
+    assert options["http2"] is False
+    assert "limits" in options
+
+
+def test_factories_apply_default_pool_config() -> None:
+    assert create_client("key", "secret", None).pool_config == PoolConfig()
+    assert create_client_async("key", "secret", None, pool_config=PoolConfig(max_connections=5)).pool_config == (
+        PoolConfig(max_connections=5)
+    )
+
+
+def test_pool_stats_without_client_are_empty() -> None:
+    assert collect_pool_stats(None) == PoolStats()
+
+
+def test_pool_stats_with_mock_transport_are_empty() -> None:
+    def mock_handler(request: Request) -> Response:
+        return Response(200, json={})
+
+    extractor = Mock(spec=RequestDataExtractor)
+    extractor.extract_all.return_value = ({}, None, None)
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=extractor,
+        error_handler=Mock(spec=ErrorHandler),
+        transport=MockTransport(mock_handler),
+    )
+
+    assert client.pool_stats() == PoolStats()
+
+
+def test_pool_stats_counts_connections() -> None:
+    idle_connection = Mock()
+    idle_connection.is_idle.return_value = True
+    busy_connection = Mock()
+    busy_connection.is_idle.return_value = False
+    queued_request = Mock()
+    queued_request.is_queued.return_value = True
+
+    client = Mock()
+    client._transport._pool.connections = [idle_connection, busy_connection, busy_connection]
+    client._transport._pool._requests = [queued_request]
+
+    stats = collect_pool_stats(client)
+
+    assert stats == PoolStats(in_use=2, idle=1, waiting=1)
+    assert stats.total == 3
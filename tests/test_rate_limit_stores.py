@@ -0,0 +1,124 @@
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint
+from jpy_tillo_sdk.rate_limit_stores import LocalBucketStore, MmapBucketStore, take_token
+from jpy_tillo_sdk.rate_limiter import RateLimiter, TokenBucket
+from jpy_tillo_sdk.rate_limits import RateLimit
+
+pytest.importorskip("fcntl")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_take_token_refills_up_to_burst() -> None:
+    assert take_token(-5.0, 0.0, 100.0, 1.0, 2) == (1.0, 0.0)
+    assert take_token(0.0, 0.0, 0.0, 10.0, 1) == (-1.0, pytest.approx(0.1))
+
+
+def test_local_store_keeps_buckets_apart() -> None:
+    store = LocalBucketStore(clock=FakeClock())
+
+    assert store.reserve("a", 10.0, 1) == 0.0
+    assert store.reserve("b", 10.0, 1) == 0.0
+    assert store.reserve("a", 10.0, 1) == pytest.approx(0.1)
+
+
+def test_mmap_store_is_shared_between_instances(tmp_path: Path) -> None:
+    clock = FakeClock()
+    first = MmapBucketStore(tmp_path / "limits.bin", clock=clock)
+    second = MmapBucketStore(tmp_path / "limits.bin", clock=clock)
+
+    try:
+        assert first.reserve("POST digital-issue", 10.0, 1) == 0.0
+        assert second.reserve("POST digital-issue", 10.0, 1) == pytest.approx(0.1)
+        assert first.reserve("POST digital-issue", 10.0, 1) == pytest.approx(0.2)
+
+        clock.now += 1.0
+
+        assert second.reserve("POST digital-issue", 10.0, 1) == 0.0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_mmap_store_rejects_mismatched_layout(tmp_path: Path) -> None:
+    MmapBucketStore(tmp_path / "limits.bin", slots=8).close()
+
+    with pytest.raises(ValueError):
+        MmapBucketStore(tmp_path / "limits.bin", slots=16)
+
+
+def test_mmap_store_runs_out_of_slots(tmp_path: Path) -> None:
+    store = MmapBucketStore(tmp_path / "limits.bin", slots=2)
+
+    try:
+        store.reserve("a", 1.0, 1)
+        store.reserve("b", 1.0, 1)
+
+        with pytest.raises(RuntimeError):
+            store.reserve("c", 1.0, 1)
+    finally:
+        store.close()
+
+
+def test_mmap_store_rejects_long_keys(tmp_path: Path) -> None:
+    store = MmapBucketStore(tmp_path / "limits.bin")
+
+    try:
+        with pytest.raises(ValueError):
+            store.reserve("x" * 49, 1.0, 1)
+    finally:
+        store.close()
+
+
+def test_token_bucket_uses_store(tmp_path: Path) -> None:
+    store = MmapBucketStore(tmp_path / "limits.bin", clock=FakeClock())
+
+    try:
+        first = TokenBucket("shared", RateLimit(10, period=1.0), store=store)
+        second = TokenBucket("shared", RateLimit(10, period=1.0), store=store)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == pytest.approx(0.1)
+        assert first.stats.acquired == 1
+        assert second.stats.delayed == 1
+    finally:
+        store.close()
+
+
+def _reserve_in_process(path: str, count: int, queue: "multiprocessing.Queue[list[float]]") -> None:
+    store = MmapBucketStore(path)
+    limiter = RateLimiter(limits={IssueDigitalCodeEndpoint: RateLimit(100, period=1.0)}, store=store)
+    bucket = limiter.bucket_for(IssueDigitalCodeEndpoint)
+    assert bucket is not None
+    queue.put([bucket.reserve() for _ in range(count)])
+    store.close()
+
+
+def test_mmap_store_shares_budget_between_processes(tmp_path: Path) -> None:
+    path = str(tmp_path / "limits.bin")
+    MmapBucketStore(path).close()
+
+    queue: "multiprocessing.Queue[list[float]]" = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_reserve_in_process, args=(path, 10, queue)) for _ in range(4)]
+
+    for process in processes:
+        process.start()
+
+    delays = sorted(delay for _ in processes for delay in queue.get(timeout=30))
+
+    for process in processes:
+        process.join(timeout=30)
+
+    # 40 permits at 100/s with no burst cannot be granted in less than ~0.39s
+    assert len(delays) == 40
+    assert delays[-1] > 0.2
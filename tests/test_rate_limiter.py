@@ -0,0 +1,141 @@
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from httpx import MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpoint
+from jpy_tillo_sdk.domain.digital_card.endpoints import (
+    CancelDigitalUrlEndpoint,
+    CheckDigitalOrderStatusAsyncEndpoint,
+    IssueDigitalCodeEndpoint,
+)
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.rate_limiter import RateLimiter, TokenBucket
+from jpy_tillo_sdk.rate_limits import DigitalIssue, RateLimit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limit_rate_uses_period() -> None:
+    assert RateLimit(600).rate == 10.0
+    assert RateLimit(50, period=1.0).rate == 50.0
+
+
+def test_token_bucket_paces_requests() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket("test", RateLimit(10, period=1.0), clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    clock.now = 1.0
+
+    assert bucket.reserve() == 0.0
+
+
+def test_token_bucket_keeps_permit_beyond_max_delay() -> None:
+    bucket = TokenBucket("test", RateLimit(10, period=1.0), clock=FakeClock())
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve(max_delay=0.05) == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.stats.acquired == 2
+
+
+def test_token_bucket_burst() -> None:
+    bucket = TokenBucket("test", RateLimit(10, period=1.0), burst=3, clock=FakeClock())
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1)
+
+
+def test_token_bucket_stats() -> None:
+    bucket = TokenBucket("test", RateLimit(10, period=1.0), clock=FakeClock())
+
+    for _ in range(3):
+        bucket.reserve()
+
+    stats = bucket.stats
+    assert stats.acquired == 3
+    assert stats.delayed == 2
+    assert stats.total_wait == pytest.approx(0.3)
+    assert stats.max_wait == pytest.approx(0.2)
+    assert stats.average_wait == pytest.approx(0.1)
+
+
+def test_token_bucket_rejects_invalid_burst() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket("test", RateLimit(10), burst=0)
+
+
+def test_rate_limiter_default_mapping() -> None:
+    limiter = RateLimiter()
+
+    issue_bucket = limiter.bucket_for(IssueDigitalCodeEndpoint())
+    assert issue_bucket is not None
+    assert issue_bucket.rate_limit.limit == DigitalIssue.post().limit
+    assert limiter.bucket_for(CancelDigitalUrlEndpoint()) is not None
+    assert limiter.bucket_for(CheckDigitalOrderStatusAsyncEndpoint) is not None
+    assert limiter.bucket_for(BrandEndpoint()) is None
+    assert set(limiter.stats()) == {
+        "POST digital-issue",
+        "DELETE digital-issue",
+        "POST digital-check-balance",
+        "GET digital-order-status",
+    }
+
+
+def test_rate_limiter_custom_limits() -> None:
+    limiter = RateLimiter(limits={BrandEndpoint: RateLimit(5)})
+
+    assert limiter.bucket_for(BrandEndpoint()) is not None
+    assert limiter.bucket_for(IssueDigitalCodeEndpoint()) is None
+
+
+def _client_kwargs(rate_limiter: RateLimiter, handler: Any) -> dict[str, Any]:
+    extractor = Mock(spec=RequestDataExtractor)
+    extractor.extract_all.return_value = ({}, None, None)
+
+    return {
+        "tillo_client_options": {"base_url": "https://api.test.com"},
+        "extractor": extractor,
+        "error_handler": Mock(spec=ErrorHandler),
+        "transport": MockTransport(handler),
+        "rate_limiter": rate_limiter,
+    }
+
+
+def test_http_client_acquires_permit() -> None:
+    limiter = RateLimiter(limits={BrandEndpoint: RateLimit(1000, period=1.0)})
+    client = HttpClient(**_client_kwargs(limiter, lambda request: Response(200, json={})))
+
+    client.request(BrandEndpoint())
+    client.request(BrandEndpoint())
+
+    assert limiter.stats()["GET brands"].acquired == 2
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_acquires_permit() -> None:
+    async def handler(request: Request) -> Response:
+        return Response(200, json={})
+
+    limiter = RateLimiter(limits={BrandEndpoint: RateLimit(100, period=1.0)})
+    client = AsyncHttpClient(**_client_kwargs(limiter, handler))
+
+    await client.request(BrandEndpoint())
+    await client.request(BrandEndpoint())
+
+    stats = limiter.stats()["GET brands"]
+    assert stats.acquired == 2
+    assert stats.delayed == 1
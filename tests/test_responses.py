@@ -0,0 +1,58 @@
+import pytest
+from httpx import Response
+
+from jpy_tillo_sdk.responses import ResponseField, ResponseModel
+
+
+class OrderResponse(ResponseModel):
+    __slots__ = ()
+
+    reference = ResponseField[str]("data", "reference")
+    amount = ResponseField[float]("data", "face_value", "amount", convert=float)
+
+
+def _response() -> Response:
+    return Response(
+        200,
+        json={"code": "000", "status": "success", "message": "ok", "data": {"reference": "ref", "face_value": {}}},
+    )
+
+
+def test_body_is_decoded_on_first_access() -> None:
+    model = OrderResponse.from_response(_response())
+
+    assert model._payload is None
+    assert model.reference == "ref"
+    assert model._payload is not None
+    assert model.payload is model.payload
+
+
+def test_common_fields() -> None:
+    model = OrderResponse.from_response(_response())
+
+    assert model.code == "000"
+    assert model.status == "success"
+    assert model.message == "ok"
+    assert model.status_code == 200
+
+
+def test_missing_values_are_none() -> None:
+    model = OrderResponse.from_response(_response())
+
+    assert model.amount is None
+    assert OrderResponse(b"").reference is None
+    assert OrderResponse(b"[]").data is None
+
+
+def test_values_are_converted() -> None:
+    model = OrderResponse(b'{"data": {"face_value": {"amount": "10.50"}}}')
+
+    assert model.amount == 10.5
+
+
+def test_models_are_slotted() -> None:
+    model = OrderResponse.from_response(_response())
+
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.extra = 1  # type: ignore[attr-defined]
@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+from httpx import ConnectError, MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpoint
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.float.endpoints import (
+    RequestPaymentTransferEndpoint,
+    RequestPaymentTransferEndpointRequestBody,
+)
+from jpy_tillo_sdk.enums import Currency
+from jpy_tillo_sdk.errors import DenominationNotInStock, InternalServerError
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.retry import RetryPolicy
+
+
+def _policy(**kwargs: object) -> RetryPolicy:
+    return RetryPolicy(**{"base_delay": 0.002, "max_delay": 0.01, "random": lambda low, high: low, **kwargs})
+
+
+def _client(handler: object, policy: RetryPolicy | None) -> HttpClient:
+    return HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),  # type: ignore[arg-type]
+        retry_policy=policy,
+    )
+
+
+def _payment_transfer() -> RequestPaymentTransferEndpoint:
+    return RequestPaymentTransferEndpoint(
+        body=RequestPaymentTransferEndpointRequestBody(
+            currency=Currency.GBP, amount="100.00", payment_reference="ref", finance_email="finance@example.com"
+        )
+    )
+
+
+def _failing(*responses: Response | Exception) -> tuple[list[Request], object]:
+    requests: list[Request] = []
+    remaining = list(responses)
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        result = remaining.pop(0) if remaining else Response(200, json={"code": "000"})
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    return requests, handler
+
+
+def test_decorrelated_jitter_is_bounded() -> None:
+    policy = RetryPolicy(base_delay=0.1, max_delay=1.0, random=lambda low, high: high)
+
+    assert policy.next_delay(0.1) == pytest.approx(0.3)
+    assert policy.next_delay(0.3) == pytest.approx(0.9)
+    assert policy.next_delay(0.9) == 1.0
+
+
+def test_invalid_policy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(base_delay=2.0, max_delay=1.0)
+
+
+def test_only_idempotent_endpoints_are_retryable() -> None:
+    assert RetryPolicy.is_idempotent(BrandEndpoint())
+    assert RetryPolicy.is_idempotent(IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody("id", "costa")))
+    assert not RetryPolicy.is_idempotent(_payment_transfer())
+
+
+def test_transport_errors_and_429_are_retried_with_fresh_signatures() -> None:
+    requests, handler = _failing(ConnectError("refused"), Response(429, headers={"Retry-After": "0"}))
+
+    response = _client(handler, _policy()).request(BrandEndpoint())
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert len({request.headers["Timestamp"] for request in requests}) == 3
+    assert len({request.headers["Signature"] for request in requests}) == 3
+
+
+def test_server_errors_are_retried_until_attempts_run_out() -> None:
+    requests, handler = _failing(*[Response(500, json={"code": "999", "message": "error"})] * 3)
+
+    with pytest.raises(InternalServerError):
+        _client(handler, _policy()).request(BrandEndpoint())
+
+    assert len(requests) == 3
+
+
+def test_out_of_stock_is_not_retried() -> None:
+    requests, handler = _failing(Response(500, json={"code": "725", "message": "Not in stock"}))
+    endpoint = IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody("id", "costa"))
+
+    with pytest.raises(DenominationNotInStock):
+        _client(handler, _policy()).request(endpoint)
+
+    assert len(requests) == 1
+
+
+def test_requests_without_client_request_id_are_not_retried() -> None:
+    requests, handler = _failing(ConnectError("refused"))
+
+    with pytest.raises(ConnectError):
+        _client(handler, _policy()).request(_payment_transfer())
+
+    assert len(requests) == 1
+
+
+def test_no_retries_without_policy() -> None:
+    requests, handler = _failing(Response(503))
+
+    assert _client(handler, None).request(BrandEndpoint()).status_code == 503
+    assert len(requests) == 1
+
+
+async def test_async_duplicate_request_incomplete_is_polled_again() -> None:
+    requests: list[Request] = []
+
+    async def handler(request: Request) -> Response:
+        requests.append(request)
+
+        if len(requests) < 3:
+            return Response(400, json={"code": "729", "message": "Duplicate request incomplete"})
+
+        return Response(200, json={"code": "000", "data": {"url": "https://example.com"}})
+
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=RequestDataExtractor(create_signer("test_api_key", "test_secret_key")),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        retry_policy=_policy(max_attempts=5),
+    )
+    endpoint = IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody("id", "costa"))
+
+    response = await asyncio.wait_for(client.request(endpoint), 1)
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert {request.content for request in requests} == {requests[0].content}
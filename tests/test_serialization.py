@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+
+import pytest
+
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.digital_card.shared import FaceValue
+from jpy_tillo_sdk.domain.float.endpoints import (
+    CheckFloatsEndpointRequestQuery,
+    RequestPaymentTransferEndpointRequestBody,
+)
+from jpy_tillo_sdk.domain.physical_card.endpoints import CancelActivateRequestBody
+from jpy_tillo_sdk.enums import Currency
+from jpy_tillo_sdk.http_client import RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.serialization import SerializerRegistry
+
+
+@pytest.fixture
+def registry() -> SerializerRegistry:
+    return SerializerRegistry()
+
+
+def test_serialize_drops_none_fields(registry: SerializerRegistry) -> None:
+    body = IssueDigitalCodeRequestBody(client_request_id="id", brand="costa")
+
+    assert registry.serialize(body) == {"client_request_id": "id", "brand": "costa"}
+
+
+def test_serialize_nested_dataclasses(registry: SerializerRegistry) -> None:
+    body = IssueDigitalCodeRequestBody(
+        client_request_id="id",
+        brand="costa",
+        face_value=FaceValue(amount="10.00", currency="GBP"),
+        personalisation=IssueDigitalCodeRequestBody.PersonalisationExtended(to_name="Jo", email_message="Hi"),
+    )
+
+    assert registry.serialize(body) == {
+        "client_request_id": "id",
+        "brand": "costa",
+        "face_value": {"amount": "10.00", "currency": "GBP"},
+        "personalisation": {"to_name": "Jo", "template": "standard", "email_message": "Hi"},
+    }
+
+
+def test_serialize_enums_to_values(registry: SerializerRegistry) -> None:
+    body = RequestPaymentTransferEndpointRequestBody(
+        currency=Currency.GBP,
+        amount="100.00",
+        payment_reference="ref",
+        finance_email="finance@example.com",
+    )
+
+    assert registry.serialize(body) == {
+        "currency": "GBP",
+        "amount": "100.00",
+        "payment_reference": "ref",
+        "finance_email": "finance@example.com",
+        "float": "universal-float",
+    }
+    assert registry.serialize(CheckFloatsEndpointRequestQuery(currency=Currency.GBP)) == {"currency": "GBP"}
+
+
+def test_serialize_enums_in_str_fields(registry: SerializerRegistry) -> None:
+    payload = registry.serialize(FaceValue(currency=Currency.GBP, amount="10"))
+
+    assert payload == {"currency": "GBP", "amount": "10"}
+    assert type(payload["currency"]) is str
+
+
+def test_serialize_lists(registry: SerializerRegistry) -> None:
+    body = CancelActivateRequestBody(
+        client_request_id="id",
+        original_client_request_id="original",
+        brand="costa",
+        tags=["a", "b"],
+    )
+
+    assert registry.serialize(body)["tags"] == ["a", "b"]
+    assert registry.serialize(body)["sector"] == "gift-card-mall"
+
+
+def test_encoders_are_cached_per_class(registry: SerializerRegistry) -> None:
+    assert registry.encoder_for(FaceValue) is registry.encoder_for(FaceValue)
+    assert registry.encoder_for(FaceValue) is not registry.encoder_for(IssueDigitalCodeRequestBody)
+
+
+def test_serialize_rejects_non_dataclasses(registry: SerializerRegistry) -> None:
+    with pytest.raises(TypeError):
+        registry.serialize(object())
+
+
+def test_serialize_unannotated_values_go_through_generic_encoder(registry: SerializerRegistry) -> None:
+    @dataclass(frozen=True)
+    class Payload:
+        items: list[FaceValue]
+        meta: dict[str, Currency | None]
+
+    payload = Payload(items=[FaceValue(amount="1.00"), None], meta={"currency": Currency.GBP, "other": None})
+
+    assert registry.serialize(payload) == {"items": [{"amount": "1.00"}], "meta": {"currency": "GBP"}}
+
+
+def test_extractor_uses_registry() -> None:
+    registry = SerializerRegistry()
+    extractor = RequestDataExtractor(create_signer("api-key", "secret-key"), serializers=registry)
+    endpoint = IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody(client_request_id="id", brand="costa"))
+
+    params, json = extractor.extract_request_params(endpoint)
+
+    assert params is None
+    assert json == {"client_request_id": "id", "brand": "costa"}
+    assert IssueDigitalCodeRequestBody in registry._encoders
@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+
 import pytest
 
 
@@ -56,6 +59,13 @@ class TestSignatureGenerator:
         assert isinstance(signature, str)
         assert len(signature) == 64  # SHA256 hex digest length
 
+    def test_generate_signature_matches_hmac_sha256(self, signature_generator, secret_key):
+        expected = hmac.new(secret_key.encode("utf-8"), b"test-seed", hashlib.sha256).hexdigest()
+
+        assert signature_generator.generate_signature("test-seed") == expected
+        assert signature_generator.generate_signature("test-seed") == expected
+        assert signature_generator.generate_signature("other-seed") != expected
+
 
 class TestSignatureBridge:
     def test_sign(self, signature_bridge):
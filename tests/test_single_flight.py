@@ -0,0 +1,193 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from httpx import MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpoint, BrandEndpointRequestQuery
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.errors import DeadlineExceeded
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.single_flight import AsyncSingleFlight, SingleFlight, request_key
+from jpy_tillo_sdk.timeouts import Deadline
+
+
+def test_request_key_only_for_get_requests() -> None:
+    first = request_key(BrandEndpoint(query=BrandEndpointRequestQuery(brand="costa")))
+    second = request_key(BrandEndpoint(query=BrandEndpointRequestQuery(brand="costa")))
+
+    assert first is not None and first == second
+    assert request_key(BrandEndpoint(query=BrandEndpointRequestQuery(brand="amazon-de"))) != first
+    assert request_key(IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody("id", "costa"))) is None
+
+
+def test_sync_calls_are_shared_between_threads() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def fn() -> object:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(1)
+        return object()
+
+    with ThreadPoolExecutor(8) as pool:
+        leader = pool.submit(flight.do, "key", fn)
+        started.wait(1)
+        followers = [pool.submit(flight.do, "key", fn) for _ in range(7)]
+
+        deadline = time.monotonic() + 1
+
+        while flight.coalesced < 7 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        release.set()
+        results = {id(future.result()) for future in [leader, *followers]}
+
+    assert calls == 1
+    assert len(results) == 1
+
+
+def test_sync_errors_are_shared() -> None:
+    flight = SingleFlight()
+
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+    assert flight.do("key", lambda: 1) == 1
+
+
+async def test_async_calls_are_shared() -> None:
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def fn() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("key", fn) for _ in range(50)))
+
+    assert calls == 1
+    assert flight.coalesced == 49
+    assert all(result is results[0] for result in results)
+    assert flight._tasks == {}
+
+
+async def test_async_cancelled_caller_does_not_cancel_the_call() -> None:
+    flight = AsyncSingleFlight()
+
+    async def fn() -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", fn))
+    second = asyncio.ensure_future(flight.do("key", fn))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+
+
+def test_sync_waiter_is_bounded_by_its_deadline() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn() -> str:
+        started.set()
+        release.wait(1)
+        return "done"
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "key", fn)
+        started.wait(1)
+        waited_at = time.monotonic()
+
+        with pytest.raises(DeadlineExceeded):
+            flight.do("key", fn, Deadline.after(0.02), "brands")
+
+        assert time.monotonic() - waited_at < 0.5
+        release.set()
+
+        assert leader.result(1) == "done"
+
+
+def _extractor() -> RequestDataExtractor:
+    return RequestDataExtractor(create_signer("test_api_key", "test_secret_key"))
+
+
+async def test_async_client_coalesces_identical_get_requests() -> None:
+    requests: list[Request] = []
+
+    async def handler(request: Request) -> Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return Response(200, json={"data": {"brands": []}})
+
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        coalesce_requests=True,
+    )
+    query = BrandEndpointRequestQuery(detail=True)
+
+    responses = await asyncio.gather(*(client.request(BrandEndpoint(query=query)) for _ in range(20)))
+
+    assert len(requests) == 1
+    assert all(response is responses[0] for response in responses)
+
+
+async def test_async_joiner_is_bounded_by_its_own_deadline() -> None:
+    requests: list[Request] = []
+
+    async def handler(request: Request) -> Response:
+        requests.append(request)
+        await asyncio.sleep(0.2)
+        return Response(200, json={"data": {"brands": []}})
+
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        coalesce_requests=True,
+    )
+    leader = asyncio.ensure_future(client.request(BrandEndpoint()))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(DeadlineExceeded) as info:
+        await asyncio.wait_for(client.request(BrandEndpoint(), deadline=Deadline.after(0.02)), 0.1)
+
+    assert info.value.endpoint == "brands"
+    assert (await leader).status_code == 200
+    assert len(requests) == 1
+
+
+def test_sync_client_does_not_coalesce_by_default() -> None:
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(200, json={})
+
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+    )
+
+    client.request(BrandEndpoint())
+    client.request(BrandEndpoint())
+
+    assert len(requests) == 2
@@ -0,0 +1,199 @@
+import asyncio
+import time
+
+import pytest
+from httpx import MockTransport, Request, Response
+
+from jpy_tillo_sdk.domain.brand.endpoints import BrandEndpoint
+from jpy_tillo_sdk.domain.digital_card.endpoints import IssueDigitalCodeEndpoint, IssueDigitalCodeRequestBody
+from jpy_tillo_sdk.domain.float.endpoints import CheckFloatsEndpoint
+from jpy_tillo_sdk.domain.float.services import FloatServiceAsync
+from jpy_tillo_sdk.errors import DeadlineExceeded
+from jpy_tillo_sdk.http_client import AsyncHttpClient, ErrorHandler, HttpClient, RequestDataExtractor
+from jpy_tillo_sdk.http_client_factory import create_signer
+from jpy_tillo_sdk.rate_limiter import RateLimiter
+from jpy_tillo_sdk.rate_limits import RateLimit
+from jpy_tillo_sdk.retry import RetryPolicy
+from jpy_tillo_sdk.timeouts import FAST, SLOW, Deadline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _extractor() -> RequestDataExtractor:
+    return RequestDataExtractor(create_signer("test_api_key", "test_secret_key"))
+
+
+def test_endpoints_carry_timeout_profiles() -> None:
+    assert CheckFloatsEndpoint().timeout is FAST
+    assert IssueDigitalCodeEndpoint(body=IssueDigitalCodeRequestBody("id", "costa")).timeout is SLOW
+
+
+def test_profile_is_capped_by_remaining_time() -> None:
+    timeout = SLOW.to_timeout(remaining=3.0)
+
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (3.0, 3.0, 3.0, 3.0)
+    assert FAST.to_timeout().read == FAST.read
+
+
+def test_deadline() -> None:
+    clock = FakeClock()
+    deadline = Deadline.after(2.0, clock=clock)
+
+    assert deadline.check("check-floats") == 2.0
+    assert deadline.allows(1.5)
+    assert not deadline.allows(2.5)
+
+    clock.now = 2.0
+
+    assert deadline.expired
+    assert deadline.remaining() == 0.0
+
+    with pytest.raises(DeadlineExceeded) as info:
+        deadline.check("check-floats")
+
+    assert str(info.value) == "Deadline exceeded for check-floats"
+
+
+def test_sync_client_sends_endpoint_timeouts() -> None:
+    timeouts: list[dict[str, float]] = []
+
+    def handler(request: Request) -> Response:
+        timeouts.append(request.extensions["timeout"])
+        return Response(200, json={"code": "000"})
+
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+    )
+
+    client.request(CheckFloatsEndpoint())
+    client.request(CheckFloatsEndpoint(), deadline=Deadline.after(1.0))
+
+    assert timeouts[0]["read"] == FAST.read
+    assert timeouts[1]["read"] <= 1.0
+
+
+def test_client_timeout_wins_over_profiles() -> None:
+    timeouts: list[dict[str, float]] = []
+
+    def handler(request: Request) -> Response:
+        timeouts.append(request.extensions["timeout"])
+        return Response(200, json={"code": "000"})
+
+    client = HttpClient(
+        {"base_url": "https://api.test.com", "timeout": 120},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+    )
+
+    client.request(CheckFloatsEndpoint())
+    client.request(CheckFloatsEndpoint(), deadline=Deadline.after(1.0))
+
+    assert timeouts[0] == {"connect": 120, "read": 120, "write": 120, "pool": 120}
+    assert 0 < timeouts[1]["read"] <= 1.0
+
+
+def test_expired_deadline_does_not_send() -> None:
+    requests: list[Request] = []
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(lambda request: requests.append(request) or Response(200)),
+    )
+
+    with pytest.raises(DeadlineExceeded):
+        client.request(BrandEndpoint(), deadline=Deadline.after(0))
+
+    assert requests == []
+
+
+def test_deadline_bounds_rate_limit_wait() -> None:
+    requests: list[Request] = []
+    limiter = RateLimiter(limits={CheckFloatsEndpoint: RateLimit(1, period=2.0)})
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(lambda request: requests.append(request) or Response(200, json={"code": "000"})),
+        rate_limiter=limiter,
+    )
+
+    client.request(CheckFloatsEndpoint())
+    started_at = time.perf_counter()
+
+    with pytest.raises(DeadlineExceeded):
+        client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0.2))
+
+    assert time.perf_counter() - started_at < 0.1
+    assert len(requests) == 1
+    assert limiter.stats()["GET check-floats"].acquired == 1
+
+
+async def test_async_deadline_bounds_rate_limit_wait() -> None:
+    async def handler(request: Request) -> Response:
+        return Response(200, json={"code": "000"})
+
+    limiter = RateLimiter(limits={CheckFloatsEndpoint: RateLimit(1, period=2.0)})
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        rate_limiter=limiter,
+    )
+
+    await client.request(CheckFloatsEndpoint())
+
+    with pytest.raises(DeadlineExceeded):
+        await asyncio.wait_for(client.request(CheckFloatsEndpoint(), deadline=Deadline.after(0.2)), 0.1)
+
+    assert limiter.stats()["GET check-floats"].acquired == 1
+    assert limiter.bucket_for(CheckFloatsEndpoint).reserve() > 1.5  # type: ignore[union-attr]
+
+
+def test_retries_stop_at_deadline() -> None:
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(503)
+
+    client = HttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=10, base_delay=0.05, max_delay=0.05),
+    )
+
+    response = client.request(BrandEndpoint(), deadline=Deadline.after(0.12))
+
+    assert response.status_code == 503
+    assert 1 < len(requests) < 10
+
+
+async def test_async_call_never_outlives_its_deadline() -> None:
+    async def handler(request: Request) -> Response:
+        await asyncio.sleep(1)
+        return Response(200, json={"code": "000"})
+
+    client = AsyncHttpClient(
+        {"base_url": "https://api.test.com"},
+        extractor=_extractor(),
+        error_handler=ErrorHandler(),
+        transport=MockTransport(handler),
+    )
+    service = FloatServiceAsync(client=client)
+
+    with pytest.raises(DeadlineExceeded):
+        await asyncio.wait_for(service.check_floats(deadline=Deadline.after(0.02)), 0.5)